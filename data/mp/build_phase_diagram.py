@@ -17,6 +17,7 @@ from pymatgen.ext.matproj import MPRester
 from pymatviz.enums import Key
 from tqdm import tqdm
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery import MP_DIR, ROOT, today
 from matbench_discovery.energy import get_e_form_per_atom, get_elemental_ref_entries
 from matbench_discovery.enums import DataFiles
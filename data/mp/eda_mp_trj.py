@@ -15,6 +15,7 @@ from pymatgen.core.tensors import Tensor
 from pymatviz.enums import ElemCountMode, Key
 from tqdm import tqdm
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery import MP_DIR, PDF_FIGS, ROOT, SITE_FIGS
 from matbench_discovery.data import ase_atoms_from_zip, df_wbm
 from matbench_discovery.energy import get_e_form_per_atom
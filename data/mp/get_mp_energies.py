@@ -17,6 +17,7 @@ from pymatgen.core import Element, Structure
 from pymatviz.enums import Key
 from tqdm import tqdm
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery import STABILITY_THRESHOLD, today
 from matbench_discovery.data import DataFiles
 from matbench_discovery.structure import prototype
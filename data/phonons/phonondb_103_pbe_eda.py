@@ -14,6 +14,7 @@ import pymatviz as pmv
 from moyopy import MoyoDataset
 from moyopy.interface import MoyoAdapter
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery.enums import DataFiles
 
 __date__ = "2025-01-14"
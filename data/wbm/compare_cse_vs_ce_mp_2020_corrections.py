@@ -17,6 +17,7 @@ from pymatgen.entries.computed_entries import ComputedEntry, ComputedStructureEn
 from pymatviz.enums import Key
 from tqdm import tqdm
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery import ROOT, today
 from matbench_discovery.data import df_wbm
 from matbench_discovery.energy import get_e_form_per_atom
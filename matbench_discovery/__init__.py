@@ -4,10 +4,6 @@ import os
 import warnings
 from datetime import UTC, datetime
 
-import plotly.express as px
-import plotly.io as pio
-import pymatviz as pmv  # needed for pymatviz_dark template  # noqa: F401
-
 PKG_NAME = "matbench-discovery"
 __version__ = "1.3.1"
 
@@ -63,20 +59,3 @@ for msg, category, module in {
     warnings.filterwarnings(
         action="ignore", category=category, module=module, message=msg
     )
-
-
-# --- start global plot settings
-global_layout = dict(
-    paper_bgcolor="rgba(0,0,0,0)",
-    font_size=13,
-    # increase legend marker size and make background transparent
-    legend=dict(itemsizing="constant", bgcolor="rgba(0, 0, 0, 0)"),
-)
-pio.templates["mbd_global"] = dict(layout=global_layout)
-pio.templates.default = "pymatviz_dark+mbd_global"
-px.defaults.template = "pymatviz_dark+mbd_global"
-
-# https://github.com/plotly/Kaleido/issues/122#issuecomment-994906924
-# when seeing MathJax "loading" message in exported PDFs,
-# use pio.kaleido.scope.mathjax = None
-# --- end global plot settings
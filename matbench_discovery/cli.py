@@ -1,7 +1,8 @@
 """Central argument parser for Matbench Discovery scripts."""
 
 import multiprocessing as mp
-from argparse import ArgumentParser
+from argparse import ArgumentParser, Namespace
+from typing import Any
 
 from pymatviz.enums import Key
 
@@ -44,6 +45,12 @@ cli_parser.add_argument(
     action="store_true",
     help="Print what would be done without actually doing it.",
 )
+cli_parser.add_argument(
+    "--batch-writes",
+    action="store_true",
+    help="Collect model YAML metric updates in memory and write each file once "
+    "(atomically) at the end of the run instead of after every model.",
+)
 cli_parser.add_argument(
     "--timeout",
     type=int,
@@ -86,4 +93,19 @@ plot_group.add_argument(
     action="store_true",
     help="Whether to update figures whose file paths already exist.",
 )
-cli_args, _ignore_unknown = cli_parser.parse_known_args()
+
+# parsed on first access by __getattr__ below
+cli_args: Namespace
+
+
+def __getattr__(name: str) -> Any:
+    """Parse CLI args lazily on first access of cli_args rather than at import time.
+
+    Keeps importing library modules that depend on this one (e.g. for CLI_TIMEOUT)
+    free of argument parsing side effects.
+    """
+    if name == "cli_args":
+        global cli_args
+        cli_args, _ignore_unknown = cli_parser.parse_known_args()
+        return cli_args
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
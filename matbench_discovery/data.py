@@ -11,13 +11,16 @@ Environment Variables:
         ~/.cache/matbench-discovery.
 """
 
+import copy
 import io
 import os
 import re
 import sys
 import zipfile
 from collections import defaultdict
-from collections.abc import Callable, Sequence
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
 from glob import glob
 from pathlib import Path
 from typing import Any
@@ -32,6 +35,7 @@ from tqdm import tqdm
 
 from matbench_discovery import DATA_DIR, TEST_FILES
 from matbench_discovery.enums import DataFiles, MbdKey, Model, TestSubset
+from matbench_discovery.models import get_model_registry
 
 round_trip_yaml = YAML()  # round-trippable YAML for updating model metadata files
 round_trip_yaml.preserve_quotes = True
@@ -95,13 +99,9 @@ def glob_to_df(
             df_mock = pd.read_csv(f"{TEST_FILES}/mock-wbm-energy-preds.csv.gz")
             # .set_index( "material_id" )
             # make sure pred_cols for all models are present in df_mock
+            registry = get_model_registry()
             for model in Model:
-                with open(model.yaml_path, encoding="utf-8") as file:
-                    model_data = yaml.safe_load(file)
-
-                pred_col = (
-                    model_data.get("metrics", {}).get("discovery", {}).get("pred_col")
-                )
+                pred_col = registry.get_metric(model, "metrics.discovery.pred_col")
                 df_mock[pred_col] = df_mock[Key.formation_energy_per_atom]
             return df_mock
         raise FileNotFoundError(f"No files matching glob {pattern=}")
@@ -246,12 +246,17 @@ def load_df_wbm_with_preds(
     Returns:
         pd.DataFrame: WBM summary dataframe with model predictions.
     """
+    registry = get_model_registry()
     valid_models = {model.name for model in Model}
     if models == ():
         models = tuple(valid_models)
-    inv_label_map = {key.label: key.name for key in Model}
     # map pretty model names back to Model enum keys
-    models = [inv_label_map.get(model, model) for model in models]
+    models = [
+        registry.model(model).name
+        if isinstance(model, str) and model in registry.label_index
+        else model
+        for model in models
+    ]
     if unknown_models := ", ".join(set(models) - valid_models):
         raise ValueError(f"{unknown_models=}, expected subset of {valid_models}")
 
@@ -268,12 +273,7 @@ def load_df_wbm_with_preds(
 
             df_preds = glob_to_df(model.discovery_path, pbar=False, **kwargs)
 
-            with open(model.yaml_path, encoding="utf-8") as file:
-                model_data = yaml.safe_load(file)
-
-            pred_col = (
-                model_data.get("metrics", {}).get("discovery", {}).get("pred_col")
-            )
+            pred_col = registry.get_metric(model, "metrics.discovery.pred_col")
             if not pred_col:
                 raise ValueError(
                     f"pred_col not specified for {model_name} in {model.yaml_path!r}"
@@ -311,6 +311,147 @@ def load_df_wbm_with_preds(
     return df_out
 
 
+class YamlBatch:
+    """Transaction of updates to round-trip YAML files.
+
+    Each file is loaded at most once on first access and all updates are applied
+    to the in-memory document. commit() then writes every touched file back exactly
+    once via a temporary file and os.replace so readers never see a half-written
+    file. Use batch_yaml_updates() to make update_yaml_file() calls join a batch.
+
+    Savepoints (see savepoint() and rollback()) let nested batch_yaml_updates()
+    contexts undo their own changes when they raise without discarding the rest of
+    the batch.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty batch."""
+        self.docs: dict[str, Any] = {}  # absolute file path -> loaded YAML document
+        # stack of {abs path: copy of doc before first change since the savepoint
+        # (None if it wasn't loaded yet)}
+        self.savepoints: list[dict[str, Any]] = []
+
+    def savepoint(self) -> None:
+        """Start tracking changes so they can be undone with rollback()."""
+        self.savepoints += [{}]
+
+    def release(self) -> None:
+        """Keep changes since the last savepoint and stop tracking them."""
+        self.savepoints.pop()
+
+    def rollback(self) -> None:
+        """Undo all changes since the last savepoint."""
+        for abs_path, doc in self.savepoints.pop().items():
+            if doc is None:
+                self.docs.pop(abs_path, None)
+            else:
+                self.docs[abs_path] = doc
+
+    def load(self, file_path: str | Path) -> Any:
+        """Get the in-memory YAML document for a file, loading it on first access.
+
+        Changes made to the returned document are written on commit() and undone
+        by rollback() of any savepoint active when the document was loaded.
+        """
+        abs_path = os.path.abspath(file_path)
+        # snapshot doc for savepoints that haven't seen this file yet. It can't have
+        # changed since they started since all changes go through load().
+        if untracked := [sp for sp in self.savepoints if abs_path not in sp]:
+            doc = copy.deepcopy(self.docs[abs_path]) if abs_path in self.docs else None
+            for savepoint in untracked:
+                savepoint[abs_path] = doc
+        if abs_path not in self.docs:
+            with open(abs_path, encoding="utf-8") as file:
+                self.docs[abs_path] = round_trip_yaml.load(file)
+        return self.docs[abs_path]
+
+    def update(
+        self, file_path: str | Path, dotted_path: str, data: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Queue data to be written at a dotted path (see update_yaml_file())."""
+        # raise on repeated or trailing dots in dotted path
+        if not re.match(r"^[a-zA-Z0-9-+=_]+(\.[a-zA-Z0-9-+=_]+)*$", dotted_path):
+            raise ValueError(f"Invalid {dotted_path=}")
+
+        yaml_data = self.load(file_path)
+
+        # Navigate to the correct nested level
+        current = yaml_data
+        *parts, last = dotted_path.split(".")
+
+        for part in parts:
+            if part not in current:
+                current[part] = {}
+            current = current[part]
+
+        # Update the data at the final level
+        if last not in current:
+            current[last] = {}
+        for key, val in current[last].items():
+            data.setdefault(key, val)
+        # Replace the entire current[last] section to preserve comments
+        current[last] = data
+
+        return yaml_data
+
+    def commit(self) -> list[str]:
+        """Atomically write all loaded files and clear the batch.
+
+        Returns:
+            list[str]: Absolute paths of the files written.
+        """
+        for abs_path, yaml_data in self.docs.items():
+            tmp_path = f"{abs_path}.tmp{os.getpid()}"
+            try:
+                with open(tmp_path, mode="w", encoding="utf-8") as file:
+                    round_trip_yaml.dump(yaml_data, file)
+                os.replace(tmp_path, abs_path)
+            finally:
+                if os.path.isfile(tmp_path):
+                    os.remove(tmp_path)
+        written, self.docs = list(self.docs), {}
+        return written
+
+
+_active_yaml_batch: ContextVar[YamlBatch | None] = ContextVar(
+    "_active_yaml_batch", default=None
+)
+
+
+@contextmanager
+def batch_yaml_updates() -> Iterator[YamlBatch]:
+    """Group update_yaml_file() calls so each file is read and written only once.
+
+    Updates made inside the context are applied in memory and written atomically
+    when the outermost context exits without error. If an exception is raised, no
+    file is written. Nested contexts join the enclosing batch. If a nested context
+    raises, only its own updates are discarded so e.g. a loop over models can catch
+    errors and still commit the updates of all models that succeeded.
+
+    Example:
+        with batch_yaml_updates():
+            for subset in TestSubset:
+                update_yaml_file(model.yaml_path, f"metrics.discovery.{subset}", ...)
+    """
+    if (batch := _active_yaml_batch.get()) is not None:
+        batch.savepoint()
+        try:
+            yield batch
+        except BaseException:
+            batch.rollback()
+            raise
+        batch.release()
+        return
+
+    batch = YamlBatch()
+    token = _active_yaml_batch.set(batch)
+    try:
+        yield batch
+    finally:
+        _active_yaml_batch.reset(token)
+    batch.commit()
+
+
 def update_yaml_file(
     file_path: str | Path,
     dotted_path: str,
@@ -318,13 +459,17 @@ def update_yaml_file(
 ) -> dict[str, Any]:
     """Update a YAML file at a specific dotted path with new data.
 
+    Inside a batch_yaml_updates() context, the update is only applied in memory and
+    written together with all other updates to the same file when the batch exits.
+
     Args:
         file_path (str | Path): Path to YAML file to update
         dotted_path (str): Dotted path to update (e.g. 'metrics.discovery')
         data (dict[str, Any]): Data to write at the specified path
 
     Returns:
-        dict[str, Any]: The complete updated YAML data written to file.
+        dict[str, Any]: The complete updated YAML data (written to file unless
+            inside a batch).
 
     Example:
         update_yaml_file(
@@ -333,32 +478,5 @@ def update_yaml_file(
             dict(mae=0.1, rmse=0.2),
         )
     """
-    # raise on repeated or trailing dots in dotted path
-    if not re.match(r"^[a-zA-Z0-9-+=_]+(\.[a-zA-Z0-9-+=_]+)*$", dotted_path):
-        raise ValueError(f"Invalid {dotted_path=}")
-
-    with open(file_path, encoding="utf-8") as file:
-        yaml_data = round_trip_yaml.load(file)
-
-    # Navigate to the correct nested level
-    current = yaml_data
-    *parts, last = dotted_path.split(".")
-
-    for part in parts:
-        if part not in current:
-            current[part] = {}
-        current = current[part]
-
-    # Update the data at the final level
-    if last not in current:
-        current[last] = {}
-    for key, val in current[last].items():
-        data.setdefault(key, val)
-    # Replace the entire current[last] section to preserve comments
-    current[last] = data
-
-    # Write back to file
-    with open(file_path, mode="w", encoding="utf-8") as file:
-        round_trip_yaml.dump(yaml_data, file)
-
-    return yaml_data
+    with batch_yaml_updates() as batch:
+        return batch.update(file_path, dotted_path, data)
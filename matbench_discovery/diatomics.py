@@ -8,15 +8,19 @@ https://arxiv.org/abs/2401.00096 (see fig. 56).
 # %%
 from __future__ import annotations
 
+import json
 import os
-from typing import TYPE_CHECKING, Literal, get_args
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any, Literal, get_args
 
+import numpy as np
 from ase import Atoms
+from ase.calculators.calculator import all_changes
 from ase.data import chemical_symbols
 from tqdm import tqdm
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from ase.calculators.calculator import Calculator
 
@@ -46,6 +50,124 @@ def generate_diatomics(
     ]
 
 
+def get_pair_formula(z1: str | int, z2: str | int) -> str:
+    """Get the "symbol-symbol" key used for a diatomic curve.
+
+    Args:
+        z1 (str | int): Chemical symbol or atomic number of the first element.
+        z2 (str | int): Chemical symbol or atomic number of the second element.
+
+    Returns:
+        str: Pair formula like "Cu-O".
+    """
+    elem1 = atom_num_symbol_map.get(z1, z1)
+    elem2 = atom_num_symbol_map.get(z2, z2)
+    return f"{elem1}-{elem2}"
+
+
+def calc_pair_curve(
+    formula: str,
+    calculator: Calculator,
+    distances: Sequence[float] | np.ndarray,
+    energies: np.ndarray,
+    forces: np.ndarray,
+) -> None:
+    """Evaluate one diatomic curve, writing results into preallocated arrays.
+
+    A single Atoms object is reused for all distances and energy and forces are
+    requested from the calculator together so each geometry costs exactly one
+    calculation, even for calculators that only compute the properties asked for.
+
+    Args:
+        formula (str): Pair formula like "Cu-O" (see get_pair_formula()).
+        calculator (Calculator): ASE calculator instance.
+        distances (Sequence[float] | np.ndarray): Distances to sample at.
+        energies (np.ndarray): Output array of shape (n_dist,). Filled in-place.
+        forces (np.ndarray): Output array of shape (n_dist, 2, 3). Filled in-place.
+    """
+    elem1, elem2 = formula.split("-")
+    atoms = Atoms(f"{elem1}{elem2}", positions=np.zeros((2, 3)), pbc=False)
+    for dist_idx, dist in enumerate(distances):
+        positions = atoms.get_positions()
+        positions[1, 0] = dist
+        atoms.set_positions(positions)
+        calculator.calculate(atoms, ["energy", "forces"], all_changes)
+        energies[dist_idx] = calculator.results["energy"]
+        forces[dist_idx] = calculator.results["forces"]
+
+
+def calc_diatomic_curves_batch(
+    pairs: Sequence[tuple[str | int, str | int]],
+    calculator: Calculator,
+    distances: Sequence[float] | np.ndarray,
+    *,
+    energies: np.ndarray | None = None,
+    forces: np.ndarray | None = None,
+    pbar_kwargs: dict[str, Any] | None = None,
+) -> tuple[list[str], np.ndarray, np.ndarray]:
+    """Calculate diatomic curves for many pairs into dense NumPy arrays.
+
+    Array-based counterpart to calc_diatomic_curve() that avoids building nested
+    Python lists. Pairs whose calculation fails are left as NaN.
+
+    Args:
+        pairs (Sequence[tuple[str | int, str | int]]): Element pairs to calculate.
+            Each pair can be specified as element symbols or atomic numbers.
+        calculator (Calculator): ASE calculator instance.
+        distances (Sequence[float] | np.ndarray): Distances to sample at.
+        energies (np.ndarray | None): Optional preallocated output array of shape
+            (n_pairs, n_dist), e.g. a memory-mapped file. Defaults to None.
+        forces (np.ndarray | None): Optional preallocated output array of shape
+            (n_pairs, n_dist, 2, 3). Defaults to None.
+        pbar_kwargs (dict[str, Any] | None): Passed to tqdm progress bar.
+            Defaults to None.
+
+    Returns:
+        tuple[list[str], np.ndarray, np.ndarray]: Pair formulas, energies of shape
+            (n_pairs, n_dist) and forces of shape (n_pairs, n_dist, 2, 3).
+
+    Raises:
+        ValueError: If preallocated arrays have the wrong shape.
+    """
+    formulas = [get_pair_formula(z1, z2) for z1, z2 in pairs]
+    n_pairs, n_dist = len(formulas), len(distances)
+    if energies is None:
+        energies = np.full((n_pairs, n_dist), np.nan)
+    if forces is None:
+        forces = np.full((n_pairs, n_dist, 2, 3), np.nan)
+    if energies.shape != (n_pairs, n_dist):
+        raise ValueError(f"{energies.shape=} must be ({n_pairs=}, {n_dist=})")
+    if forces.shape != (n_pairs, n_dist, 2, 3):
+        raise ValueError(f"{forces.shape=} must be ({n_pairs=}, {n_dist=}, 2, 3)")
+
+    for pair_idx, formula in enumerate(
+        tqdm(formulas, desc="Diatomic curves", **pbar_kwargs or {})
+    ):
+        try:
+            calc_pair_curve(
+                formula, calculator, distances, energies[pair_idx], forces[pair_idx]
+            )
+        except Exception as exc:
+            print(f"{pair_idx + 1}/{n_pairs} {formula} failed: {exc}")
+            energies[pair_idx] = forces[pair_idx] = np.nan
+
+    return formulas, energies, forces
+
+
+def is_curve_complete(ef_dict: dict[str, Any], n_dist: int) -> bool:
+    """Check if a diatomic curve has energies and forces for all distances.
+
+    Args:
+        ef_dict (dict[str, Any]): Dict with "energies" and "forces" lists.
+        n_dist (int): Number of distances the curve should cover.
+
+    Returns:
+        bool: True if both energies and forces have n_dist entries.
+    """
+    len_e, len_f = len(ef_dict.get("energies", [])), len(ef_dict.get("forces", []))
+    return len_e == len_f == n_dist
+
+
 def calc_diatomic_curve(
     pairs: Sequence[tuple[str | int, str | int]],
     calculator: Calculator,
@@ -72,14 +194,11 @@ def calc_diatomic_curve(
     # saving results in dict: {"symbol-symbol": {"energies": [...], "forces": [...]}}
     for idx, (z1, z2) in (pbar := tqdm(enumerate(pairs, start=1))):
         # Convert atomic numbers to symbols if needed
-        elem1 = atom_num_symbol_map.get(z1, z1)
-        elem2 = atom_num_symbol_map.get(z2, z2)
-        formula = f"{elem1}-{elem2}"
+        formula = get_pair_formula(z1, z2)
         ef_dict = results.setdefault(formula, {"energies": [], "forces": []})
 
-        len_e, len_f = len(ef_dict.get("energies", [])), len(ef_dict.get("forces", []))
         # skip if we have results for this formula and they match expected length
-        if len_e == len_f == len(distances):
+        if is_curve_complete(ef_dict, len(distances)):
             continue
 
         pbar.set_description(
@@ -88,12 +207,163 @@ def calc_diatomic_curve(
 
         # reset ef_dict in case we had prior results
         results[formula] |= {"energies": [], "forces": []}
+        energies, forces = np.empty(len(distances)), np.empty((len(distances), 2, 3))
         try:
-            for atoms in generate_diatomics(elem1, elem2, distances):
-                results[formula]["energies"] += [calculator.get_potential_energy(atoms)]
-                results[formula]["forces"] += [calculator.get_forces(atoms).tolist()]
+            calc_pair_curve(formula, calculator, distances, energies, forces)
         except Exception as exc:
             print(f"{idx}/{len(pairs)} {formula} failed: {exc}")
             continue
+        results[formula] |= {"energies": energies.tolist(), "forces": forces.tolist()}
+
+    return results
+
+
+def read_diatomic_curves_jsonl(
+    file_path: str,
+) -> dict[str, dict[str, list[float | list[list[float]]]]]:
+    """Read per-pair diatomic curves streamed by calc_diatomic_curves_parallel().
+
+    Each line holds one JSON record {"formula": ..., "energies": [...], "forces":
+    [...]}. Later records for the same formula override earlier ones. A truncated
+    last line (e.g. from a killed run) is ignored so the pair gets recalculated.
+
+    Args:
+        file_path (str): Path to the line-delimited JSON file.
+
+    Returns:
+        dict[str, dict[str, list[float | list[list[float]]]]]: Results dict in the
+            same format as calc_diatomic_curve().
+    """
+    results: dict[str, dict[str, list[float | list[list[float]]]]] = {}
+    if not os.path.isfile(file_path):
+        return results
+
+    with open(file_path) as file:
+        for line in file:
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            results[record["formula"]] = {
+                "energies": record["energies"],
+                "forces": record["forces"],
+            }
+    return results
+
+
+_worker_calculator: Calculator | None = None
+
+
+def _init_diatomics_worker(calculator_factory: Callable[[], Calculator]) -> None:
+    """Create one calculator per worker process."""
+    global _worker_calculator  # noqa: PLW0603
+    _worker_calculator = calculator_factory()
+
+
+def _calc_pair_curve_worker(
+    formula: str, distances: Sequence[float]
+) -> dict[str, str | list[float] | list[list[list[float]]]]:
+    """Calculate one diatomic curve in a worker process."""
+    calculator: Calculator = _worker_calculator  # type: ignore[assignment]
+    energies, forces = np.empty(len(distances)), np.empty((len(distances), 2, 3))
+    try:
+        calc_pair_curve(formula, calculator, distances, energies, forces)
+    except Exception as exc:
+        return {"formula": formula, "error": f"{exc}"}
+    return {
+        "formula": formula,
+        "energies": energies.tolist(),
+        "forces": forces.tolist(),
+    }
+
+
+def calc_diatomic_curves_parallel(
+    pairs: Sequence[tuple[str | int, str | int]],
+    calculator_factory: Callable[[], Calculator],
+    distances: Sequence[float],
+    out_path: str,
+    *,
+    n_workers: int | None = None,
+    pbar_kwargs: dict[str, Any] | None = None,
+) -> dict[str, dict[str, list[float | list[list[float]]]]]:
+    """Calculate diatomic curves for many pairs across a pool of worker processes.
+
+    Pairs are sharded across workers which each build their own calculator via
+    calculator_factory. Every finished pair is appended to out_path as one JSON
+    line and flushed right away, so an interrupted run loses at most the pairs in
+    flight. On restart, pairs already in out_path with energies and forces for all
+    distances are skipped (same check as calc_diatomic_curve()).
+
+    Args:
+        pairs (Sequence[tuple[str | int, str | int]]): Element pairs to calculate.
+            Each pair can be specified as element symbols or atomic numbers.
+        calculator_factory (Callable[[], Calculator]): Picklable zero-argument
+            callable (e.g. a class or functools.partial) returning an ASE
+            calculator. Called once per worker process.
+        distances (Sequence[float]): Distances to calculate potential energy at.
+        out_path (str): Append-only line-delimited JSON file to stream results to.
+            Read with read_diatomic_curves_jsonl().
+        n_workers (int | None): Number of worker processes. Defaults to None,
+            meaning os.cpu_count().
+        pbar_kwargs (dict[str, Any] | None): Passed to tqdm progress bar.
+            Defaults to None.
+
+    Returns:
+        dict[str, dict[str, list[float | list[list[float]]]]]: All results in
+            out_path (previous and new) in the same format as calc_diatomic_curve().
+    """
+    distances = list(map(float, distances))
+    results = read_diatomic_curves_jsonl(out_path)
+    todo = list(
+        dict.fromkeys(
+            formula
+            for z1, z2 in pairs
+            if not is_curve_complete(
+                results.get(formula := get_pair_formula(z1, z2), {}), len(distances)
+            )
+        )
+    )
+    print(f"{len(pairs) - len(todo)}/{len(pairs)} diatomic curves already done")
+    if not todo:
+        return results
+
+    if out_dir := os.path.dirname(out_path):
+        os.makedirs(out_dir, exist_ok=True)
+
+    with (
+        open(out_path, mode="a") as file,
+        ProcessPoolExecutor(
+            max_workers=n_workers,
+            initializer=_init_diatomics_worker,
+            initargs=(calculator_factory,),
+        ) as executor,
+    ):
+        # start on a fresh line in case the last record was truncated
+        if file.tell() > 0:
+            with open(out_path, mode="rb") as last_byte_file:
+                last_byte_file.seek(-1, os.SEEK_END)
+                if last_byte_file.read() != b"\n":
+                    file.write("\n")
+        futures = [
+            executor.submit(_calc_pair_curve_worker, formula, distances)
+            for formula in todo
+        ]
+        for future in tqdm(
+            as_completed(futures),
+            total=len(futures),
+            desc="Diatomic curves",
+            **pbar_kwargs or {},
+        ):
+            record = future.result()
+            formula = record["formula"]
+            if "error" in record:
+                print(f"{formula} failed: {record['error']}")
+                continue
+            file.write(json.dumps(record) + "\n")
+            file.flush()
+            results[formula] = {
+                "energies": record["energies"],
+                "forces": record["forces"],
+            }
 
     return results
@@ -8,14 +8,12 @@ import sys
 from enum import EnumType, StrEnum, _EnumDict, auto, unique
 from typing import Any, Self, TypeVar
 
-import plotly.express as px
-import pymatviz as pmv
 import yaml
+from pymatviz.enums import eV_per_atom
 
 from matbench_discovery import DEFAULT_CACHE_DIR, PKG_DIR, ROOT
 from matbench_discovery.remote.fetch import download_file, maybe_auto_download_file
 
-eV_per_atom = pmv.enums.eV_per_atom  # noqa: N816
 T = TypeVar("T", bound="Files")
 
 
@@ -105,6 +103,8 @@ class MbdKey(LabelEnum):
         "Mode-resolved average thermal conductivity",
     )
     true_kappa_tot_avg = "true_kappa_tot_avg", "True average total thermal conductivity"
+    n_imag_ph_modes = "n_imag_ph_modes", "Number of imaginary phonon modes"
+    max_imag_ph_freq = "max_imag_ph_freq", "Largest imaginary phonon frequency (THz)"
 
     # Diatomic curve metrics
     norm_auc = "norm_auc", "Norm. AUC (unitless)"
@@ -570,6 +570,11 @@ class DataFiles(Files):
         """Description associated with the file."""
         return self.yaml[self.name]["description"]
 
+    @property
+    def md5(self) -> str | None:
+        """Expected MD5 hash of the file (None if not recorded in data-files.yml)."""
+        return self.yaml[self.name].get("md5")
+
     @property
     def path(self) -> str:
         """File path associated with the file URL if it exists, otherwise
@@ -594,9 +599,5 @@ class DataFiles(Files):
             )
             if answer.lower().strip() == "y":
                 print(f"Downloading {key!r} from {self.url} to {abs_path}")
-                download_file(abs_path, self.url)
+                download_file(abs_path, self.url, md5=self.md5)
         return abs_path
-
-
-# register pretty labels to use instead of enum keys in plotly axes and legends
-px.defaults.labels |= {key.name: key.label for key in (*Model, *MbdKey, *pmv.enums.Key)}
@@ -1,12 +1,25 @@
 """Slurm job submission helper function."""
 
+import bz2
+import gzip
+import heapq
+import json
+import lzma
 import os
+import shlex
 import shutil
+import sqlite3
 import subprocess
 import sys
 import tempfile
-from collections.abc import Sequence, Sized
-from typing import Final, TypeVar
+import time
+import zlib
+from collections.abc import Callable, Iterable, Iterator, Sequence, Sized
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
+from datetime import UTC, datetime
+from glob import glob
+from typing import Any, Final, TypeVar
 
 import numpy as np
 
@@ -26,6 +39,13 @@ SLURM_KEYS: Final[tuple[str, ...]] = (
     "job_qos",
 )
 SLURM_SUBMIT_KEY: Final[str] = "slurm-submit"
+LOCAL_SUBMIT_KEY: Final[str] = "local-submit"
+# openers used by is_intact_file() to check compressed shards decompress completely
+COMPRESSED_OPENERS: Final[dict[str, Callable[..., Any]]] = {
+    ".gz": gzip.open,
+    ".bz2": bz2.open,
+    ".xz": lzma.open,
+}
 HasLen = TypeVar("HasLen", bound=Sized)
 
 
@@ -59,7 +79,9 @@ def slurm_submit(
 
     Usage: Call this function at the top of the script (before doing any real work) and
     then submit a job with `python path/to/that/script.py slurm-submit`. The slurm job
-    will run the whole script.
+    will run the whole script. On machines without Slurm, `local-submit` runs the
+    array tasks as local subprocesses instead (see run_local_array()) and
+    `local-submit=<job_id>` reruns only the failed tasks of a previous local run.
 
     Args:
         job_name (str): Slurm job name.
@@ -138,6 +160,24 @@ def slurm_submit(
         for key, val in slurm_vars.items():
             print(f"{key}={val}")
 
+    local_args = [arg for arg in sys.argv[1:] if arg.split("=")[0] == LOCAL_SUBMIT_KEY]
+    if local_args:
+        # run array tasks as local subprocesses instead of submitting to Slurm.
+        # local-submit=<job_id> reruns only failed tasks of a previous run. All other
+        # CLI args are passed on to the tasks.
+        prev_job_id = local_args[0].partition("=")[2] or None
+        script_args = [arg for arg in sys.argv[1:] if arg not in local_args]
+        py_cmd = shlex.join([sys.executable, py_file_path, *script_args])
+        return_codes = run_local_array(
+            f"{pre_cmd or ''} {py_cmd}".strip(),
+            array=array or "0",
+            out_dir=out_dir,
+            job_id=prev_job_id,
+            job_name=job_name,
+        )
+        # first non-zero return code (negative if killed by a signal), else 0
+        raise SystemExit(next((rc for rc in return_codes.values() if rc != 0), 0))
+
     if SLURM_SUBMIT_KEY not in sys.argv:
         return slurm_vars  # if not submitting slurm job, resume outside code as normal
 
@@ -147,11 +187,292 @@ def slurm_submit(
     raise SystemExit(result.returncode)
 
 
+def parse_array_spec(array: str) -> tuple[list[int], int | None]:
+    """Parse a Slurm --array specifier into task IDs and max concurrent tasks.
+
+    Args:
+        array (str): Slurm array spec like '7' (only task 7), '0-9', '0-15:4' (step
+            4), '1,3,5-7' or any of these with a '%N' suffix limiting the number of
+            simultaneously running tasks to N.
+
+    Returns:
+        tuple[list[int], int | None]: Sorted unique task IDs and the '%N' limit (None
+            if not given).
+
+    Raises:
+        ValueError: If the spec is malformed.
+    """
+    spec, _, max_concurrent = array.strip().partition("%")
+    task_ids: set[int] = set()
+    try:
+        for part in spec.split(","):
+            id_range, _, step = part.partition(":")
+            start, _, end = id_range.partition("-")
+            task_ids.update(range(int(start), int(end or start) + 1, int(step or 1)))
+        limit = int(max_concurrent) if max_concurrent else None
+    except ValueError as exc:
+        raise ValueError(f"Invalid Slurm array spec {array=}") from exc
+    if not task_ids or min(task_ids) < 0 or (limit is not None and limit < 1):
+        raise ValueError(f"Invalid Slurm array spec {array=}")
+
+    return sorted(task_ids), limit
+
+
+def format_array_spec(
+    task_ids: Iterable[int], max_concurrent: int | None = None
+) -> str:
+    """Format task IDs as a compact Slurm --array spec, inverse of parse_array_spec().
+
+    Args:
+        task_ids (Iterable[int]): Array task IDs.
+        max_concurrent (int | None): Optional '%N' limit on simultaneously running
+            tasks. Defaults to None.
+
+    Returns:
+        str: Spec like '1-3,7,9-10' or '1-3,7%4'.
+
+    Raises:
+        ValueError: If task_ids is empty.
+    """
+    sorted_ids = sorted(set(task_ids))
+    if not sorted_ids:
+        raise ValueError("Need at least one task ID to format an array spec")
+
+    ranges: list[str] = []
+    start = prev = sorted_ids[0]
+    for task_id in [*sorted_ids[1:], None]:
+        if task_id is not None and task_id == prev + 1:
+            prev = task_id
+            continue
+        ranges += [f"{start}" if start == prev else f"{start}-{prev}"]
+        if task_id is not None:
+            start = prev = task_id
+    spec = ",".join(ranges)
+    return f"{spec}%{max_concurrent}" if max_concurrent else spec
+
+
+def is_intact_file(file_path: str) -> bool:
+    """Check if a file is non-empty and, if compressed (.gz, .bz2 or .xz, see
+    COMPRESSED_OPENERS), decompresses completely.
+
+    Job scripts call this on their output path before doing any work so that tasks
+    whose output already exists are skipped, but tasks whose output got truncated
+    by a job killed mid-write (e.g. on timeout or preemption) are rerun.
+
+    Args:
+        file_path (str): Path to check.
+
+    Returns:
+        bool: True if the file exists, is non-empty and (if compressed) valid.
+    """
+    if not os.path.isfile(file_path) or os.path.getsize(file_path) == 0:
+        return False
+    opener = COMPRESSED_OPENERS.get(os.path.splitext(file_path)[1])
+    if opener is None:
+        return True
+    try:
+        with opener(file_path, mode="rb") as file:
+            while file.read(1 << 24):
+                pass
+    except (OSError, EOFError, zlib.error, lzma.LZMAError):
+        return False
+    return True
+
+
+def find_missing_shards(
+    path_template: str, task_ids: Iterable[int] | str
+) -> tuple[list[int], list[int]]:
+    """Find array tasks whose output shard is missing or corrupt.
+
+    Args:
+        path_template (str): Output path with a {task_id} placeholder (format spec
+            allowed, e.g. '{task_id:>03}') and optional glob wildcards for parts not
+            known in advance like the job ID, e.g.
+            f"{out_dir}/*-{{task_id:>03}}.json.gz". If a wildcard matches several
+            files, the shard counts as done if any of them is intact.
+        task_ids (Iterable[int] | str): Expected task IDs or a Slurm array spec
+            like '1-100'.
+
+    Returns:
+        tuple[list[int], list[int]]: Task IDs with missing shards and task IDs whose
+            shards exist but are empty or truncated/corrupt compressed files.
+            Resubmit both with array=format_array_spec(missing + corrupt).
+    """
+    if isinstance(task_ids, str):
+        task_ids, _ = parse_array_spec(task_ids)
+
+    missing: list[int] = []
+    corrupt: list[int] = []
+    for task_id in task_ids:
+        file_paths = glob(path_template.format(task_id=task_id))
+        if not file_paths:
+            missing += [task_id]
+        elif not any(map(is_intact_file, file_paths)):
+            corrupt += [task_id]
+    return missing, corrupt
+
+
+def get_resubmit_array(
+    path_template: str,
+    task_ids: Iterable[int] | str,
+    max_concurrent: int | None = None,
+) -> str | None:
+    """Report missing/corrupt shards of a job array and get the --array spec to
+    rerun only those tasks, e.g. slurm_submit(..., array=spec) or
+    run_local_array(..., array=spec).
+
+    Args:
+        path_template (str): Output path template, see find_missing_shards().
+        task_ids (Iterable[int] | str): Expected task IDs or Slurm array spec.
+        max_concurrent (int | None): Optional '%N' limit appended to the spec.
+
+    Returns:
+        str | None: Array spec for failed tasks or None if all shards are intact.
+    """
+    task_ids = (
+        parse_array_spec(task_ids)[0] if isinstance(task_ids, str) else list(task_ids)
+    )
+    missing, corrupt = find_missing_shards(path_template, task_ids)
+    n_done = len(task_ids) - len(missing) - len(corrupt)
+    print(f"{n_done:,}/{len(task_ids):,} shards intact for {path_template}")
+    if missing:
+        print(f"{len(missing)} missing: {format_array_spec(missing)}")
+    if corrupt:
+        print(f"{len(corrupt)} corrupt: {format_array_spec(corrupt)}")
+    if not missing and not corrupt:
+        return None
+    return format_array_spec(missing + corrupt, max_concurrent)
+
+
+def run_local_array(
+    cmd: str | Sequence[str],
+    *,
+    array: str,
+    out_dir: str,
+    max_concurrent: int | None = None,
+    job_id: str | None = None,
+    job_name: str = "local",
+    env: dict[str, str] | None = None,
+) -> dict[int, int]:
+    """Run a job array as local subprocesses, e.g. on a workstation without Slurm.
+
+    Each task gets the same SLURM_ARRAY_* environment variables it would get under
+    Slurm, so scripts that select their chunk with SLURM_ARRAY_TASK_ID work unchanged.
+    Output goes to {out_dir}/slurm-{job_id}-{task_id}.log (same naming as
+    slurm_submit) and return codes are recorded in {out_dir}/slurm-{job_id}.json.
+    Passing the job_id of a previous run reruns only its failed or missing tasks.
+
+    Args:
+        cmd (str | Sequence[str]): Command to run for each task. Strings are run
+            through the shell (like sbatch --wrap), sequences are run directly.
+        array (str): Slurm array spec, e.g. '0-9' or '0-99%4'. See
+            parse_array_spec().
+        out_dir (str): Directory for log files and the task status file.
+        max_concurrent (int | None): Max number of tasks to run at once. Defaults to
+            the '%N' limit in array if given, else os.cpu_count().
+        job_id (str | None): Job ID to use as SLURM_ARRAY_JOB_ID and in log names.
+            If a status file for this job ID exists, tasks that already succeeded
+            are skipped. Defaults to None, meaning a new timestamp-based ID.
+        job_name (str): Value for SLURM_JOB_NAME. Defaults to "local".
+        env (dict[str, str] | None): Extra environment variables for all tasks.
+
+    Returns:
+        dict[int, int]: Map of task IDs to return codes for all tasks in array
+            (incl. previously succeeded ones).
+    """
+    task_ids, spec_limit = parse_array_spec(array)
+    max_concurrent = max_concurrent or spec_limit or os.cpu_count() or 1
+    job_id = job_id or datetime.now(tz=UTC).strftime("%Y%m%d%H%M%S%f")
+
+    os.makedirs(out_dir, exist_ok=True)
+    status_path = f"{out_dir}/slurm-{job_id}.json"
+    return_codes: dict[int, int] = {}
+    if os.path.isfile(status_path):
+        with open(status_path) as file:
+            return_codes = {int(key): val for key, val in json.load(file).items()}
+
+    todo = [idx for idx in task_ids if return_codes.get(idx) != 0]
+    print(
+        f"Running {len(todo)}/{len(task_ids)} tasks of local array job {job_id} "
+        f"with up to {max_concurrent} at a time, logs in {out_dir}"
+    )
+
+    array_env = {
+        "SLURM_JOB_ID": job_id,
+        "SLURM_JOB_NAME": job_name,
+        "SLURM_ARRAY_JOB_ID": job_id,
+        "SLURM_ARRAY_TASK_COUNT": str(len(task_ids)),
+        "SLURM_ARRAY_TASK_MIN": str(task_ids[0]),
+        "SLURM_ARRAY_TASK_MAX": str(task_ids[-1]),
+    }
+
+    def run_task(task_id: int) -> int:
+        task_env = os.environ | array_env | (env or {})
+        task_env["SLURM_ARRAY_TASK_ID"] = str(task_id)
+        log_path = f"{out_dir}/slurm-{job_id}-{task_id}.log"
+        with open(log_path, mode="w") as log_file:
+            result = subprocess.run(
+                cmd,
+                shell=isinstance(cmd, str),
+                env=task_env,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+                check=False,
+            )
+        return result.returncode
+
+    with ThreadPoolExecutor(max_workers=max_concurrent) as executor:
+        futures = {executor.submit(run_task, task_id): task_id for task_id in todo}
+        for future in as_completed(futures):
+            return_codes[futures[future]] = future.result()
+            with open(status_path, mode="w") as file:
+                json.dump(return_codes, file)
+
+    if failed := sorted(idx for idx in task_ids if return_codes[idx] != 0):
+        print(
+            f"{len(failed)} tasks failed: {failed}. Rerun only those with "
+            f"run_local_array(..., {job_id=})"
+        )
+    return {idx: return_codes[idx] for idx in task_ids}
+
+
+def n_neighbors_cost(cutoff: float = 5.0) -> Callable[[Any], float]:
+    """Make a cost function counting neighbor pairs within cutoff, a better proxy
+    than atom count for the cost of message-passing models on dense structures.
+
+    Args:
+        cutoff (float): Neighbor cutoff radius in Å. Defaults to 5.0.
+
+    Returns:
+        Callable[[Any], float]: Maps ASE Atoms or pymatgen Structure to its number of
+            directed neighbor pairs within cutoff.
+    """
+
+    def cost(obj: Any) -> float:
+        if hasattr(obj, "get_neighbor_list"):  # pymatgen Structure
+            center_idx, *_ = obj.get_neighbor_list(r=cutoff)
+            return float(len(center_idx))
+        from ase.neighborlist import neighbor_list
+
+        return float(len(neighbor_list("i", obj, cutoff)))
+
+    return cost
+
+
+# built-in per-structure cost models for chunk_by_lens(weights=...)
+COST_MODELS: Final[dict[str, Callable[[Any], float]]] = {
+    "n_atoms": len,
+    "n_atoms_sq": lambda obj: len(obj) ** 2,
+    "n_neighbors": n_neighbors_cost(),
+}
+
+
 def chunk_by_lens(
     inputs: Sequence[HasLen],
     *,  # force keyword-only arguments
     n_chunks: int | None = None,
-    chunk_size: int | None = None,
+    chunk_size: float | None = None,
+    weights: str | Callable[[HasLen], float] | Sequence[float] | None = None,
     report: bool = True,
 ) -> list[list[HasLen]]:
     """Make a balanced partition. That is, split a list of pymatgen Structures or
@@ -163,8 +484,16 @@ def chunk_by_lens(
     Args:
         inputs (Sequence[T]): List of objects with len() to split into chunks
         n_chunks (int, optional): Number of chunks to create. Defaults to None.
-        chunk_size (int, optional): Target size for each chunk. Defaults to None.
-            Only one of n_chunks or chunk_size can be specified.
+        chunk_size (float, optional): Target size (total cost) for each chunk.
+            Defaults to None. Only one of n_chunks or chunk_size can be specified.
+        weights (str | Callable | Sequence[float], optional): Per-item cost to
+            balance instead of len(). Either the name of a built-in cost model in
+            COST_MODELS ("n_atoms", "n_atoms_sq" for models whose cost grows
+            quadratically with system size, "n_neighbors" for number of neighbors
+            within 5 Å, see n_neighbors_cost() for other cutoffs), a callable mapping
+            each input to its cost or a sequence of precomputed costs (e.g. n_atoms
+            times number of optimizer steps from a previous run). Defaults to None,
+            meaning len().
         report (bool, optional): If True, print statistics about the chunk sizes.
 
     Returns:
@@ -184,7 +513,8 @@ def chunk_by_lens(
         [12, 10, 8]  # roughly equal total atom counts
 
     Raises:
-        ValueError: If neither or both n_chunks and chunk_size are specified.
+        ValueError: If neither or both n_chunks and chunk_size are specified or
+            weights has wrong length or is an unknown cost model.
     """
     if len(inputs) == 0:
         return []
@@ -192,8 +522,19 @@ def chunk_by_lens(
     if n_chunks is not None and chunk_size is not None:
         raise ValueError("Cannot specify both n_chunks and chunk_size")
 
-    # Get number of atoms in each structure
-    lens = np.array([len(obj) for obj in inputs])
+    # Get cost of each structure (number of atoms by default)
+    if isinstance(weights, str):
+        if weights not in COST_MODELS:
+            raise ValueError(f"Unknown {weights=}, must be one of {[*COST_MODELS]}")
+        weights = COST_MODELS[weights]
+    if weights is None:
+        lens = np.array([len(obj) for obj in inputs])
+    elif callable(weights):
+        lens = np.array([weights(obj) for obj in inputs], dtype=float)
+    else:
+        lens = np.asarray(weights, dtype=float)
+        if lens.shape != (len(inputs),):
+            raise ValueError(f"{len(lens)=} must match {len(inputs)=}")
     total_size = lens.sum()
 
     if chunk_size:
@@ -214,20 +555,202 @@ def chunk_by_lens(
     chunks: list[list[HasLen]] = [[] for _ in range(n_chunks)]
     chunk_sizes = np.zeros(n_chunks)
 
-    # Assign each structure to the chunk with the smallest current total
-    for sized_obj in sorted_inputs:
-        smallest_chunk = np.argmin(chunk_sizes)
+    # Assign each structure to the chunk with the smallest current total. Min-heap
+    # of (total, chunk index) makes this O(n log k) instead of O(n k) and breaks ties
+    # by lowest chunk index, same as np.argmin.
+    heap = [(0.0, chunk_idx) for chunk_idx in range(n_chunks)]
+    for sized_obj, size in zip(sorted_inputs, lens[sort_idx].tolist(), strict=True):
+        chunk_total, smallest_chunk = heap[0]
         chunks[smallest_chunk].append(sized_obj)
-        chunk_sizes[smallest_chunk] += len(sized_obj)
+        heapq.heapreplace(heap, (chunk_total + size, smallest_chunk))
+    for chunk_total, chunk_idx in heap:
+        chunk_sizes[chunk_idx] = chunk_total
 
     if report:
         # Print statistics about the chunk sizes
         mean, std = chunk_sizes.mean(), chunk_sizes.std()
         cls_name = type(inputs[0]).__name__
+        cost_name = f"len({cls_name})" if weights is None else "cost"
         print(
             f"Split {len(inputs):,} structures into {n_chunks:,} chunks:\n"
-            f"Mean sum(len({cls_name})) per chunk: {mean:,.1f} ± {std:,.1f}, "
+            f"Mean sum({cost_name}) per chunk: {mean:,.1f} ± {std:,.1f}, "
             f"min: {chunk_sizes.min():,.0f}, max: {chunk_sizes.max():,.0f}"
         )
 
     return chunks
+
+
+class WorkQueue:
+    """Work queue of item IDs (e.g. material IDs) in a SQLite file for dynamic load
+    balancing across job array tasks. Needs no external service, just a filesystem
+    shared by all workers.
+
+    Instead of each array task processing a fixed chunk from chunk_by_lens(), every
+    worker repeatedly claims a small batch of pending items, processes it, marks it
+    done and claims the next batch until the queue is drained, so fast workers steal
+    work that would otherwise wait for slow ones. Claims are leases: items claimed
+    by a worker that crashed or was killed become claimable again once their lease
+    expires.
+
+    Example:
+        >>> queue = WorkQueue(f"{out_dir}/queue.db", lease_seconds=3600)
+        >>> queue.add(df_wbm.index)  # safe to call from every task, skips duplicates
+        >>> for mat_ids in queue.iter_batches(worker_id=slurm_array_task_id):
+        ...     results = relax(mat_ids)  # write results to per-worker file
+        ...     queue.complete(mat_ids)
+
+    Note: SQLite relies on file locks which some network filesystems (e.g. older NFS
+    setups) implement poorly. Lustre, GPFS and NFSv4 with locking enabled work.
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        *,
+        lease_seconds: float = 3600,
+        max_attempts: int | None = 3,
+        timeout: float = 300,
+    ) -> None:
+        """Open (and create if needed) a work queue.
+
+        Args:
+            db_path (str): Path to SQLite database file on a shared filesystem.
+            lease_seconds (float): How long a worker owns claimed items before they
+                can be claimed by other workers. Should be longer than the time to
+                process one batch. Defaults to 3600.
+            max_attempts (int | None): Stop handing out items that were claimed this
+                many times without completing (e.g. structures that crash the
+                model). None means no limit. Defaults to 3.
+            timeout (float): Seconds to wait for the database lock held by other
+                workers. Defaults to 300.
+        """
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.timeout = timeout
+        if db_dir := os.path.dirname(db_path):
+            os.makedirs(db_dir, exist_ok=True)
+        with self._transaction() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS items (item_id TEXT PRIMARY KEY, "
+                "status TEXT NOT NULL DEFAULT 'pending', worker_id TEXT, "
+                "lease_expires REAL, n_attempts INTEGER NOT NULL DEFAULT 0)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS status_idx ON items (status)")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection and run an exclusive-write transaction.
+
+        BEGIN IMMEDIATE takes the write lock up front so concurrent claim() calls
+        can't select the same items before either of them updates them.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, isolation_level=None)
+        try:
+            # rollback journal instead of WAL since WAL needs shared memory which
+            # doesn't work across nodes on network filesystems
+            conn.execute("PRAGMA journal_mode=DELETE")
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def add(self, item_ids: Iterable[str]) -> int:
+        """Add items to the queue. Items already in the queue are ignored.
+
+        Args:
+            item_ids (Iterable[str]): IDs of items to process.
+
+        Returns:
+            int: Number of newly added items.
+        """
+        with self._transaction() as conn:
+            n_before = conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+            conn.executemany(
+                "INSERT OR IGNORE INTO items (item_id) VALUES (?)",
+                ((str(item_id),) for item_id in item_ids),
+            )
+            return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0] - n_before
+
+    def claim(self, worker_id: str | int, batch_size: int = 10) -> list[str]:
+        """Claim up to batch_size pending items or items with expired leases.
+
+        Args:
+            worker_id (str | int): ID of the claiming worker, e.g. the array task ID.
+            batch_size (int): Max number of items to claim. Defaults to 10.
+
+        Returns:
+            list[str]: Claimed item IDs. Empty if no work is left to claim.
+        """
+        now = time.time()
+        max_attempts = self.max_attempts or sys.maxsize
+        with self._transaction() as conn:
+            item_ids = [
+                item_id
+                for (item_id,) in conn.execute(
+                    "SELECT item_id FROM items WHERE n_attempts < ? AND (status = "
+                    "'pending' OR (status = 'claimed' AND lease_expires < ?)) "
+                    "ORDER BY rowid LIMIT ?",
+                    (max_attempts, now, batch_size),
+                )
+            ]
+            conn.executemany(
+                "UPDATE items SET status = 'claimed', worker_id = ?, "
+                "lease_expires = ?, n_attempts = n_attempts + 1 WHERE item_id = ?",
+                (
+                    (str(worker_id), now + self.lease_seconds, item_id)
+                    for item_id in item_ids
+                ),
+            )
+        return item_ids
+
+    def complete(self, item_ids: Iterable[str]) -> None:
+        """Mark items as done so they are never handed out again."""
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE items SET status = 'done', lease_expires = NULL "
+                "WHERE item_id = ?",
+                ((str(item_id),) for item_id in item_ids),
+            )
+
+    def release(self, item_ids: Iterable[str]) -> None:
+        """Return claimed items to the queue, e.g. after a recoverable error."""
+        with self._transaction() as conn:
+            conn.executemany(
+                "UPDATE items SET status = 'pending', worker_id = NULL, "
+                "lease_expires = NULL WHERE item_id = ? AND status = 'claimed'",
+                ((str(item_id),) for item_id in item_ids),
+            )
+
+    def counts(self) -> dict[str, int]:
+        """Number of pending, claimed and done items."""
+        with self._transaction() as conn:
+            counts = dict(
+                conn.execute("SELECT status, COUNT(*) FROM items GROUP BY status")
+            )
+        return {
+            status: counts.get(status, 0) for status in ("pending", "claimed", "done")
+        }
+
+    def iter_batches(
+        self, worker_id: str | int, batch_size: int = 10
+    ) -> Iterator[list[str]]:
+        """Yield batches of claimed items until no claimable work is left.
+
+        Callers should complete() each batch after writing its results. Batches not
+        completed are reclaimed by other workers after their lease expires.
+
+        Args:
+            worker_id (str | int): ID of the claiming worker, e.g. the array task ID.
+            batch_size (int): Max number of items per batch. Defaults to 10.
+
+        Yields:
+            list[str]: Claimed item IDs.
+        """
+        while item_ids := self.claim(worker_id, batch_size=batch_size):
+            yield item_ids
@@ -5,6 +5,7 @@ from collections.abc import Sequence
 import pandas as pd
 
 from matbench_discovery.enums import Model
+from matbench_discovery.models import get_model_registry
 
 
 def metrics_df_from_yaml(nested_keys: Sequence[str]) -> pd.DataFrame:
@@ -15,23 +16,20 @@ def metrics_df_from_yaml(nested_keys: Sequence[str]) -> pd.DataFrame:
     python matbench_discovery/preds/discovery.py model1 model2 ...
     where the model names are Model enum values.
     """
+    registry = get_model_registry()
     out_dict = {}
     for model in Model:
         try:
-            if not model.is_complete:
+            metadata = registry[model]
+            if metadata.get("status", "complete") != "complete":
                 continue
-            metrics = None
             combined_metrics: dict[str, float] = {}
             for nested_key in nested_keys:
-                metrics = model.metadata.get("metrics", {})
-                for sub_key in nested_key.split("."):
-                    if not isinstance(metrics, dict):
-                        break  # go straight to next model if sub_key returned non-dict
-                    metrics = metrics.get(sub_key, {})
+                metrics = registry.get_metric(model, f"metrics.{nested_key}", {})
                 if isinstance(metrics, dict):
                     combined_metrics |= metrics
             if combined_metrics:
-                out_dict[model.label] = combined_metrics
+                out_dict[metadata["model_name"]] = combined_metrics
 
         except Exception as exc:
             exc.add_note(f"{model.label=}")
@@ -6,14 +6,16 @@ paper https://arxiv.org/abs/2401.00096 (see fig. 56) and MLIP Arena
 https://huggingface.co/spaces/atomind/mlip-arena, respectively.
 """
 
+import zipfile
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from typing import Any, Self
+from typing import Any, Literal, Self
 
 import numpy as np
 
 from matbench_discovery.data import update_yaml_file
 from matbench_discovery.enums import MbdKey, Model
-from matbench_discovery.metrics.diatomics import energy, force  # noqa: F401
+from matbench_discovery.metrics.diatomics import batch, energy, force  # noqa: F401
 from matbench_discovery.metrics.diatomics.energy import (
     calc_curve_diff_auc,
     calc_energy_diff_flips,
@@ -47,6 +49,112 @@ class DiatomicCurve:
         self.distances = np.asarray(self.distances)
 
 
+@dataclass
+class DiatomicCurveArrays:
+    """Dense array layout for many diatomic curves sampled at the same distances.
+
+    Attributes:
+        formulas (list[str]): Element pair labels (e.g. "H-He"), one per row.
+        energies (np.ndarray): shape (n_pairs, n_distances)
+        forces (np.ndarray): shape (n_pairs, n_distances, n_atoms=2, 3)
+    """
+
+    formulas: list[str]
+    energies: np.ndarray
+    forces: np.ndarray
+
+    def __post_init__(self) -> None:
+        """Validate array shapes."""
+        self.formulas = [str(formula) for formula in self.formulas]
+        n_pairs = len(self.formulas)
+        if self.energies.ndim != 2 or len(self.energies) != n_pairs:
+            raise ValueError(
+                f"energies must have shape (n_pairs={n_pairs}, n_distances), "
+                f"got {self.energies.shape}"
+            )
+        if self.forces.shape[:2] != self.energies.shape or self.forces.ndim != 4:
+            raise ValueError(
+                f"forces must have shape {(*self.energies.shape, 2, 3)}, "
+                f"got {self.forces.shape}"
+            )
+
+    @property
+    def pair_index(self) -> dict[str, int]:
+        """Map of element pair labels to their row in energies and forces."""
+        return {formula: idx for idx, formula in enumerate(self.formulas)}
+
+    @classmethod
+    def from_curves(cls, curves: dict[str, DiatomicCurve]) -> Self:
+        """Stack a dict of DiatomicCurves sharing the same distances into arrays."""
+        lengths = {len(curve.energies) for curve in curves.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"All curves must have the same length, got {lengths=}")
+        n_dist = lengths.pop() if lengths else 0
+        return cls(
+            formulas=list(curves),
+            energies=np.array([curve.energies for curve in curves.values()]).reshape(
+                len(curves), n_dist
+            ),
+            forces=np.array([curve.forces for curve in curves.values()]).reshape(
+                len(curves), n_dist, 2, 3
+            ),
+        )
+
+    def to_curves(self, distances: np.ndarray) -> dict[str, DiatomicCurve]:
+        """Dict of DiatomicCurves whose energies and forces are views into the
+        arrays, i.e. no data is copied.
+        """
+        return {
+            formula: DiatomicCurve(
+                distances=distances,
+                energies=self.energies[idx],
+                forces=self.forces[idx],
+            )
+            for idx, formula in enumerate(self.formulas)
+        }
+
+
+def _load_npz_mmap(
+    file_path: str, mmap_mode: Literal["r", "r+", "c"]
+) -> dict[str, np.ndarray]:
+    """Memory-map all arrays in an uncompressed .npz file.
+
+    np.load() ignores mmap_mode for .npz archives, but arrays stored without
+    compression are contiguous bytes inside the zip file which np.memmap can map.
+    """
+    arrays: dict[str, np.ndarray] = {}
+    with zipfile.ZipFile(file_path) as zip_file, open(file_path, "rb") as file:
+        for info in zip_file.infolist():
+            key = info.filename.removesuffix(".npy")
+            if info.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(
+                    f"Cannot memory-map compressed array {key!r} in {file_path}, "
+                    "write it with compress=False"
+                )
+            # skip local file header (30 bytes + file name + extra field)
+            file.seek(info.header_offset + 26)
+            name_len, extra_len = np.frombuffer(file.read(4), dtype="<u2")
+            file.seek(info.header_offset + 30 + int(name_len) + int(extra_len))
+            version = np.lib.format.read_magic(file)
+            read_header = (
+                np.lib.format.read_array_header_1_0
+                if version == (1, 0)
+                else np.lib.format.read_array_header_2_0
+            )
+            shape, fortran_order, dtype = read_header(file)
+            if dtype.hasobject:  # e.g. formulas are stored as unicode, not objects
+                raise ValueError(f"Cannot memory-map object array {key!r}")
+            arrays[key] = np.memmap(
+                file_path,
+                dtype=dtype,
+                mode=mmap_mode,
+                offset=file.tell(),
+                shape=shape,
+                order="F" if fortran_order else "C",
+            )
+    return arrays
+
+
 @dataclass
 class DiatomicCurves:
     """Container for diatomic potential energy curves and forces of multiple
@@ -78,6 +186,82 @@ class DiatomicCurves:
             }
         return cls(**data)
 
+    @classmethod
+    def from_arrays(
+        cls,
+        distances: Sequence[float] | np.ndarray,
+        homo_nuclear: DiatomicCurveArrays,
+        hetero_nuclear: DiatomicCurveArrays | None = None,
+    ) -> Self:
+        """Create DiatomicCurves whose per-pair dicts are views into dense arrays."""
+        dists = np.asarray(distances)
+        return cls(
+            distances=dists,
+            homo_nuclear=homo_nuclear.to_curves(dists),
+            hetero_nuclear=hetero_nuclear.to_curves(dists) if hetero_nuclear else {},
+        )
+
+    def to_arrays(
+        self, kind: Literal["homo_nuclear", "hetero_nuclear"] = "homo_nuclear"
+    ) -> DiatomicCurveArrays:
+        """Stack homo- or hetero-nuclear curves into a DiatomicCurveArrays."""
+        return DiatomicCurveArrays.from_curves(getattr(self, kind))
+
+    def to_npz(self, file_path: str, *, compress: bool = False) -> None:
+        """Save curves in dense array layout to a .npz file.
+
+        Args:
+            file_path (str): Path to write to.
+            compress (bool): Whether to zip-compress arrays. Compressed files are
+                smaller but can't be memory-mapped by from_npz(). Defaults to False.
+        """
+        arrays = {"distances": self.distances}
+        for kind in ("homo_nuclear", "hetero_nuclear"):
+            if kind == "hetero_nuclear" and not self.hetero_nuclear:
+                continue
+            curve_arrays = self.to_arrays(kind)  # type: ignore[arg-type]
+            arrays[f"{kind}.formulas"] = np.array(curve_arrays.formulas, dtype=str)
+            arrays[f"{kind}.energies"] = curve_arrays.energies
+            arrays[f"{kind}.forces"] = curve_arrays.forces
+
+        save_func = np.savez_compressed if compress else np.savez
+        with open(file_path, mode="wb") as file:  # avoid np.savez adding .npz suffix
+            save_func(file, **arrays)
+
+    @classmethod
+    def from_npz(
+        cls, file_path: str, *, mmap_mode: Literal["r", "r+", "c"] | None = None
+    ) -> Self:
+        """Load curves written by to_npz().
+
+        Args:
+            file_path (str): Path to .npz file.
+            mmap_mode ("r" | "r+" | "c" | None): If set, energies and forces are
+                memory-mapped instead of read into memory, so only the pairs that
+                are accessed get loaded from disk. Requires the file to have been
+                written with compress=False. Defaults to None.
+
+        Returns:
+            DiatomicCurves: With homo_nuclear and hetero_nuclear dicts whose
+                DiatomicCurve energies and forces are views into the loaded arrays.
+        """
+        if mmap_mode:
+            arrays = _load_npz_mmap(file_path, mmap_mode)
+        else:
+            with np.load(file_path) as npz_file:
+                arrays = dict(npz_file)
+
+        curve_arrays = {
+            kind: DiatomicCurveArrays(
+                formulas=arrays[f"{kind}.formulas"].tolist(),
+                energies=arrays[f"{kind}.energies"],
+                forces=arrays[f"{kind}.forces"],
+            )
+            for kind in ("homo_nuclear", "hetero_nuclear")
+            if f"{kind}.formulas" in arrays
+        }
+        return cls.from_arrays(np.asarray(arrays["distances"]), **curve_arrays)
+
 
 def calc_diatomic_metrics(
     ref_curves: DiatomicCurves | None,
@@ -223,6 +407,128 @@ def calc_diatomic_metrics(
     return results
 
 
+def calc_diatomic_metrics_batch(
+    ref_curves: DiatomicCurves | None,
+    pred_curves: DiatomicCurves,
+    metrics: dict[str, dict[str, Any]] | None = None,
+    *,
+    interpolate: bool | int = False,
+) -> dict[str, dict[str, float]]:
+    """Vectorized version of calc_diatomic_metrics() with the same arguments and
+    return value.
+
+    Stacks all homo-nuclear curves into dense arrays, sorts and validates the
+    distance grid once and computes every metric for all element pairs at once
+    (see metrics.diatomics.batch).
+
+    Args:
+        ref_curves (DiatomicCurves | None): Reference energy curves for each element.
+            If None, only metrics that don't require reference data will be calculated.
+        pred_curves (DiatomicCurves): Predicted energy curves for each element.
+        metrics (dict[str, dict[str, Any]] | None): Map of metric names to
+            dictionaries of keyword arguments for each metric function. If None, uses
+            all metrics with default parameters.
+        interpolate (bool | int): If False (default), uses the provided points directly.
+            If True, uses default number of points for interpolation.
+            If an integer, uses that many points for interpolation.
+
+    Returns:
+        dict[str, dict[str, float]]: Map of element symbols to metric dicts with keys
+            being the metric names and values being the metric values.
+    """
+    if unknown_metrics := set(metrics or {}) - set(MbdKey):
+        raise ValueError(f"{unknown_metrics=}. Valid metrics=")
+
+    metrics = {key: dict(kwargs) for key, kwargs in (metrics or {}).items()}
+    for key in (
+        MbdKey.norm_auc,
+        MbdKey.energy_mae,
+        MbdKey.force_mae,
+        MbdKey.conservation,
+    ):
+        metrics.setdefault(key, {}).setdefault("interpolate", interpolate)
+
+    if not pred_curves.homo_nuclear:
+        return {}
+    pred_arrays = pred_curves.to_arrays()
+    formulas = pred_arrays.formulas
+    seps_pred, e_pred, f_pred = batch.validate_curve_grid(
+        pred_curves.distances,
+        pred_arrays.energies,
+        pred_arrays.forces,
+        labels=formulas,
+    )
+    results: dict[str, dict[str, np.ndarray]] = {}
+
+    # metrics that need reference curves, only for pairs present in both
+    ref_formulas = [
+        formula
+        for formula in formulas
+        if ref_curves and formula in ref_curves.homo_nuclear
+    ]
+    if ref_curves and ref_formulas:
+        ref_arrays = DiatomicCurveArrays.from_curves(
+            {formula: ref_curves.homo_nuclear[formula] for formula in ref_formulas}
+        )
+        seps_ref, e_ref, f_ref = batch.validate_curve_grid(
+            ref_curves.distances,
+            ref_arrays.energies,
+            ref_arrays.forces,
+            labels=ref_formulas,
+        )
+        if not np.array_equal(seps_pred, seps_ref) and not interpolate:
+            raise ValueError(
+                f"Reference and predicted distances must be same when "
+                f"{interpolate=}\n{seps_pred=}, {seps_ref=}"
+            )
+        pred_idx = [pred_arrays.pair_index[formula] for formula in ref_formulas]
+        for key, func, ref_vals, pred_vals in (
+            (MbdKey.norm_auc, batch.calc_curve_diff_auc_batch, e_ref, e_pred),
+            (MbdKey.energy_mae, batch.calc_energy_mae_batch, e_ref, e_pred),
+            (MbdKey.force_mae, batch.calc_force_mae_batch, f_ref, f_pred),
+        ):
+            vals = func(
+                seps_ref, ref_vals, seps_pred, pred_vals[pred_idx], **metrics[key]
+            )
+            results[key] = dict(zip(ref_formulas, vals, strict=True))
+
+    for key, func, args in (
+        (MbdKey.smoothness, batch.calc_second_deriv_smoothness_batch, (e_pred,)),
+        (MbdKey.tortuosity, batch.calc_tortuosity_batch, (e_pred,)),
+        (MbdKey.energy_diff_flips, batch.calc_energy_diff_flips_batch, (e_pred,)),
+        (
+            MbdKey.energy_grad_norm_max,
+            batch.calc_energy_grad_norm_max_batch,
+            (e_pred,),
+        ),
+        (MbdKey.energy_jump, batch.calc_energy_jump_batch, (e_pred,)),
+        (
+            MbdKey.conservation,
+            batch.calc_conservation_deviation_batch,
+            (e_pred, f_pred),
+        ),
+        (MbdKey.force_flips, batch.calc_force_flips_batch, (f_pred,)),
+        (
+            MbdKey.force_total_variation,
+            batch.calc_force_total_variation_batch,
+            (f_pred,),
+        ),
+        (MbdKey.force_jump, batch.calc_force_jump_batch, (f_pred,)),
+    ):
+        vals = func(seps_pred, *args, **metrics.get(key, {}))
+        results[key] = dict(zip(formulas, vals, strict=True))
+
+    # same nesting and metric order as calc_diatomic_metrics()
+    return {
+        formula: {
+            key: float(per_pair[formula])
+            for key, per_pair in results.items()
+            if formula in per_pair
+        }
+        for formula in formulas
+    }
+
+
 def write_metrics_to_yaml(
     model: Model, metrics: dict[str, dict[str, float]]
 ) -> dict[str, float]:
@@ -0,0 +1,276 @@
+"""Vectorized diatomic curve metrics for all element pairs at once.
+
+Same metrics as in energy.py and force.py but operating on stacked arrays of shape
+(n_pairs, n_distances) for energies and (n_pairs, n_distances, n_atoms, 3) for forces
+sampled on one shared distance grid, so the grid is sorted and validated only once
+instead of once per pair and metric.
+"""
+
+from collections.abc import Sequence
+
+import numpy as np
+from numpy.typing import ArrayLike
+
+from matbench_discovery.metrics.diatomics.energy import interpolate_curves
+
+
+def validate_curve_grid(
+    seps: ArrayLike, *arrays: np.ndarray, labels: Sequence[str] | None = None
+) -> tuple[np.ndarray, ...]:
+    """Validate a shared distance grid and sort stacked curves along it.
+
+    Applies the same checks as _validate_diatomic_curve() once for all curves.
+
+    Args:
+        seps (ArrayLike): Interatomic distances of shape (n_distances,).
+        *arrays (np.ndarray): Stacked energies or forces with the distance axis at
+            position 1, i.e. (n_pairs, n_distances, ...).
+        labels (Sequence[str] | None): Pair labels used in error messages.
+
+    Returns:
+        tuple[np.ndarray, ...]: Distances sorted in ascending order followed by all
+            arrays sorted the same way along axis 1.
+
+    Raises:
+        ValueError: If the grid has fewer than 2 points, contains NaN, inf or
+            duplicate values, or any curve has a mismatched length or non-finite
+            values.
+    """
+    seps = np.asarray(seps, dtype=float)
+    if len(seps) < 2:
+        raise ValueError(f"Input must have at least 2 points, got {len(seps)=}")
+    if not np.isfinite(seps).all():
+        raise ValueError(f"Distances contain NaN or infinite values: {seps=}")
+    if len(np.unique(seps)) != len(seps):
+        raise ValueError(f"Distances contain {len(seps) - len(np.unique(seps))} dupes")
+
+    sort_idx = np.argsort(seps)
+    sorted_arrays = []
+    for arr in map(np.asarray, arrays):
+        if arr.ndim < 2 or arr.shape[1] != len(seps):
+            raise ValueError(f"{arr.shape=} must be (n_pairs, {len(seps)}, ...)")
+        if not (finite := np.isfinite(arr).reshape(len(arr), -1).all(axis=1)).all():
+            bad = [labels[idx] for idx in np.flatnonzero(~finite)] if labels else None
+            raise ValueError(
+                f"{int((~finite).sum())} curves contain NaN or infinite values: {bad}"
+            )
+        sorted_arrays += [arr[:, sort_idx]]
+
+    return seps[sort_idx], *sorted_arrays
+
+
+def _sign_flip_pairs(
+    values: np.ndarray, signs: np.ndarray
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Find consecutive non-zero entries per row whose signs differ.
+
+    Args:
+        values (np.ndarray): Values of shape (n_rows, n_cols).
+        signs (np.ndarray): Signs of values (or thresholded values), same shape.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: Row index of each flip and the
+            values before and after the flip (skipping zero-sign entries).
+    """
+    rows, cols = np.nonzero(signs)  # row-major order, i.e. sorted by row then col
+    nz_signs, nz_vals = signs[rows, cols], values[rows, cols]
+    is_flip = (rows[1:] == rows[:-1]) & (nz_signs[1:] != nz_signs[:-1])
+    return rows[1:][is_flip], nz_vals[:-1][is_flip], nz_vals[1:][is_flip]
+
+
+def _count_sign_flips(values: np.ndarray, threshold: float | None = None) -> np.ndarray:
+    """Count sign changes per row ignoring entries with |value| < threshold."""
+    signs = np.sign(values)
+    if threshold is not None:
+        signs[np.abs(values) < threshold] = 0
+    flip_rows, _, _ = _sign_flip_pairs(values, signs)
+    return np.bincount(flip_rows, minlength=len(values)).astype(float)
+
+
+def _sum_flip_jumps(diffs: np.ndarray, threshold: float | None = None) -> np.ndarray:
+    """Sum of |diff| on both sides of every sign flip in diffs, per row."""
+    diffs = diffs.copy()
+    if threshold is not None:
+        diffs[np.abs(diffs) < threshold] = 0
+    flip_rows, before, after = _sign_flip_pairs(diffs, np.sign(diffs))
+    weights = np.abs(before) + np.abs(after)
+    return np.bincount(flip_rows, weights=weights, minlength=len(diffs))
+
+
+def calc_second_deriv_smoothness_batch(
+    seps: np.ndarray, energies: np.ndarray
+) -> np.ndarray:
+    """RMS of second derivative per curve. See calc_second_deriv_smoothness()."""
+    d2y = np.gradient(np.gradient(energies, seps, axis=1), seps, axis=1)
+    return np.sqrt(np.mean(d2y**2, axis=1))
+
+
+def calc_tortuosity_batch(seps: np.ndarray, energies: np.ndarray) -> np.ndarray:  # noqa: ARG001
+    """Energy tortuosity per curve. See calc_tortuosity()."""
+    tv_energy = np.abs(np.diff(energies, axis=1)).sum(axis=1)
+    e_min = energies.min(axis=1)
+    direct_energy_diff = np.abs(energies[:, 0] - e_min) + np.abs(
+        energies[:, -1] - e_min
+    )
+    return tv_energy / direct_energy_diff
+
+
+def calc_energy_diff_flips_batch(seps: np.ndarray, energies: np.ndarray) -> np.ndarray:  # noqa: ARG001
+    """Number of energy difference sign flips per curve. See
+    calc_energy_diff_flips().
+    """
+    return _count_sign_flips(np.diff(energies, axis=1), threshold=1e-3)
+
+
+def calc_energy_grad_norm_max_batch(
+    seps: np.ndarray, energies: np.ndarray
+) -> np.ndarray:
+    """Max absolute energy gradient per curve. See calc_energy_grad_norm_max()."""
+    return np.abs(np.gradient(energies, seps, axis=1)).max(axis=1)
+
+
+def calc_energy_jump_batch(seps: np.ndarray, energies: np.ndarray) -> np.ndarray:  # noqa: ARG001
+    """Energy jump at sign flips per curve. See calc_energy_jump()."""
+    return _sum_flip_jumps(np.diff(energies, axis=1), threshold=1e-3)
+
+
+def calc_force_flips_batch(
+    seps: np.ndarray,  # noqa: ARG001
+    forces: np.ndarray,
+    threshold: float = 1e-2,
+) -> np.ndarray:
+    """Number of force direction changes per curve. See calc_force_flips()."""
+    return _count_sign_flips(forces[:, :, 0, 0], threshold=threshold)
+
+
+def calc_force_total_variation_batch(
+    seps: np.ndarray,  # noqa: ARG001
+    forces: np.ndarray,
+) -> np.ndarray:
+    """Total variation in forces per curve. See calc_force_total_variation()."""
+    return np.abs(np.diff(forces[:, :, 0, 0], axis=1)).sum(axis=1)
+
+
+def calc_force_jump_batch(seps: np.ndarray, forces: np.ndarray) -> np.ndarray:  # noqa: ARG001
+    """Force jump at sign flips per curve. See calc_force_jump()."""
+    return _sum_flip_jumps(np.diff(forces[:, :, 0, 0], axis=1))
+
+
+def calc_conservation_deviation_batch(
+    seps: np.ndarray,
+    energies: np.ndarray,
+    forces: np.ndarray,
+    *,
+    interpolate: bool | int = False,
+) -> np.ndarray:
+    """Mean absolute deviation between forces and -dE/dr per curve. See
+    calc_conservation_deviation().
+    """
+    if interpolate:
+        n_points = 100 if interpolate is True else int(interpolate)
+        seps_interp = np.linspace(seps.min(), seps.max(), n_points)
+        energies = interpolate_curves(seps_interp, seps, energies, axis=1)
+        forces = interpolate_curves(seps_interp, seps, forces, axis=1)
+        seps = seps_interp
+
+    energy_grad = np.gradient(energies, seps, axis=1)
+    return np.abs(forces + energy_grad[:, :, None, None]).mean(axis=(1, 2, 3))
+
+
+def _check_same_grid(
+    seps_ref: np.ndarray, seps_pred: np.ndarray, *, interpolate: bool | int
+) -> None:
+    """Raise if distances differ and interpolation is disabled."""
+    if not interpolate and not np.array_equal(seps_ref, seps_pred):
+        raise ValueError(
+            f"Reference and predicted distances must be same when {interpolate=}\n"
+            f"{seps_ref=}, {seps_pred=}"
+        )
+
+
+def calc_curve_diff_auc_batch(
+    seps_ref: np.ndarray,
+    e_ref: np.ndarray,
+    seps_pred: np.ndarray,
+    e_pred: np.ndarray,
+    *,
+    seps_range: tuple[float | None, float | None] = (None, None),
+    normalize: bool = True,
+    interpolate: bool | int = False,
+) -> np.ndarray:
+    """Area under absolute curve difference per pair. See calc_curve_diff_auc()."""
+    _check_same_grid(seps_ref, seps_pred, interpolate=interpolate)
+
+    data_min = max(seps_ref.min(), seps_pred.min())
+    data_max = min(seps_ref.max(), seps_pred.max())
+    seps_min, seps_max = seps_range
+    seps_min = data_min if seps_min is None else seps_min
+    seps_max = data_max if seps_max is None else seps_max
+    if seps_min >= seps_max:
+        raise ValueError(f"Invalid range: {seps_min=} >= {seps_max=}")
+
+    if interpolate:
+        n_points = 100 if interpolate is True else interpolate
+        seps_interp = np.linspace(seps_min, seps_max, n_points)
+        diff = np.abs(
+            interpolate_curves(seps_interp, seps_ref, e_ref, axis=1)
+            - interpolate_curves(seps_interp, seps_pred, e_pred, axis=1)
+        )
+        auc = np.trapezoid(diff, seps_interp, axis=1)
+    else:
+        mask = (seps_ref >= seps_min) & (seps_ref <= seps_max)
+        if not np.any(mask):
+            raise ValueError(f"No points within range {seps_min=}..{seps_max=}")
+        seps_ref, e_ref, e_pred = seps_ref[mask], e_ref[:, mask], e_pred[:, mask]
+        auc = np.trapezoid(np.abs(e_ref - e_pred), seps_ref, axis=1)
+
+    if normalize:
+        # bounding box area of reference curves, don't normalize flat curves
+        box_area = np.ptp(seps_ref) * np.ptp(e_ref, axis=1)
+        auc = np.where(box_area > 0, auc / np.where(box_area > 0, box_area, 1), auc)
+
+    return np.abs(auc)
+
+
+def calc_energy_mae_batch(
+    seps_ref: np.ndarray,
+    e_ref: np.ndarray,
+    seps_pred: np.ndarray,
+    e_pred: np.ndarray,
+    *,
+    interpolate: bool | int = False,
+) -> np.ndarray:
+    """Energy MAE per pair. See calc_energy_mae()."""
+    _check_same_grid(seps_ref, seps_pred, interpolate=interpolate)
+
+    if interpolate:
+        n_points = 100 if interpolate is True else interpolate
+        seps_interp = np.linspace(
+            max(seps_ref.min(), seps_pred.min()),
+            min(seps_ref.max(), seps_pred.max()),
+            n_points,
+        )
+        e_ref = interpolate_curves(seps_interp, seps_ref, e_ref, axis=1)
+        e_pred = interpolate_curves(seps_interp, seps_pred, e_pred, axis=1)
+
+    return np.abs(e_ref - e_pred).mean(axis=1)
+
+
+def calc_force_mae_batch(
+    seps_ref: np.ndarray,
+    f_ref: np.ndarray,
+    seps_pred: np.ndarray,
+    f_pred: np.ndarray,
+    *,
+    interpolate: bool | int = False,
+) -> np.ndarray:
+    """Force MAE per pair. See calc_force_mae()."""
+    _check_same_grid(seps_ref, seps_pred, interpolate=interpolate)
+
+    if interpolate:
+        n_points = 100 if interpolate is True else interpolate
+        seps_interp = np.logspace(1, -1, n_points)
+        f_ref = interpolate_curves(seps_interp, seps_ref, f_ref, axis=1)
+        f_pred = interpolate_curves(seps_interp, seps_pred, f_pred, axis=1)
+
+    return np.abs(f_ref - f_pred).mean(axis=(1, 2, 3))
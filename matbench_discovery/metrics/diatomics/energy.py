@@ -52,6 +52,39 @@ def _validate_diatomic_curve(
     return xs, ys
 
 
+def interpolate_curves(
+    x_new: ArrayLike, xp: ArrayLike, fp: ArrayLike, *, axis: int = 0
+) -> np.ndarray:
+    """Linearly interpolate arrays of any shape along one axis in a single
+    vectorized operation. Same as np.interp applied to every 1D slice of fp along
+    axis (incl. clamping to the end values outside the range of xp), but without
+    Python loops over the other dimensions.
+
+    Args:
+        x_new (ArrayLike): x-coordinates to interpolate at, any order.
+        xp (ArrayLike): Increasing x-coordinates of the data points.
+        fp (ArrayLike): Data values with len(xp) entries along axis, e.g. forces of
+            shape (n_distances, n_atoms, 3) or energies of shape (n_pairs,
+            n_distances) with axis=1.
+        axis (int): Axis of fp that xp samples. Defaults to 0.
+
+    Returns:
+        np.ndarray: fp interpolated at x_new, with len(x_new) entries along axis.
+    """
+    x_new, xp = np.asarray(x_new, dtype=float), np.asarray(xp, dtype=float)
+    fp = np.moveaxis(np.asarray(fp, dtype=float), axis, 0)
+    if len(xp) != len(fp):
+        raise ValueError(f"{len(xp)=} != {len(fp)=} (size of fp along {axis=})")
+
+    right_idx = np.clip(np.searchsorted(xp, x_new, side="right"), 1, len(xp) - 1)
+    x_left, x_right = xp[right_idx - 1], xp[right_idx]
+    weights = np.clip((x_new - x_left) / (x_right - x_left), 0, 1)
+    weights = weights.reshape(-1, *[1] * (fp.ndim - 1))
+
+    f_left, f_right = fp[right_idx - 1], fp[right_idx]
+    return np.moveaxis(f_left + weights * (f_right - f_left), 0, axis)
+
+
 def calc_curve_diff_auc(
     seps_ref: ArrayLike,
     e_ref: ArrayLike,
@@ -3,7 +3,10 @@
 import numpy as np
 from numpy.typing import ArrayLike
 
-from matbench_discovery.metrics.diatomics.energy import _validate_diatomic_curve
+from matbench_discovery.metrics.diatomics.energy import (
+    _validate_diatomic_curve,
+    interpolate_curves,
+)
 
 
 def calc_force_mae(
@@ -51,17 +54,9 @@ def calc_force_mae(
     n_points = 100 if interpolate is True else interpolate
     seps_interp = np.logspace(1, -1, n_points)
 
-    # Interpolate each component separately
-    f_ref_interp = np.zeros((len(seps_interp), *f_ref.shape[1:]))
-    f_pred_interp = np.zeros((len(seps_interp), *f_pred.shape[1:]))
-    for atom_idx in range(f_ref.shape[1]):
-        for dim in range(3):
-            f_ref_interp[:, atom_idx, dim] = np.interp(
-                seps_interp, seps_ref, f_ref[:, atom_idx, dim]
-            )
-            f_pred_interp[:, atom_idx, dim] = np.interp(
-                seps_interp, seps_pred, f_pred[:, atom_idx, dim]
-            )
+    # Interpolate all atoms and force components at once
+    f_ref_interp = interpolate_curves(seps_interp, seps_ref, f_ref)
+    f_pred_interp = interpolate_curves(seps_interp, seps_pred, f_pred)
 
     # Calculate MAE
     return float(np.mean(np.abs(f_ref_interp - f_pred_interp)))
@@ -173,13 +168,8 @@ def calc_conservation_deviation(
         # Interpolate energies
         energies_interp = np.interp(seps_interp, seps, energies)
 
-        # Interpolate forces (only x-component for simplicity)
-        forces_interp = np.zeros((len(seps_interp), forces.shape[1], forces.shape[2]))
-        for atom_idx in range(forces.shape[1]):
-            for dim in range(forces.shape[2]):
-                forces_interp[:, atom_idx, dim] = np.interp(
-                    seps_interp, seps, forces[:, atom_idx, dim]
-                )
+        # Interpolate all atoms and force components at once
+        forces_interp = interpolate_curves(seps_interp, seps, forces)
 
         # Calculate energy gradient using central differences on interpolated data
         energy_grad = np.gradient(energies_interp, seps_interp)
@@ -16,8 +16,11 @@ implement parallelization across input structures which allows scaling thermal
 conductivity metrics to larger test sets.
 """
 
+import os
 import traceback
 import warnings
+from collections.abc import Mapping, Sequence
+from typing import Any
 
 import numpy as np
 import pandas as pd
@@ -28,7 +31,11 @@ from matbench_discovery.phonons import thermal_conductivity as ltc
 
 
 def calc_kappa_metrics_from_dfs(
-    df_pred: pd.DataFrame, df_true: pd.DataFrame
+    df_pred: pd.DataFrame,
+    df_true: pd.DataFrame,
+    *,
+    temp_idx: int | None = 0,
+    true_mode_kappa_avgs: pd.Series | None = None,
 ) -> pd.DataFrame:
     """Compute per-material thermal conductivity predictions metrics from 2 dataframes.
 
@@ -43,6 +50,13 @@ def calc_kappa_metrics_from_dfs(
             structural information.
         df_true: DataFrame containing DFT reference calculations with the
             same structure as df_pred.
+        temp_idx: Index of the temperature to report SRD, SRE and SRME for.
+            Defaults to 0 (300 K for the phononDB PBE 103 reference). If None, the
+            metric columns hold arrays of shape (n_temps,) with values for all
+            temperatures.
+        true_mode_kappa_avgs: Precomputed mode-resolved DFT kappa averages as
+            returned by calc_mode_kappa_tot_avgs(df_true). Avoids recomputing them
+            when evaluating many models against the same reference.
 
     Returns:
         pd.DataFrame: df_pred with additional columns for benchmark metrics:
@@ -62,18 +76,27 @@ def calc_kappa_metrics_from_dfs(
         / (df_pred[MbdKey.kappa_tot_avg] + df_true[MbdKey.kappa_tot_avg])
     )
 
-    # turn temperature list to the first temperature (300K) TODO: allow multiple
-    # temperatures to be tested
-    df_pred[Key.srd] = df_pred[Key.srd].map(
-        lambda x: x if isinstance(x, float) else x[0]
-    )
-
     # We substitute NaN values with 0 predicted conductivity, yielding -2 for SRD
-    df_pred[Key.srd] = df_pred[Key.srd].fillna(-2)
-
-    df_pred[Key.sre] = df_pred[Key.srd].abs()
+    if temp_idx is None:
+        df_pred[Key.srd] = df_pred[Key.srd].map(
+            lambda x: np.where(np.isnan(x), -2, np.atleast_1d(x).astype(float))
+        )
+        df_pred[Key.sre] = df_pred[Key.srd].map(np.abs)
+    else:
+        df_pred[Key.srd] = df_pred[Key.srd].map(
+            lambda x: x if isinstance(x, float) else np.atleast_1d(x)[temp_idx]
+        )
+        df_pred[Key.srd] = df_pred[Key.srd].fillna(-2)
+        df_pred[Key.sre] = df_pred[Key.srd].abs()
 
-    df_pred[Key.srme] = calc_kappa_srme_dataframes(df_pred, df_true)
+    srme_per_temp = calc_kappa_srme_per_temp(
+        df_pred, df_true, true_mode_kappa_avgs=true_mode_kappa_avgs
+    )
+    df_pred[Key.srme] = (
+        srme_per_temp
+        if temp_idx is None
+        else [float(srmes[temp_idx]) for srmes in srme_per_temp]
+    )
 
     df_pred[MbdKey.true_kappa_tot_avg] = df_true[MbdKey.kappa_tot_avg]
 
@@ -109,8 +132,219 @@ def calculate_kappa_avg(kappa: np.ndarray) -> np.ndarray:
         return np.array([np.nan])
 
 
+def get_mode_kappa_tot_avg(
+    kappas: Mapping[str, Any], label: str = "preds"
+) -> np.ndarray:
+    """Get the mode-resolved directionally averaged conductivity of a single material.
+
+    Tries different data sources in order of preference: precomputed
+    mode_kappa_tot_avg, mode_kappa_tot_rta or its individual components
+    (kappa_p_rta, kappa_c, heat_capacity).
+
+    Args:
+        kappas: Series or dict with mode-resolved conductivity data of one material.
+        label: Name of the data source used in error messages. Defaults to "preds".
+
+    Returns:
+        np.ndarray: Mode-resolved averaged conductivities with temperature as first
+            axis, typically of shape (T, q-points, bands).
+
+    Raises:
+        ValueError: If none of the supported data sources are present.
+    """
+    keys = set(kappas.keys())
+    if MbdKey.mode_kappa_tot_avg in keys:
+        mode_kappa_tot_avg = kappas[MbdKey.mode_kappa_tot_avg]
+    elif MbdKey.mode_kappa_tot_rta in keys:
+        mode_kappa_tot_avg = calculate_kappa_avg(kappas[MbdKey.mode_kappa_tot_rta])
+    elif {MbdKey.kappa_p_rta, MbdKey.kappa_c, Key.heat_capacity} <= keys:
+        mode_kappa_tot_avg = calculate_kappa_avg(
+            ltc.calc_mode_kappa_tot(
+                kappas[MbdKey.kappa_p_rta],
+                kappas[MbdKey.kappa_c],
+                kappas[Key.heat_capacity],
+            )
+        )
+    else:
+        raise ValueError(
+            f"Neither mode_kappa_tot_avg, mode_kappa_tot nor individual kappa\n"
+            f"components found in {label}, got\n{keys}"
+        )
+    return np.asarray(mode_kappa_tot_avg)
+
+
+def calc_mode_kappa_tot_avgs(
+    df_kappa: pd.DataFrame, *, cache_path: str | None = None, source_key: str = ""
+) -> pd.Series:
+    """Precompute mode-resolved averaged conductivities for all materials in a
+    dataframe. Useful for the DFT reference which is shared by all models.
+
+    Args:
+        df_kappa (pd.DataFrame): Mode-resolved conductivity data, one row per material.
+        cache_path (str | None): .npz file to load results from if it exists and was
+            written for the same source_key or to (over)write them to otherwise (see
+            write_kappa_npz). Defaults to None (no caching).
+        source_key (str): Identifies the data df_kappa was loaded from (e.g. size
+            and mtime of the source file, see get_file_source_key) to detect stale
+            caches. Defaults to "".
+
+    Returns:
+        pd.Series: Arrays of mode-resolved averaged conductivities with same index as
+            df_kappa.
+    """
+    if cache_path and read_kappa_npz_source_key(cache_path) == source_key:
+        return read_kappa_npz(cache_path)[MbdKey.mode_kappa_tot_avg]
+
+    mode_kappa_avgs = pd.Series(
+        [
+            get_mode_kappa_tot_avg(record, label=str(idx))
+            for idx, record in zip(
+                df_kappa.index, df_kappa.to_dict("records"), strict=True
+            )
+        ],
+        index=df_kappa.index,
+        dtype=object,
+        name=MbdKey.mode_kappa_tot_avg,
+    )
+    if cache_path:
+        write_kappa_npz(mode_kappa_avgs.to_frame(), cache_path, source_key=source_key)
+
+    return mode_kappa_avgs
+
+
+def _get_failed_srme_mask(df_pred: pd.DataFrame, df_true: pd.DataFrame) -> np.ndarray:
+    """Get mask of materials with imaginary phonon modes or broken symmetry which
+    are assigned the highest possible SRME of 2.
+    """
+    failed = np.zeros(len(df_pred), dtype=bool)
+    if Key.has_imag_ph_modes in df_pred:
+        failed |= df_pred[Key.has_imag_ph_modes].map(lambda x: x is True).to_numpy()
+
+    if Key.final_spg_num not in df_pred:
+        return failed
+
+    # use truthiness of space group numbers (incl. NaN) like row.get() checks would
+    final_spg = df_pred[Key.final_spg_num].to_numpy(dtype=object)
+    has_final = np.array([bool(spg) for spg in final_spg], dtype=bool)
+    if Key.init_spg_num in df_pred:
+        init_spg = df_pred[Key.init_spg_num].to_numpy(dtype=object)
+    else:
+        init_spg = np.full(len(df_pred), None, dtype=object)
+    has_init = np.array([bool(spg) for spg in init_spg], dtype=bool)
+    if Key.spg_num in df_true:
+        true_spg = df_true[Key.spg_num].to_numpy(dtype=object)
+    else:
+        true_spg = np.full(len(df_pred), None, dtype=object)
+
+    ref_spg = np.where(has_init, init_spg, true_spg)
+    spg_changed = np.array(
+        [final != ref for final, ref in zip(final_spg, ref_spg, strict=True)],
+        dtype=bool,
+    )
+    return failed | (has_final & spg_changed)
+
+
+def calc_kappa_srme_per_temp(
+    df_pred: pd.DataFrame,
+    df_true: pd.DataFrame,
+    *,
+    true_mode_kappa_avgs: pd.Series | None = None,
+) -> list[np.ndarray]:
+    """Calculate the Symmetric Relative Mean Error (SRME) for all materials at all
+    temperatures.
+
+    Equivalent to calling calc_kappa_srme() on each pair of rows, but the
+    mode-resolved absolute errors of all materials are reduced in a single vectorized
+    pass over the concatenated mode arrays.
+
+    Args:
+        df_pred (pd.DataFrame): ML predictions including mode-resolved properties
+        df_true (pd.DataFrame): DFT reference data including mode-resolved properties.
+            Must contain all index labels of df_pred.
+        true_mode_kappa_avgs (pd.Series | None): Precomputed mode-resolved DFT
+            averages from calc_mode_kappa_tot_avgs(df_true). Computed on the fly for
+            the materials in df_pred if None.
+
+    Returns:
+        list[np.ndarray]: SRME values of shape (n_temps,) for each material, where
+            materials with imaginary frequencies, broken symmetry or missing data get
+            SRME=2 at all temperatures.
+    """
+    df_true = df_true.loc[df_pred.index]
+    failed = _get_failed_srme_mask(df_pred, df_true)
+
+    pred_records = df_pred.to_dict("records")
+    true_records = df_true.to_dict("records")
+
+    srmes: list[np.ndarray | None] = [None] * len(df_pred)
+    abs_errs, seg_lens, denominators, weight_sums, valid_idx = [], [], [], [], []
+    for idx, (row_pred, row_true) in enumerate(
+        zip(pred_records, true_records, strict=True)
+    ):
+        kappa_avg_true = np.atleast_1d(np.asarray(row_true[MbdKey.kappa_tot_avg]))
+        n_temps = kappa_avg_true.size
+        if failed[idx]:
+            srmes[idx] = np.full(n_temps, 2.0)
+            continue
+
+        if np.any(np.isnan(kappa_avg_true)):
+            raise ValueError("found NaNs in kappa_tot_avg reference values")
+        if (  # return highest possible SRME=2 if any of these conditions are met:
+            # only have NaN averaged kappa preds
+            np.all(np.isnan(row_pred[MbdKey.kappa_tot_avg]))
+            # some mode-resolved kappa preds are NaN
+            or np.any(np.isnan(row_pred[MbdKey.kappa_tot_rta]))
+            # some mode weights are NaN
+            or np.any(np.isnan(row_pred[Key.mode_weights]))
+        ):
+            srmes[idx] = np.full(n_temps, 2.0)
+            continue
+
+        mode_avg_pred = get_mode_kappa_tot_avg(row_pred, label="preds")
+        if true_mode_kappa_avgs is None:
+            mode_avg_true = get_mode_kappa_tot_avg(row_true, label="true")
+        else:
+            mode_avg_true = np.asarray(true_mode_kappa_avgs.loc[df_pred.index[idx]])
+
+        # temperature is the leading axis, all other axes are modes
+        mode_avg_pred, mode_avg_true = np.broadcast_arrays(
+            np.atleast_1d(mode_avg_pred), np.atleast_1d(mode_avg_true)
+        )
+        n_temps = len(mode_avg_pred)
+        abs_errs += [np.ravel(mode_avg_pred - mode_avg_true)]
+        seg_lens += [np.full(n_temps, mode_avg_pred.size // max(n_temps, 1))]
+        denominators += [np.asarray(row_pred[MbdKey.kappa_tot_avg]) + kappa_avg_true]
+        weight_sums += [np.asarray(row_pred[Key.mode_weights]).sum()]
+        valid_idx += [idx]
+
+    if valid_idx:
+        all_seg_lens = np.concatenate(seg_lens)
+        seg_ids = np.repeat(np.arange(len(all_seg_lens)), all_seg_lens)
+        # sum absolute mode errors per (material, temperature) segment in one pass
+        abs_err_sums = np.bincount(
+            seg_ids,
+            weights=np.abs(np.concatenate(abs_errs)),
+            minlength=len(all_seg_lens),
+        )
+
+        split_at = np.cumsum([len(lens) for lens in seg_lens])[:-1]
+        for idx, err_sum, weight_sum, denominator in zip(
+            valid_idx,
+            np.split(abs_err_sums, split_at),
+            weight_sums,
+            denominators,
+            strict=True,
+        ):
+            srmes[idx] = np.atleast_1d(2 * (err_sum / weight_sum) / denominator)
+
+    return srmes  # type: ignore[return-value]
+
+
 def calc_kappa_srme_dataframes(
-    df_pred: pd.DataFrame, df_true: pd.DataFrame
+    df_pred: pd.DataFrame,
+    df_true: pd.DataFrame,
+    *,
+    true_mode_kappa_avgs: pd.Series | None = None,
 ) -> list[float]:
     """Calculate the Symmetric Relative Mean Error (SRME) for each material.
 
@@ -127,34 +361,21 @@ def calc_kappa_srme_dataframes(
     Args:
         df_pred (pd.DataFrame): ML predictions including mode-resolved properties
         df_true (pd.DataFrame): DFT reference data including mode-resolved properties
+        true_mode_kappa_avgs (pd.Series | None): Precomputed mode-resolved DFT
+            averages from calc_mode_kappa_tot_avgs(df_true). Defaults to None.
 
     Returns:
-        list[float]: SRME values for each material. Values are between 0 and 2, where:
+        list[float]: SRME values at the first temperature for each material. Values
+        are between 0 and 2, where:
         - 0 indicates perfect agreement in both total κ and mode-resolved properties
         - 2 indicates complete failure (imaginary frequencies, broken symmetry, etc.)
         - Values in between indicate partial agreement, with lower being better
+        Use calc_kappa_srme_per_temp() to get SRME at all temperatures.
     """
-    srme_list: list[float] = []
-    for idx, row_pred in df_pred.iterrows():
-        row_true = df_true.loc[idx]
-
-        # NOTE code below just until before return used to be wrapped in try/except in
-        # which case SRME=2 was set for the failing material
-        if row_pred.get(Key.has_imag_ph_modes) is True:
-            srme_list.append(2)
-            continue
-        if relaxed_space_group_number := row_pred.get(Key.final_spg_num):
-            if initial_space_group_number := row_pred.get(Key.init_spg_num):
-                if relaxed_space_group_number != initial_space_group_number:
-                    srme_list.append(2)
-                    continue
-            elif relaxed_space_group_number != row_true.get(Key.spg_num):
-                srme_list.append(2)
-                continue
-        result = calc_kappa_srme(row_pred, row_true)
-        srme_list.append(result[0])  # append the first temperature's SRME
-
-    return srme_list
+    srme_per_temp = calc_kappa_srme_per_temp(
+        df_pred, df_true, true_mode_kappa_avgs=true_mode_kappa_avgs
+    )
+    return [float(srmes[0]) for srmes in srme_per_temp]
 
 
 def calc_kappa_srme(kappas_pred: pd.Series, kappas_true: pd.Series) -> np.ndarray:
@@ -197,28 +418,10 @@ def calc_kappa_srme(kappas_pred: pd.Series, kappas_true: pd.Series) -> np.ndarra
     ):
         return np.array([2.0])
 
-    mode_kappa_tot_avgs = {}  # store results for pred and true
-    # Try different data sources in order of preference for both pred and true data
-    for label, kappas in {"preds": kappas_pred, "true": kappas_true}.items():
-        keys = set(kappas.keys())
-        if MbdKey.mode_kappa_tot_avg in kappas:
-            kappas = kappas[MbdKey.mode_kappa_tot_avg]
-        elif MbdKey.mode_kappa_tot_rta in kappas:
-            kappas = calculate_kappa_avg(kappas[MbdKey.mode_kappa_tot_rta])
-        elif {MbdKey.kappa_p_rta, MbdKey.kappa_c, Key.heat_capacity} <= keys:
-            kappas = calculate_kappa_avg(
-                ltc.calc_mode_kappa_tot(
-                    kappas[MbdKey.kappa_p_rta],
-                    kappas[MbdKey.kappa_c],
-                    kappas[Key.heat_capacity],
-                )
-            )
-        else:
-            raise ValueError(
-                f"Neither mode_kappa_tot_avg, mode_kappa_tot nor individual kappa\n"
-                f"components found in {label}, got\n{keys}"
-            )
-        mode_kappa_tot_avgs[label] = np.asarray(kappas)
+    mode_kappa_tot_avgs = {  # store results for pred and true
+        label: get_mode_kappa_tot_avg(kappas, label=label)
+        for label, kappas in {"preds": kappas_pred, "true": kappas_true}.items()
+    }
 
     # calculating microscopic error for all temperatures
     microscopic_error = (
@@ -232,6 +435,189 @@ def calc_kappa_srme(kappas_pred: pd.Series, kappas_true: pd.Series) -> np.ndarra
     return 2 * microscopic_error / denominator
 
 
+def _is_array_cell(val: Any) -> bool:
+    """Whether a dataframe cell holds an array (as opposed to a scalar)."""
+    return isinstance(val, (np.ndarray, list, tuple))
+
+
+def _is_missing_cell(val: Any) -> bool:
+    """Whether a dataframe cell is None or NaN."""
+    return val is None or (isinstance(val, float) and np.isnan(val))
+
+
+def _is_nullable_bool_col(cells: list[Any]) -> bool:
+    """Whether column cells are booleans with at least one None/NaN."""
+    n_bools = sum(isinstance(cell, bool | np.bool_) for cell in cells)
+    n_missing = sum(map(_is_missing_cell, cells))
+    return n_bools > 0 and n_missing > 0 and n_bools + n_missing == len(cells)
+
+
+def get_file_source_key(file_path: str) -> str:
+    """Key identifying the current version of a file by its size and mtime, used to
+    detect npz caches of it that are out of date.
+    """
+    stat = os.stat(file_path)
+    return f"{stat.st_size}-{stat.st_mtime_ns}"
+
+
+def write_kappa_npz(
+    df_kappa: pd.DataFrame,
+    file_path: str,
+    *,
+    compress: bool = True,
+    source_key: str = "",
+) -> None:
+    """Write per-material (mode-resolved) kappa arrays to a compact .npz file.
+
+    Array columns can be ragged (different numbers of q-points and bands per material).
+    Each is stored as one flat data array plus offsets and shapes to restore the
+    per-material arrays, avoiding the nested lists of JSON files. Scalar columns are
+    stored as-is, except boolean columns with missing values (e.g. has_imag_ph_modes
+    of failed materials) which are stored as 1.0/0.0/NaN floats, same as pd.read_json
+    returns them for JSON files. The dataframe index is stored too. Existing files
+    are replaced atomically.
+
+    Args:
+        df_kappa (pd.DataFrame): Kappa data with one row per material, e.g. as
+            returned by pd.read_json(model.kappa_103_path).set_index(Key.mat_id).
+        file_path (str): Path of the .npz file to write.
+        compress (bool): Whether to zip-compress the arrays. Defaults to True.
+        source_key (str): Stored in the file to tell which version of the source
+            data it was written from (see read_kappa_npz_source_key). Defaults to "".
+
+    Raises:
+        ValueError: If a column can't be stored as a non-object numpy array, e.g.
+            mixed-type scalars or None cells in array columns.
+    """
+    arrays: dict[str, np.ndarray] = {
+        "__index__": np.asarray(df_kappa.index),
+        "__index_name__": np.asarray(str(df_kappa.index.name or "")),
+        "__columns__": np.asarray([str(col) for col in df_kappa], dtype=str),
+        "__source_key__": np.asarray(source_key),
+    }
+    if arrays["__index__"].dtype == object:
+        arrays["__index__"] = arrays["__index__"].astype(str)
+
+    for col in map(str, df_kappa):
+        cells = df_kappa[col].tolist()
+        if _is_nullable_bool_col(cells):
+            arrays[col] = np.array(
+                [np.nan if _is_missing_cell(cell) else float(cell) for cell in cells]
+            )
+            continue
+        if not any(map(_is_array_cell, cells)):
+            arrays[col] = np.asarray(cells)
+            if arrays[col].dtype == object:
+                raise ValueError(f"Can't store {col=} with mixed-type scalars as npz")
+            continue
+
+        cells = [np.asarray(cell) for cell in cells]
+        if any(cell.dtype == object for cell in cells):
+            raise ValueError(
+                f"Can't store {col=} with object dtype cells (e.g. None or ragged "
+                "nested lists) as npz, use NaN for missing values"
+            )
+        ndims = np.array([cell.ndim for cell in cells], dtype=np.int64)
+        sizes = np.array([cell.size for cell in cells], dtype=np.int64)
+        arrays[f"{col}/data"] = np.concatenate([cell.ravel() for cell in cells])
+        arrays[f"{col}/offsets"] = np.concatenate([[0], np.cumsum(sizes)])
+        arrays[f"{col}/ndims"] = ndims
+        arrays[f"{col}/shapes"] = np.array(
+            [dim for cell in cells for dim in cell.shape], dtype=np.int64
+        )
+
+    os.makedirs(os.path.dirname(os.path.abspath(file_path)), exist_ok=True)
+    save = np.savez_compressed if compress else np.savez
+    # np.savez appends .npz to paths without it
+    tmp_path = f"{file_path}.{os.getpid()}.tmp.npz"
+    try:
+        save(tmp_path, **arrays)  # type: ignore[arg-type]
+        os.replace(tmp_path, file_path)
+    finally:
+        if os.path.isfile(tmp_path):
+            os.remove(tmp_path)
+
+
+def read_kappa_npz_source_key(file_path: str) -> str | None:
+    """Read the source_key a file was written with by write_kappa_npz.
+
+    Args:
+        file_path (str): Path of the .npz file.
+
+    Returns:
+        str | None: The stored source key ("" if none was passed or the file predates
+            source keys) or None if the file doesn't exist or can't be read.
+    """
+    try:
+        with np.load(file_path, allow_pickle=False) as npz_file:
+            if "__source_key__" not in npz_file:
+                return ""
+            return str(npz_file["__source_key__"])
+    except (OSError, ValueError):
+        return None
+
+
+def read_kappa_npz(
+    file_path: str, *, columns: Sequence[str] | None = None
+) -> pd.DataFrame:
+    """Read per-material kappa arrays written by write_kappa_npz.
+
+    Args:
+        file_path (str): Path of the .npz file to read.
+        columns (Sequence[str] | None): Subset of columns to load. Only the arrays
+            of these columns are decompressed. Defaults to None (all columns).
+
+    Returns:
+        pd.DataFrame: Kappa data with one row per material. Array cells are views
+            into a single flat array per column. 0-d cells (e.g. NaN for failed
+            materials) are returned as Python scalars.
+    """
+    with np.load(file_path, allow_pickle=False) as npz_file:
+        index_name = str(npz_file["__index_name__"]) or None
+        index = pd.Index(npz_file["__index__"], name=index_name)
+        all_columns = npz_file["__columns__"].tolist()
+        if columns is None:
+            columns = all_columns
+        elif missing_cols := set(columns) - set(all_columns):
+            raise ValueError(f"{missing_cols=} not in {file_path}")
+
+        data: dict[str, Any] = {}
+        for col in columns:
+            if col in npz_file:
+                data[col] = npz_file[col]
+                continue
+            flat = npz_file[f"{col}/data"]
+            offsets = npz_file[f"{col}/offsets"]
+            ndims = npz_file[f"{col}/ndims"]
+            shape_offsets = np.concatenate([[0], np.cumsum(ndims)])
+            shapes = npz_file[f"{col}/shapes"]
+            cells = []
+            for idx, ndim in enumerate(ndims):
+                shape = shapes[shape_offsets[idx] : shape_offsets[idx + 1]]
+                cell = flat[offsets[idx] : offsets[idx + 1]].reshape(shape)
+                cells += [cell.item() if ndim == 0 else cell]
+            data[col] = cells
+
+    return pd.DataFrame(data, index=index, columns=list(columns))
+
+
+def read_kappa_file(file_path: str, *, id_col: str = Key.mat_id) -> pd.DataFrame:
+    """Read kappa predictions or reference data from .npz or JSON file.
+
+    Args:
+        file_path (str): Path to a .npz file written by write_kappa_npz or a
+            (compressed) JSON file as written by df.to_json().
+        id_col (str): Column to use as index when reading JSON files. Defaults to
+            Key.mat_id.
+
+    Returns:
+        pd.DataFrame: Kappa data indexed by material ID.
+    """
+    if file_path.endswith(".npz"):
+        return read_kappa_npz(file_path)
+    return pd.read_json(file_path).set_index(id_col)
+
+
 def write_metrics_to_yaml(
     model: Model, metrics: dict[str, float], pred_file_path: str
 ) -> None:
@@ -242,33 +628,24 @@ def write_metrics_to_yaml(
         metrics: Kappa metrics for this model.
         pred_file_path: Path to prediction file.
     """
-    import os
-
-    from ruamel.yaml import YAML
+    from matbench_discovery.data import batch_yaml_updates
 
     # Convert absolute path to relative path
     pred_file_path = pred_file_path.removeprefix(f"{os.getcwd()}/")
 
-    # Update YAML file
-    yaml = YAML()
-    yaml.preserve_quotes = True
-    yaml.width = 1000
-    yaml.indent(mapping=2, sequence=4, offset=2)
+    # Update YAML file (joins the caller's batch if inside batch_yaml_updates())
+    with batch_yaml_updates() as batch:
+        data = batch.load(model.yaml_path)
 
-    with open(model.yaml_path) as file:
-        data = yaml.load(file)
-
-    # Ensure nested structure exists and update non-destructively
-    data.setdefault("metrics", {}).setdefault("phonons", {}).setdefault("kappa_103", {})
-    data["metrics"]["phonons"]["kappa_103"].update(
-        κ_SRME=float(round(metrics["srme"], 4)),
-        κ_SRE=float(round(metrics["sre"], 4)),
-    )
-
-    # Set pred_file if missing
-    if "pred_file" not in data["metrics"]["phonons"]["kappa_103"]:
-        data["metrics"]["phonons"]["kappa_103"]["pred_file"] = pred_file_path
+        # Ensure nested structure exists and update non-destructively
+        data.setdefault("metrics", {}).setdefault("phonons", {}).setdefault(
+            "kappa_103", {}
+        )
+        data["metrics"]["phonons"]["kappa_103"].update(
+            κ_SRME=float(round(metrics["srme"], 4)),
+            κ_SRE=float(round(metrics["sre"], 4)),
+        )
 
-    # Write back to file
-    with open(model.yaml_path, "w") as file:
-        yaml.dump(data, file)
+        # Set pred_file if missing
+        if "pred_file" not in data["metrics"]["phonons"]["kappa_103"]:
+            data["metrics"]["phonons"]["kappa_103"]["pred_file"] = pred_file_path
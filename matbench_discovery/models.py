@@ -1,8 +1,23 @@
 """Model utilities for matbench-discovery."""
 
-from typing import Any
+import functools
+import os
+import pickle
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from glob import glob
+from typing import Any, Final
 
-from matbench_discovery.enums import ModelType, Open
+import yaml
+
+from matbench_discovery import DEFAULT_CACHE_DIR, ROOT
+from matbench_discovery.enums import Model, ModelType, Open
+
+MODELS_DIR: Final[str] = f"{ROOT}/models"
+# compiled metadata of all model YAML files, keyed by their mtimes and sizes
+REGISTRY_CACHE_PATH: Final[str] = f"{DEFAULT_CACHE_DIR}/model-registry.pkl"
+# libyaml-based loader is ~10x faster than the pure-Python one if available
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
 
 
 def model_is_compliant(metadata: dict[str, str | list[str]]) -> bool:
@@ -47,3 +62,223 @@ def validate_model_metadata(metadata: dict[str, Any], metadata_file: str) -> Non
     except ValueError as exc:
         exc.add_note(f"{metadata_file=}\nPick from {', '.join(ModelType)}")
         raise
+
+
+def _load_yaml(yaml_path: str) -> dict[str, Any]:
+    """Parse a model metadata file."""
+    with open(yaml_path, encoding="utf-8") as file:
+        return yaml.load(file, Loader=_YamlLoader)  # noqa: S506
+
+
+class ModelRegistry:
+    """Metadata of all model YAML files, parsed once and indexed for fast lookups.
+
+    Parsed metadata is pickled to cache_path together with the mtime and size of each
+    YAML file, so later processes only re-parse files that changed.
+
+    Example:
+        registry = get_model_registry()
+        registry["MACE-MP-0"]  # look up metadata by label, key, Model or name
+        registry.pred_col_index["e_form_per_atom_mace"]  # models sharing a pred_col
+        registry.get_metric(Model.mace_mp_0, "metrics.discovery.pred_col")
+        registry.metric_values("metrics.discovery.full_test_set.F1")
+    """
+
+    def __init__(
+        self,
+        models_dir: str = MODELS_DIR,
+        *,
+        cache_path: str | None = REGISTRY_CACHE_PATH,
+        workers: int = 1,
+    ) -> None:
+        """Load cached metadata if available, then parse new or modified files.
+
+        Args:
+            models_dir (str): Directory to search for **/*.yml model metadata files.
+                Defaults to MODELS_DIR.
+            cache_path (str | None): Where to pickle parsed metadata. None disables
+                caching. Defaults to REGISTRY_CACHE_PATH.
+            workers (int): Number of processes for parsing YAML files. Defaults to 1.
+        """
+        self.models_dir, self.cache_path, self.workers = models_dir, cache_path, workers
+        # YAML path relative to models_dir -> parsed metadata
+        self.metadata: dict[str, dict[str, Any]] = {}
+        self._file_stats: dict[str, tuple[int, int]] = {}
+        self._metric_cache: dict[str, dict[str, Any]] = {}
+
+        if cache_path and os.path.isfile(cache_path):
+            try:
+                with open(cache_path, mode="rb") as file:
+                    cache = pickle.load(file)  # noqa: S301
+                if cache["models_dir"] == models_dir:
+                    self.metadata, self._file_stats = cache["metadata"], cache["stats"]
+            except (OSError, EOFError, KeyError, pickle.UnpicklingError):
+                pass  # corrupt or outdated cache, re-parse everything
+        self._build_indices()
+        self.refresh()
+
+    def refresh(self) -> list[str]:
+        """Re-parse new or modified YAML files and drop deleted ones.
+
+        Returns:
+            list[str]: Relative paths of re-parsed files.
+        """
+        stats: dict[str, tuple[int, int]] = {}
+        for yaml_path in sorted(glob(f"{self.models_dir}/**/*.yml", recursive=True)):
+            stat = os.stat(yaml_path)
+            rel_path = os.path.relpath(yaml_path, self.models_dir)
+            stats[rel_path] = (stat.st_mtime_ns, stat.st_size)
+
+        changed = sorted(
+            rel_path
+            for rel_path, stat in stats.items()
+            if self._file_stats.get(rel_path) != stat
+        )
+        if not changed and stats.keys() == self._file_stats.keys():
+            return []
+
+        abs_paths = [f"{self.models_dir}/{rel_path}" for rel_path in changed]
+        if self.workers > 1 and len(changed) > 1:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                parsed = list(executor.map(_load_yaml, abs_paths))
+        else:
+            parsed = list(map(_load_yaml, abs_paths))
+
+        new_metadata = dict(zip(changed, parsed, strict=True))
+        self.metadata = {
+            rel_path: new_metadata[rel_path]
+            if rel_path in new_metadata
+            else self.metadata[rel_path]
+            for rel_path in stats
+        }
+        self._file_stats = stats
+        self._build_indices()
+        self._save_cache()
+        return changed
+
+    def _build_indices(self) -> None:
+        """Map model labels, keys and pred_cols to YAML paths."""
+        self._metric_cache = {}
+        self.label_index: dict[str, str] = {}
+        self.key_index: dict[str, str] = {}
+        # pred_cols aren't unique (e.g. different versions of the same model)
+        self.pred_col_index: dict[str, list[str]] = {}
+        for rel_path, metadata in self.metadata.items():
+            if not isinstance(metadata, dict):
+                continue  # invalid YAML, Model.metadata raises on access
+            if label := metadata.get("model_name"):
+                self.label_index[label] = rel_path
+            if key := metadata.get("model_key"):
+                self.key_index[key] = rel_path
+            if pred_col := self.get_metric(rel_path, "metrics.discovery.pred_col"):
+                self.pred_col_index.setdefault(pred_col, []).append(rel_path)
+        # Model enum members whose YAML file was found in models_dir
+        self.model_index: dict[str, Model] = {
+            model.rel_path: model for model in Model if model.rel_path in self.metadata
+        }
+
+    def _save_cache(self) -> None:
+        """Atomically pickle parsed metadata and file stats to cache_path."""
+        if not self.cache_path:
+            return
+        cache = dict(
+            models_dir=self.models_dir, metadata=self.metadata, stats=self._file_stats
+        )
+        tmp_path = f"{self.cache_path}.{os.getpid()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.cache_path) or ".", exist_ok=True)
+            with open(tmp_path, mode="wb") as file:
+                pickle.dump(cache, file, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self.cache_path)
+        except OSError:
+            pass  # caching is best-effort, e.g. on read-only file systems
+
+    def resolve(self, model: Model | str) -> str:
+        """YAML path (relative to models_dir) for a Model, Model name, label, key or
+        relative YAML path.
+
+        Raises:
+            KeyError: If no model matches.
+        """
+        if isinstance(model, Model):
+            return model.rel_path
+        if model in self.metadata:
+            return model
+        if model in Model.__members__:
+            return Model[model].rel_path
+        for index in (self.label_index, self.key_index):
+            if model in index:
+                return index[model]
+        raise KeyError(f"No model metadata matching {model!r} in {self.models_dir}")
+
+    def model(self, model: Model | str) -> Model:
+        """Model enum member for a Model name, label, key or YAML path."""
+        return self.model_index[self.resolve(model)]
+
+    def __getitem__(self, model: Model | str) -> dict[str, Any]:
+        """Metadata of a Model, Model name, label, key or YAML path."""
+        return self.metadata[self.resolve(model)]
+
+    def __contains__(self, model: object) -> bool:
+        """Whether any model matches a Model, Model name, label, key or path."""
+        try:
+            self.resolve(model)  # type: ignore[arg-type]
+        except KeyError:
+            return False
+        return True
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over relative YAML paths of all models."""
+        return iter(self.metadata)
+
+    def __len__(self) -> int:
+        """Number of parsed model metadata files."""
+        return len(self.metadata)
+
+    def get_metric(
+        self, model: Model | str, dotted_path: str, default: Any = None
+    ) -> Any:
+        """Get a (nested) value from a model's metadata by dotted path like
+        'metrics.discovery.pred_col'. Returns default if any key is missing or a
+        non-dict is encountered on the way.
+        """
+        value: Any = self[model]
+        for key in dotted_path.split("."):
+            if not isinstance(value, dict) or key not in value:
+                return default
+            value = value[key]
+        return value
+
+    def metric_values(self, dotted_path: str) -> dict[str, Any]:
+        """Map of relative YAML path to value at dotted_path for all models that have
+        it. Results are cached until the next refresh() that finds changes.
+        """
+        if dotted_path not in self._metric_cache:
+            missing = object()
+            values = {
+                rel_path: self.get_metric(rel_path, dotted_path, default=missing)
+                for rel_path in self.metadata
+            }
+            self._metric_cache[dotted_path] = {
+                rel_path: val for rel_path, val in values.items() if val is not missing
+            }
+        return self._metric_cache[dotted_path]
+
+
+@functools.cache
+def _model_registry() -> ModelRegistry:
+    """Process-wide ModelRegistry instance."""
+    return ModelRegistry()
+
+
+def get_model_registry(*, refresh: bool = True) -> ModelRegistry:
+    """Shared ModelRegistry of all models/**/*.yml files.
+
+    Args:
+        refresh (bool): Whether to re-parse YAML files modified since the last call
+            (e.g. by update_yaml_file). Costs one stat() per file. Defaults to True.
+    """
+    registry = _model_registry()
+    if refresh:
+        registry.refresh()
+    return registry
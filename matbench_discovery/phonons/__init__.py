@@ -1,9 +1,13 @@
 """This package contains phonon-related functionality."""
 
+from collections.abc import Sequence
 from typing import Final
 
 import numpy as np
 import pandas as pd
+from pymatviz.enums import Key
+
+from matbench_discovery.enums import MbdKey
 
 # q-point mesh (which phonon modes to sample) based on international space group number
 spg_num_q_mesh_map: Final[dict[int, tuple[int, int, int]]] = {
@@ -40,3 +44,74 @@ def check_imaginary_freqs(frequencies: np.ndarray, threshold: float = -0.01) ->
     # Check for imaginary frequencies at any q-point except gamma
     # All frequencies should be positive away from gamma point
     return bool(np.any(frequencies[1:] < 0))
+
+
+def check_imaginary_freqs_batch(
+    frequencies: Sequence[np.ndarray] | pd.Series, threshold: float = -0.01
+) -> pd.DataFrame:
+    """Check many materials for imaginary frequencies at once.
+
+    Applies the same rules as check_imaginary_freqs() to each material but in a
+    single vectorized pass over all frequencies concatenated into one flat array, so
+    screening large phonon datasets avoids per-material Python overhead.
+
+    Args:
+        frequencies (Sequence[np.ndarray] | pd.Series): Ragged collection of frequency
+            arrays, one per material, each of shape (n_q_points, n_bands) with the
+            Gamma point first. If a Series, its index is used for the returned
+            dataframe.
+        threshold (float): Threshold for imaginary acoustic frequencies at Gamma.
+            Defaults to -0.01.
+
+    Returns:
+        pd.DataFrame: One row per material with columns
+            - has_imag_ph_modes: True if imaginary frequencies are found (or all
+                frequencies are NaN), same as check_imaginary_freqs().
+            - n_imag_ph_modes: Number of modes counted as imaginary.
+            - max_imag_ph_freq: Magnitude of the most negative imaginary frequency
+                (0 if none, NaN if all frequencies are NaN).
+
+    Raises:
+        ValueError: If any frequency array is not 2-dimensional.
+    """
+    index = frequencies.index if isinstance(frequencies, pd.Series) else None
+    freq_arrays = [np.asarray(freqs, dtype=float) for freqs in frequencies]
+    if bad_ndims := {freqs.ndim for freqs in freq_arrays} - {2}:
+        raise ValueError(
+            f"frequencies must be 2D (n_q_points, n_bands), got {bad_ndims=}"
+        )
+
+    n_materials = len(freq_arrays)
+    sizes = np.array([freqs.size for freqs in freq_arrays], dtype=np.int64)
+    n_bands = np.array([freqs.shape[1] for freqs in freq_arrays], dtype=np.int64)
+    flat_freqs = (
+        np.concatenate([freqs.ravel() for freqs in freq_arrays])
+        if n_materials
+        else np.zeros(0)
+    )
+
+    # material index and position within each material for every frequency
+    mat_idx = np.repeat(np.arange(n_materials), sizes)
+    starts = np.concatenate([[0], np.cumsum(sizes)[:-1]]) if n_materials else sizes
+    pos = np.arange(len(flat_freqs)) - np.repeat(starts, sizes)
+    # first n_bands entries of each material are at Gamma (q=0), of which the first 3
+    # are acoustic modes which may be slightly negative due to numerical noise
+    is_gamma_acoustic = (pos < n_bands[mat_idx]) & (pos < 3)
+    is_imag = np.where(is_gamma_acoustic, flat_freqs < threshold, flat_freqs < 0)
+
+    n_imag = np.bincount(mat_idx, weights=is_imag, minlength=n_materials)
+    n_nan = np.bincount(mat_idx, weights=np.isnan(flat_freqs), minlength=n_materials)
+    all_nan = n_nan == sizes
+
+    max_imag_freq = np.zeros(n_materials)
+    np.maximum.at(max_imag_freq, mat_idx[is_imag], -flat_freqs[is_imag])
+    max_imag_freq[all_nan] = np.nan
+
+    return pd.DataFrame(
+        {
+            Key.has_imag_ph_modes: all_nan | (n_imag > 0),
+            MbdKey.n_imag_ph_modes: n_imag.astype(int),
+            MbdKey.max_imag_ph_freq: max_imag_freq,
+        },
+        index=index,
+    )
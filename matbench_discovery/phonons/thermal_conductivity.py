@@ -9,29 +9,35 @@ conductivity metric to larger test sets.
 """
 
 import warnings
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from copy import deepcopy
 from typing import Any
 
 import numpy as np
+import pandas as pd
 from ase import Atoms
 from ase.calculators.calculator import Calculator
 from phono3py.api_phono3py import Phono3py
+from phonopy import Phonopy
 from phonopy.structure.atoms import PhonopyAtoms
 from pymatviz.enums import Key
 from tqdm import tqdm
 
 from matbench_discovery.enums import MbdKey
+from matbench_discovery.phonons import check_imaginary_freqs_batch
 
 
 def calculate_fc2_set(
-    ph3: Phono3py, calculator: Calculator, pbar_kwargs: dict[str, Any] | None = None
+    ph3: Phono3py | Phonopy,
+    calculator: Calculator,
+    pbar_kwargs: dict[str, Any] | None = None,
 ) -> np.ndarray:
     """Calculate 2nd order force constants. Requires initializing Phono3py with an FC2
-    supercell matrix.
+    supercell matrix or a Phonopy object with displacements (see init_phonopy()).
 
     Args:
-        ph3 (Phono3py): Phono3py object for which to calculate force constants.
+        ph3 (Phono3py | Phonopy): Phono3py or Phonopy object for which to calculate
+            force constants.
         calculator (Calculator): ASE calculator to compute forces.
         pbar_kwargs (dict[str, Any] | None): Arguments passed to tqdm progress bar.
             Defaults to None.
@@ -39,12 +45,17 @@ def calculate_fc2_set(
     Returns:
         np.ndarray: Array of forces for each displacement
     """
-    print(f"Computing FC2 force set in {ph3.unitcell.formula}.")
+    is_phonopy = isinstance(ph3, Phonopy)
+    if not is_phonopy:
+        print(f"Computing FC2 force set in {ph3.unitcell.formula}.")
 
     forces: list[np.ndarray] = []
-    n_atoms = len(ph3.phonon_supercell)
-
-    displacements = ph3.phonon_supercells_with_displacements
+    if is_phonopy:
+        n_atoms = len(ph3.supercell)
+        displacements = ph3.supercells_with_displacements
+    else:
+        n_atoms = len(ph3.phonon_supercell)
+        displacements = ph3.phonon_supercells_with_displacements
     for supercell in tqdm(
         displacements,
         desc=f"FC2 calculation: {ph3.unitcell.formula}",
@@ -64,7 +75,10 @@ def calculate_fc2_set(
         forces += [force]
 
     force_set = np.array(forces)
-    ph3.phonon_forces = force_set
+    if is_phonopy:
+        ph3.forces = force_set
+    else:
+        ph3.phonon_forces = force_set
     return force_set
 
 
@@ -191,6 +205,158 @@ def get_fc2_and_freqs(
     return ph3, fc2_set, freqs
 
 
+def init_phonopy(
+    atoms: Atoms,
+    *,
+    fc2_supercell: np.ndarray,
+    displacement_distance: float = 0.01,
+    symprec: float = 1e-5,
+    **kwargs: Any,
+) -> Phonopy:
+    """Initialize a harmonic-only Phonopy object from ASE Atoms.
+
+    Cheaper alternative to init_phono3py() when only harmonic frequencies are
+    needed (e.g. to flag dynamically unstable structures): no FC3 supercell or FC3
+    displacements are generated.
+
+    Args:
+        atoms (Atoms): ASE Atoms object to initialize from.
+        fc2_supercell (np.ndarray): Supercell matrix for 2nd order force constants.
+        displacement_distance (float): Displacement distance for force calculations.
+            Defaults to 0.01.
+        symprec (float): Symmetry precision for finding space group. Defaults to 1e-5.
+        **kwargs (Any): Passed to Phonopy constructor.
+
+    Returns:
+        Phonopy: Initialized Phonopy object with FC2 displacements generated
+    """
+    unit_cell = PhonopyAtoms(atoms.symbols, cell=atoms.cell, positions=atoms.positions)
+    phonon = Phonopy(
+        unitcell=unit_cell,
+        supercell_matrix=fc2_supercell,
+        primitive_matrix="auto",
+        symprec=symprec,
+        **kwargs,
+    )
+    phonon.generate_displacements(distance=displacement_distance)
+
+    return phonon
+
+
+def get_harmonic_freqs(
+    phonon: Phonopy,
+    calculator: Calculator,
+    *,
+    q_point_mesh: tuple[int, int, int],
+    pbar_kwargs: dict[str, Any] | None = None,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculate 2nd order force constants and phonon frequencies on a q-point mesh
+    without any of the anharmonic (FC3, ph-ph interaction) setup done by
+    get_fc2_and_freqs().
+
+    Frequencies are only computed on the irreducible Gamma-centered q-points and
+    without eigenvectors, so the Gamma point comes first as expected by
+    check_imaginary_freqs().
+
+    Args:
+        phonon (Phonopy): Phonopy object from init_phonopy().
+        calculator (Calculator): ASE calculator to compute forces.
+        q_point_mesh (tuple[int, int, int]): Mesh size for q-point sampling.
+        pbar_kwargs (dict[str, Any] | None): Arguments passed to tqdm progress bar.
+            Defaults to None.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: (FC2 force set [shape: (n_displacements,
+            n_atoms_supercell, 3)], frequencies [shape: (n_irr_q_points, n_bands)])
+    """
+    pbar_kwargs = {"leave": False} | (pbar_kwargs or {})
+    fc2_set = calculate_fc2_set(phonon, calculator, pbar_kwargs=pbar_kwargs)
+    phonon.produce_force_constants()
+    phonon.symmetrize_force_constants()
+
+    phonon.run_mesh(q_point_mesh, is_gamma_center=True, with_eigenvectors=False)
+    freqs = phonon.get_mesh_dict()["frequencies"]
+
+    return fc2_set, freqs
+
+
+def screen_imaginary_freqs(
+    atoms_list: Iterable[Atoms],
+    calculator: Calculator,
+    *,
+    fc2_supercell: np.ndarray | None = None,
+    q_point_mesh: tuple[int, int, int] | None = None,
+    threshold: float = -0.01,
+    displacement_distance: float = 0.01,
+    symprec: float = 1e-5,
+    pbar_kwargs: dict[str, Any] | None = None,
+) -> pd.DataFrame:
+    """Screen many structures for imaginary harmonic phonon modes.
+
+    Runs the harmonic-only pipeline (init_phonopy() + get_harmonic_freqs()) one
+    structure at a time and keeps only the per-structure summary returned by
+    check_imaginary_freqs_batch(). Force sets, force constants and frequencies are
+    discarded after each structure so memory stays bounded regardless of how many
+    structures are screened. Structures for which the calculator or phonopy raises
+    are reported by ID and get NaN in all columns instead of aborting the screen.
+
+    Args:
+        atoms_list (Iterable[Atoms]): Structures to screen. Can be a generator.
+        calculator (Calculator): ASE calculator to compute forces.
+        fc2_supercell (np.ndarray | None): Supercell matrix for 2nd order force
+            constants. Defaults to None, meaning read from atoms.info["fc2_supercell"].
+        q_point_mesh (tuple[int, int, int] | None): Mesh size for q-point sampling.
+            Defaults to None, meaning read from atoms.info["q_point_mesh"].
+        threshold (float): Threshold for imaginary acoustic frequencies at Gamma.
+            Defaults to -0.01.
+        displacement_distance (float): Displacement distance for force calculations.
+            Defaults to 0.01.
+        symprec (float): Symmetry precision for finding space group. Defaults to 1e-5.
+        pbar_kwargs (dict[str, Any] | None): Arguments passed to tqdm progress bar.
+            Defaults to None.
+
+    Returns:
+        pd.DataFrame: One row per structure with has_imag_ph_modes,
+            n_imag_ph_modes and max_imag_ph_freq columns, indexed by
+            atoms.info[Key.mat_id] if present, else by position.
+    """
+    df_empty = check_imaginary_freqs_batch([])
+    dfs: list[pd.DataFrame] = []
+    for idx, atoms in enumerate(atoms_list):
+        mat_id = atoms.info.get(Key.mat_id, idx)
+        try:
+            phonon = init_phonopy(
+                atoms,
+                fc2_supercell=atoms.info["fc2_supercell"]
+                if fc2_supercell is None
+                else fc2_supercell,
+                displacement_distance=displacement_distance,
+                symprec=symprec,
+            )
+            _fc2_set, freqs = get_harmonic_freqs(
+                phonon,
+                calculator,
+                q_point_mesh=atoms.info["q_point_mesh"]
+                if q_point_mesh is None
+                else q_point_mesh,
+                pbar_kwargs=pbar_kwargs,
+            )
+        except Exception as exc:
+            print(f"Failed to screen {mat_id}: {exc!r}")
+            # object dtype keeps has_imag_ph_modes as True/False/NaN after concat
+            # instead of casting it to float
+            df_failed = pd.DataFrame(np.nan, index=[mat_id], columns=df_empty.columns)
+            dfs += [df_failed.astype({Key.has_imag_ph_modes: object})]
+            continue
+        dfs += [
+            check_imaginary_freqs_batch(
+                pd.Series([freqs], index=[mat_id]), threshold=threshold
+            )
+        ]
+
+    return pd.concat(dfs) if dfs else df_empty
+
+
 def load_force_sets(
     ph3: Phono3py, fc2_set: np.ndarray, fc3_set: np.ndarray
 ) -> Phono3py:
@@ -281,6 +447,8 @@ def calc_mode_kappa_tot(
     mode_kappa_p_rta: np.ndarray,
     mode_kappa_coherence: np.ndarray,
     heat_capacity: np.ndarray,
+    *,
+    chunk_size: int | None = None,
 ) -> np.ndarray:
     """Calculate total mode kappa from particle-like RTA and coherence terms.
 
@@ -291,18 +459,38 @@ def calc_mode_kappa_tot(
             shape (T, q-points, bands, bands, xyz)
         heat_capacity (np.ndarray): Mode heat capacities with shape
             (T, q-points, bands)
+        chunk_size (int | None): Number of q-points to process at once. The coherence
+            term needs a (T, q-points, bands, bands, xyz) temporary, so smaller chunks
+            bound peak memory for materials with many bands. Results are identical
+            for any chunk size. Defaults to None, meaning all q-points at once.
 
     Returns:
         np.ndarray: Total (particle-like + wave-like) thermal conductivity per phonon
             mode with shape (T, q-points, bands)
     """
-    # Temporarily silence divide warnings since we handle NaN values below
-    with np.errstate(divide="ignore", invalid="ignore"):
-        mode_kappa_c_per_mode = 2 * (  # None equiv to np.newaxis
-            (mode_kappa_coherence * heat_capacity[:, :, :, None, None])
-            / (heat_capacity[:, :, :, None, None] + heat_capacity[:, :, None, :, None])
-        ).sum(axis=2)
-
-    mode_kappa_c_per_mode[np.isnan(mode_kappa_c_per_mode)] = 0
+    n_q_points = heat_capacity.shape[1]
+    if chunk_size is None:
+        chunk_size = max(n_q_points, 1)
+    if chunk_size < 1:
+        raise ValueError(f"{chunk_size=} must be a positive integer")
+
+    dtype = np.result_type(mode_kappa_p_rta, mode_kappa_coherence, heat_capacity)
+    mode_kappa_tot = np.empty(np.shape(mode_kappa_p_rta), dtype=dtype)
+
+    for start in range(0, n_q_points, chunk_size):
+        q_slice = slice(start, start + chunk_size)
+        hc_chunk = heat_capacity[:, q_slice]
+        # Temporarily silence divide warnings since we handle NaN values below
+        with np.errstate(divide="ignore", invalid="ignore"):
+            mode_kappa_c_per_mode = 2 * (  # None equiv to np.newaxis
+                (mode_kappa_coherence[:, q_slice] * hc_chunk[:, :, :, None, None])
+                / (hc_chunk[:, :, :, None, None] + hc_chunk[:, :, None, :, None])
+            ).sum(axis=2)
+
+        mode_kappa_c_per_mode[np.isnan(mode_kappa_c_per_mode)] = 0
+
+        mode_kappa_tot[:, q_slice] = (
+            mode_kappa_c_per_mode + mode_kappa_p_rta[:, q_slice]
+        )
 
-    return mode_kappa_c_per_mode + mode_kappa_p_rta
+    return mode_kappa_tot
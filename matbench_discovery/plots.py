@@ -10,6 +10,8 @@ import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objs as go
+import plotly.io as pio
+import pymatviz as pmv  # needed for pymatviz_dark template
 import scipy.interpolate
 import scipy.stats
 import wandb
@@ -17,13 +19,34 @@ from plotly.validator_cache import ValidatorCache
 from tqdm import tqdm
 
 from matbench_discovery import STABILITY_THRESHOLD
-from matbench_discovery.enums import Model
+from matbench_discovery.enums import MbdKey, Model
 from matbench_discovery.metrics.discovery import classify_stable
 
 __author__ = "Janosh Riebesell"
 __date__ = "2022-08-05"
 
 
+# --- start global plot settings
+# only applied when this module is imported so that importing the rest of the package
+# (e.g. in HPC worker processes) doesn't pay for loading the plotting stack
+global_layout = dict(
+    paper_bgcolor="rgba(0,0,0,0)",
+    font_size=13,
+    # increase legend marker size and make background transparent
+    legend=dict(itemsizing="constant", bgcolor="rgba(0, 0, 0, 0)"),
+)
+pio.templates["mbd_global"] = dict(layout=global_layout)
+pio.templates.default = "pymatviz_dark+mbd_global"
+px.defaults.template = "pymatviz_dark+mbd_global"
+
+# register pretty labels to use instead of enum keys in plotly axes and legends
+px.defaults.labels |= {key.name: key.label for key in (*Model, *MbdKey, *pmv.enums.Key)}
+
+# https://github.com/plotly/Kaleido/issues/122#issuecomment-994906924
+# when seeing MathJax "loading" message in exported PDFs,
+# use pio.kaleido.scope.mathjax = None
+# --- end global plot settings
+
 symbol_validator = ValidatorCache.get_validator("scatter.marker", "symbol")
 dash_validator = ValidatorCache.get_validator("scatter.line", "dash")
 
@@ -0,0 +1,853 @@
+"""Relax many structures with any ASE calculator.
+
+Replaces the serial relaxation loop previously copied into every
+models/*/test_*_discovery.py script with three entry points:
+
+- relax_atoms(): relax one structure with an ASE optimizer and cell filter.
+- relax_structures(): relax many structures concurrently across worker processes
+    that each build their own calculator.
+- relax_batch_fire(): FIRE over stacked positions and cells of many structures at
+    once for calculators that can evaluate a whole batch in one call (e.g. GPU
+    models). Converged structures drop out of the batch and are replaced by pending
+    ones so the batch stays full.
+
+All three accept traj_kwargs to record trajectories with TrajectoryRecorder, which
+keeps a fixed number of float32 frames per structure and appends them to a compact
+binary side file (read back with read_trajectory()).
+
+RelaxResultsSink streams finished structures to an append-only gzipped JSON lines
+file so a job that times out keeps its finished results and can resume where it
+left off. read_relax_results() loads such files, e.g. via
+glob_to_df(pattern, reader=read_relax_results).
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+import time
+import zlib
+from collections import deque
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import TYPE_CHECKING, Any, Final, Self
+
+import numpy as np
+from ase.filters import FrechetCellFilter
+from ase.optimize import FIRE, LBFGS
+from ase.stress import voigt_6_to_full_3x3_stress
+from tqdm import tqdm
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from ase import Atoms
+    from ase.calculators.calculator import Calculator
+    from ase.filters import Filter
+    from ase.optimize.optimize import Optimizer
+
+__date__ = "2026-10-19"
+
+OPTIMIZERS: Final[dict[str, type[Optimizer]]] = {"FIRE": FIRE, "LBFGS": LBFGS}
+
+# evaluates energies (n_structs,), forces [(n_atoms_i, 3), ...] and stresses
+# (n_structs, 6) in Voigt notation (or None if the cell is fixed) for many structures
+BatchCalculator = Callable[
+    [Sequence["Atoms"]], tuple[np.ndarray, Sequence[np.ndarray], np.ndarray | None]
+]
+
+
+# fields of a trajectory record in side files in the order they're stored
+TRAJ_FIELDS: Final = ("steps", "energies", "cells", "positions")
+
+
+class TrajectoryRecorder:
+    """Record relaxation frames into preallocated float32 ring buffers.
+
+    Memory stays fixed at max_frames frames no matter how many steps a relaxation
+    takes. Only every stride-th frame is stored. Once the buffer is full, the oldest
+    frames are overwritten, except that the first frame (keep_first) and the most
+    recent one (keep_last) are always kept. An instance can be passed directly as
+    the callback of relax_atoms().
+
+    Recorded frames are written with write() as one record appended to a binary
+    side file. It returns a small reference dict to store in the results table in
+    place of the full trajectory. read_trajectory() loads the record back.
+    """
+
+    def __init__(
+        self,
+        n_atoms: int,
+        max_frames: int = 100,
+        *,
+        stride: int = 1,
+        keep_first: bool = True,
+        keep_last: bool = True,
+    ) -> None:
+        """Preallocate buffers.
+
+        Args:
+            n_atoms (int): Number of atoms in the structure.
+            max_frames (int): Max number of frames to keep (including first and
+                last). Defaults to 100.
+            stride (int): Only record every stride-th frame. Defaults to 1.
+            keep_first (bool): Always keep the first (initial) frame. Defaults to
+                True.
+            keep_last (bool): Always keep the most recent frame, even if not on
+                stride. Defaults to True.
+
+        Raises:
+            ValueError: If max_frames leaves no room for strided frames or stride < 1.
+        """
+        ring_size = max_frames - keep_first - keep_last
+        if ring_size < 1:
+            raise ValueError(
+                f"{max_frames=} must be > {keep_first + keep_last} with {keep_first=}"
+                f" and {keep_last=}"
+            )
+        if stride < 1:
+            raise ValueError(f"{stride=} must be >= 1")
+
+        self.n_atoms, self.stride = n_atoms, stride
+        self.keep_first, self.keep_last = keep_first, keep_last
+        # slot 0 holds the first frame, slot 1 the last, slots 2: are the ring
+        n_slots = 2 + ring_size
+        self.positions = np.zeros((n_slots, n_atoms, 3), dtype=np.float32)
+        self.cells = np.zeros((n_slots, 3, 3), dtype=np.float32)
+        self.energies = np.zeros(n_slots, dtype=np.float32)
+        self.steps = np.full(n_slots, -1, dtype=np.int32)
+        self.n_seen = 0  # number of frames offered to record()
+        self.n_ring = 0  # number of frames written to the ring (incl. overwritten)
+
+    def record(self, positions: np.ndarray, cell: np.ndarray, energy: float) -> None:
+        """Offer one frame to the recorder."""
+        step = self.n_seen
+        self.n_seen += 1
+        slots = []
+        if step == 0 and self.keep_first:
+            slots += [0]
+        elif step % self.stride == 0:
+            ring_size = len(self.steps) - 2
+            slots += [2 + self.n_ring % ring_size]
+            self.n_ring += 1
+        if self.keep_last:
+            slots += [1]
+        for slot in slots:
+            self.positions[slot] = positions
+            self.cells[slot] = cell
+            self.energies[slot] = energy
+            self.steps[slot] = step
+
+    def __call__(self, atoms: Atoms, energy: float) -> None:
+        """Record a frame from an Atoms object (relax_atoms() callback signature)."""
+        self.record(atoms.positions, atoms.cell.array, energy)
+
+    def frame_slots(self) -> np.ndarray:
+        """Buffer slots of the kept frames in chronological order."""
+        ring_size = len(self.steps) - 2
+        ring_start = self.n_ring % ring_size if self.n_ring > ring_size else 0
+        ring = 2 + np.roll(np.arange(min(self.n_ring, ring_size)), -ring_start)
+        slots = np.concatenate([[0], ring, [1]]).astype(int)
+        slots = slots[self.steps[slots] >= 0]
+        # drop last frame if it's already stored as first frame or in the ring
+        _, first_idx = np.unique(self.steps[slots], return_index=True)
+        return slots[np.sort(first_idx)]
+
+    @property
+    def n_frames(self) -> int:
+        """Number of frames currently kept."""
+        return len(self.frame_slots())
+
+    def frames(self) -> dict[str, np.ndarray]:
+        """Kept frames in chronological order.
+
+        Returns:
+            dict[str, np.ndarray]: steps (n_frames,) int32, energies (n_frames,),
+                cells (n_frames, 3, 3) and positions (n_frames, n_atoms, 3) float32.
+        """
+        slots = self.frame_slots()
+        return {
+            "steps": self.steps[slots],
+            "energies": self.energies[slots],
+            "cells": self.cells[slots],
+            "positions": self.positions[slots],
+        }
+
+    def write(self, file_path: str) -> dict[str, Any]:
+        """Append kept frames as one record to a binary side file.
+
+        Args:
+            file_path (str): Side file to append to, created if missing.
+
+        Returns:
+            dict[str, Any]: Reference to the record with keys traj_file (base name
+                of file_path so results and side file can be moved together),
+                offset (bytes), n_frames and n_atoms. Pass to read_trajectory().
+        """
+        frames = self.frames()
+        with open(file_path, mode="ab") as file:
+            offset = file.tell()
+            for key in TRAJ_FIELDS:
+                frames[key].tofile(file)
+        return {
+            "traj_file": os.path.basename(file_path),
+            "offset": offset,
+            "n_frames": len(frames["steps"]),
+            "n_atoms": self.n_atoms,
+        }
+
+
+def read_trajectory(ref: dict[str, Any], root: str = "") -> dict[str, np.ndarray]:
+    """Read one trajectory record written by TrajectoryRecorder.write().
+
+    Args:
+        ref (dict[str, Any]): Reference returned by TrajectoryRecorder.write().
+        root (str): Directory containing the side file, usually the directory of the
+            results file ref was loaded from. Defaults to "" (current directory).
+
+    Returns:
+        dict[str, np.ndarray]: Same format as TrajectoryRecorder.frames().
+    """
+    n_frames, n_atoms = ref["n_frames"], ref["n_atoms"]
+    shapes = {
+        "steps": (n_frames,),
+        "energies": (n_frames,),
+        "cells": (n_frames, 3, 3),
+        "positions": (n_frames, n_atoms, 3),
+    }
+    frames: dict[str, np.ndarray] = {}
+    with open(os.path.join(root, ref["traj_file"]), mode="rb") as file:
+        file.seek(ref["offset"])
+        for key in TRAJ_FIELDS:
+            dtype = np.int32 if key == "steps" else np.float32
+            count = int(np.prod(shapes[key]))
+            frames[key] = np.fromfile(file, dtype=dtype, count=count)
+            if len(frames[key]) != count:
+                raise ValueError(f"Truncated trajectory record {ref=}")
+            frames[key] = frames[key].reshape(shapes[key])
+    return frames
+
+
+def _json_default(obj: Any) -> Any:
+    """Serialize numpy arrays/scalars and MSONable objects (e.g. Structure) to JSON."""
+    if isinstance(obj, np.ndarray | np.generic):
+        return obj.tolist()
+    from matbench_discovery.data import as_dict_handler
+
+    return as_dict_handler(obj)
+
+
+# bytes of compressed data fed to zlib at a time when reading results files
+GZIP_CHUNK_SIZE: Final = 1 << 16
+
+
+def _read_gzip_members(file_path: str) -> tuple[list[bytes], int]:
+    """Decompress each complete gzip member in a multi-member gzip file.
+
+    Reading stops at the first truncated or corrupt member, e.g. one that was being
+    appended when a job got killed.
+
+    Args:
+        file_path (str): Path to the gzip file.
+
+    Returns:
+        tuple[list[bytes], int]: Decompressed members and the number of bytes in
+            file_path they span, i.e. the size the file should be truncated to
+            before appending new members.
+    """
+    with open(file_path, mode="rb") as file:
+        data = memoryview(file.read())
+    members: list[bytes] = []
+    offset = 0
+    while offset < len(data):
+        decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)  # gzip header
+        # feed fixed-size slices of the zero-copy view so neither the input nor
+        # decompressor.unused_data copies the rest of the file for every member
+        chunks: list[bytes] = []
+        end = offset
+        try:
+            while not decompressor.eof and end < len(data):
+                chunks += [decompressor.decompress(data[end : end + GZIP_CHUNK_SIZE])]
+                end = min(end + GZIP_CHUNK_SIZE, len(data))
+        except zlib.error:
+            break
+        if not decompressor.eof:
+            break
+        members += [b"".join(chunks)]
+        offset = end - len(decompressor.unused_data)
+    return members, offset
+
+
+class RelaxResultsSink:
+    """Append finished relaxations to a gzipped JSON lines file as they come in.
+
+    Records are buffered and appended as a new gzip member every flush_every
+    records or flush_secs seconds (whichever comes first) and when the sink is
+    closed, so a job that gets killed loses at most the records since the last
+    flush. On restart, the ids of records already in the file are available as
+    done_ids (or via `mat_id in sink`) to skip finished structures, and a gzip
+    member left incomplete by a killed job is dropped before new records are
+    appended.
+
+    Use as context manager to flush remaining records on exit:
+
+        with RelaxResultsSink(out_path) as sink:
+            for atoms in atoms_list:
+                if atoms.info[Key.mat_id] in sink:
+                    continue
+                ...
+                sink.write(atoms.info[Key.mat_id], {"energy": energy})
+    """
+
+    def __init__(
+        self,
+        file_path: str,
+        *,
+        id_key: str = "material_id",  # = pymatviz Key.mat_id
+        flush_every: int = 100,
+        flush_secs: float = 60,
+    ) -> None:
+        """Load ids of previously written records.
+
+        Args:
+            file_path (str): Path to the .jsonl.gz file to append to, created on
+                first flush if missing.
+            id_key (str): Record key to store structure ids under. Defaults to
+                "material_id".
+            flush_every (int): Flush after this many buffered records. Defaults
+                to 100.
+            flush_secs (float): Flush on the next write() at least this many seconds
+                after the last flush. Defaults to 60.
+        """
+        self.file_path, self.id_key = file_path, id_key
+        self.flush_every, self.flush_secs = flush_every, flush_secs
+        self.done_ids: set[str] = set()
+        self._lines: list[str] = []
+        self._last_flush = time.monotonic()
+
+        if not os.path.isfile(file_path):
+            return
+        members, valid_size = _read_gzip_members(file_path)
+        for member in members:
+            for line in member.decode().splitlines():
+                self.done_ids.add(json.loads(line)[id_key])
+        if os.path.getsize(file_path) > valid_size:
+            with open(file_path, mode="r+b") as file:
+                file.truncate(valid_size)
+
+    def __contains__(self, struct_id: str) -> bool:
+        """Whether a record for struct_id was written (flushed or buffered)."""
+        return struct_id in self.done_ids
+
+    def write(self, struct_id: str, record: dict[str, Any]) -> None:
+        """Buffer one finished structure and flush if due.
+
+        Args:
+            struct_id (str): Structure ID, stored under id_key.
+            record (dict[str, Any]): JSON-serializable results. numpy arrays and
+                objects with as_dict() (e.g. pymatgen Structure) are converted.
+        """
+        self._lines += [
+            json.dumps({self.id_key: struct_id} | record, default=_json_default)
+        ]
+        self.done_ids.add(struct_id)
+        if (
+            len(self._lines) >= self.flush_every
+            or time.monotonic() - self._last_flush >= self.flush_secs
+        ):
+            self.flush()
+
+    def flush(self) -> None:
+        """Append buffered records to file_path as one complete gzip member."""
+        self._last_flush = time.monotonic()
+        if not self._lines:
+            return
+        if out_dir := os.path.dirname(self.file_path):
+            os.makedirs(out_dir, exist_ok=True)
+        data = gzip.compress("".join(f"{line}\n" for line in self._lines).encode())
+        with open(self.file_path, mode="ab") as file:
+            file.write(data)
+            file.flush()
+            os.fsync(file.fileno())
+        self._lines = []
+
+    def __enter__(self) -> Self:
+        """Return self for use in with statements."""
+        return self
+
+    def __exit__(self, *_exc: object) -> None:
+        """Flush remaining records, also when exiting due to an exception."""
+        self.flush()
+
+
+def read_relax_results(file_path: str) -> pd.DataFrame:
+    """Read a results file written by RelaxResultsSink.
+
+    Pass as reader to glob_to_df() to combine the files of all tasks in a slurm job
+    array. Records in a gzip member truncated by a killed job are ignored.
+
+    Args:
+        file_path (str): Path to the .jsonl.gz file.
+
+    Returns:
+        pd.DataFrame: One row per record with columns for each record key.
+    """
+    import pandas as pd
+
+    records = [
+        json.loads(line)
+        for member in _read_gzip_members(file_path)[0]
+        for line in member.decode().splitlines()
+    ]
+    return pd.DataFrame(records)
+
+
+def relax_atoms(
+    atoms: Atoms,
+    calculator: Calculator,
+    *,
+    optimizer: str | type[Optimizer] = "FIRE",
+    fmax: float = 0.05,
+    max_steps: int = 500,
+    cell_filter: type[Filter] | None = FrechetCellFilter,
+    callback: Callable[[Atoms, float], None] | None = None,
+    traj_kwargs: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Relax a single structure.
+
+    Args:
+        atoms (Atoms): Structure to relax. Not modified, a copy is relaxed.
+        calculator (Calculator): ASE calculator.
+        optimizer (str | type[Optimizer]): ASE optimizer class or one of
+            OPTIMIZERS. Defaults to "FIRE".
+        fmax (float): Force convergence threshold in eV/Å. Defaults to 0.05.
+        max_steps (int): Maximum number of optimizer steps. If 0, only a single-point
+            calculation is done. Defaults to 500.
+        cell_filter (type[Filter] | None): ASE filter class to relax the cell
+            together with atomic positions. None to keep the cell fixed. Defaults to
+            FrechetCellFilter.
+        callback (Callable[[Atoms, float], None] | None): Called with the atoms and
+            their energy after every optimizer step (e.g. to record trajectories).
+            Defaults to None.
+        traj_kwargs (dict[str, Any] | None): If not None, record the trajectory
+            with TrajectoryRecorder(len(atoms), **traj_kwargs). Works in worker
+            processes where callbacks can't be used. Defaults to None.
+
+    Returns:
+        dict[str, Any]: with keys atoms (relaxed copy without calculator), energy
+            (float), n_steps (int), converged (bool) and trajectory
+            (TrajectoryRecorder, only if traj_kwargs is not None).
+    """
+    optim_cls = OPTIMIZERS[optimizer] if isinstance(optimizer, str) else optimizer
+    atoms = atoms.copy()
+    atoms.calc = calculator
+    n_steps, converged = 0, True
+    recorder = (
+        TrajectoryRecorder(len(atoms), **traj_kwargs)
+        if traj_kwargs is not None
+        else None
+    )
+
+    if max_steps > 0:
+        target = cell_filter(atoms) if cell_filter else atoms
+        optim = optim_cls(target, logfile=None)
+        for observer in (callback, recorder):
+            if observer is not None:
+                optim.attach(
+                    lambda observer=observer: observer(
+                        atoms, atoms.get_potential_energy()
+                    )
+                )
+        converged = optim.run(fmax=fmax, steps=max_steps)
+        n_steps = optim.nsteps
+
+    energy = float(atoms.get_potential_energy())
+    atoms.calc = None  # relaxed atoms may be pickled back from worker processes
+    result = {
+        "atoms": atoms,
+        "energy": energy,
+        "n_steps": n_steps,
+        "converged": bool(converged),
+    }
+    if recorder is not None:
+        if recorder.n_seen == 0:  # single-point calculation
+            recorder(atoms, energy)
+        result["trajectory"] = recorder
+    return result
+
+
+_worker_calculator: Calculator | None = None
+
+
+def _init_relax_worker(calculator_factory: Callable[[], Calculator]) -> None:
+    """Create one calculator per worker process."""
+    global _worker_calculator  # noqa: PLW0603
+    _worker_calculator = calculator_factory()
+
+
+def _relax_atoms_worker(
+    idx: int, atoms: Atoms, relax_kwargs: dict[str, Any]
+) -> tuple[int, dict[str, Any]]:
+    """Relax one structure in a worker process, returning errors instead of raising."""
+    calculator: Calculator = _worker_calculator  # type: ignore[assignment]
+    try:
+        return idx, relax_atoms(atoms, calculator, **relax_kwargs)
+    except Exception as exc:
+        return idx, {"error": f"{exc!r}"}
+
+
+def relax_structures(
+    atoms_list: Sequence[Atoms],
+    calculator_factory: Callable[[], Calculator],
+    *,
+    n_workers: int = 1,
+    pbar_kwargs: dict[str, Any] | None = None,
+    **relax_kwargs: Any,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Relax many structures concurrently, yielding results as they finish.
+
+    With n_workers > 1, structures are distributed over a process pool whose workers
+    each build their own calculator via calculator_factory. At most 2 * n_workers
+    structures are in flight so memory stays bounded for large inputs. Structures
+    whose relaxation fails are reported and skipped.
+
+    Args:
+        atoms_list (Sequence[Atoms]): Structures to relax (not modified).
+        calculator_factory (Callable[[], Calculator]): Picklable zero-argument
+            callable (e.g. a class or functools.partial) returning an ASE
+            calculator. Called once per worker process (or once in-process if
+            n_workers is 1).
+        n_workers (int): Number of worker processes. Defaults to 1, meaning relax
+            serially in the current process.
+        pbar_kwargs (dict[str, Any] | None): Passed to tqdm progress bar.
+            Defaults to None.
+        **relax_kwargs: Passed to relax_atoms() (optimizer, fmax, max_steps,
+            cell_filter, traj_kwargs). callback is only supported with n_workers=1.
+
+    Yields:
+        tuple[int, dict[str, Any]]: Index into atoms_list and relax_atoms() result,
+            in order of completion.
+    """
+    if n_workers > 1 and relax_kwargs.get("callback"):
+        raise ValueError("callback is not supported with n_workers > 1")
+    pbar = tqdm(total=len(atoms_list), desc="Relaxing", **pbar_kwargs or {})
+
+    if n_workers <= 1:
+        calculator = calculator_factory()
+        for idx, atoms in enumerate(atoms_list):
+            try:
+                result = relax_atoms(atoms, calculator, **relax_kwargs)
+            except Exception as exc:
+                print(f"Failed to relax {_struct_id(atoms, idx)}: {exc!r}")
+                continue
+            finally:
+                pbar.update()
+            yield idx, result
+        pbar.close()
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=n_workers,
+        initializer=_init_relax_worker,
+        initargs=(calculator_factory,),
+    ) as executor:
+        todo = iter(enumerate(atoms_list))
+        in_flight: set = set()
+        while True:
+            for idx, atoms in todo:
+                in_flight.add(
+                    executor.submit(_relax_atoms_worker, idx, atoms, relax_kwargs)
+                )
+                if len(in_flight) >= 2 * n_workers:
+                    break
+            if not in_flight:
+                break
+            done, in_flight = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in done:
+                idx, result = future.result()
+                pbar.update()
+                if "error" in result:
+                    struct_id = _struct_id(atoms_list[idx], idx)
+                    print(f"Failed to relax {struct_id}: {result['error']}")
+                    continue
+                yield idx, result
+    pbar.close()
+
+
+def _struct_id(atoms: Atoms, idx: int) -> str:
+    """Material ID of a structure for error messages, falling back on its index."""
+    from pymatviz.enums import Key
+
+    return str(atoms.info.get(Key.mat_id, f"structure {idx}"))
+
+
+def batch_calculator_from_ase(
+    calculator: Calculator, *, compute_stress: bool = True
+) -> BatchCalculator:
+    """Wrap a regular ASE calculator into a BatchCalculator.
+
+    The wrapper evaluates structures one after another, so it gives no speedup by
+    itself but lets relax_batch_fire() run with any ASE calculator (e.g. for
+    testing or calculators without native batching).
+
+    Args:
+        calculator (Calculator): ASE calculator.
+        compute_stress (bool): Whether to also compute stresses (needed for cell
+            relaxation). Defaults to True.
+
+    Returns:
+        BatchCalculator: Callable evaluating energies, forces and stresses.
+    """
+
+    def batch_calc(
+        atoms_list: Sequence[Atoms],
+    ) -> tuple[np.ndarray, list[np.ndarray], np.ndarray | None]:
+        energies, forces, stresses = [], [], []
+        for atoms in atoms_list:
+            atoms.calc = calculator
+            energies += [atoms.get_potential_energy()]
+            forces += [atoms.get_forces()]
+            if compute_stress:
+                stresses += [atoms.get_stress(voigt=True)]
+            atoms.calc = None
+        return (
+            np.array(energies, dtype=float),
+            forces,
+            np.array(stresses) if compute_stress else None,
+        )
+
+    return batch_calc
+
+
+def _dof_dot(
+    atom_vals: np.ndarray, cell_vals: np.ndarray, seg: np.ndarray
+) -> np.ndarray:
+    """Per-structure sum over stacked atom rows and cell degrees of freedom.
+
+    atom_vals has shape (n_atoms_total, 3) with seg mapping each row to its
+    structure, cell_vals has shape (n_structs, 3, 3).
+    """
+    atom_sums = np.bincount(
+        seg, weights=atom_vals.sum(axis=1), minlength=len(cell_vals)
+    )
+    return atom_sums + cell_vals.sum(axis=(1, 2))
+
+
+def relax_batch_fire(
+    atoms_list: Sequence[Atoms],
+    batch_calculator: BatchCalculator,
+    *,
+    fmax: float = 0.05,
+    max_steps: int = 500,
+    relax_cell: bool = True,
+    batch_size: int | None = None,
+    dt: float = 0.1,
+    max_step: float = 0.2,
+    dt_max: float = 1.0,
+    n_min: int = 5,
+    f_inc: float = 1.1,
+    f_dec: float = 0.5,
+    alpha_start: float = 0.1,
+    f_alpha: float = 0.99,
+    callback: Callable[[int, Atoms, float], None] | None = None,
+    traj_kwargs: dict[str, Any] | None = None,
+    pbar_kwargs: dict[str, Any] | None = None,
+) -> Iterator[tuple[int, dict[str, Any]]]:
+    """Relax many structures with FIRE on stacked arrays and one calculator call per
+    step for the whole batch.
+
+    Follows ase.optimize.FIRE step for step (same defaults) with each structure
+    keeping its own velocity, time step and mixing parameter. Positions of all
+    structures are stacked into one (n_atoms_total, 3) array and cells into
+    (n_structs, 3, 3) so the FIRE update is a handful of vectorized NumPy ops. With
+    relax_cell, cell degrees of freedom are parametrized like ase.filters.
+    UnitCellFilter (deformation gradient scaled by the number of atoms). Each
+    structure has a convergence mask: once its max force (including cell forces)
+    drops below fmax or it hits max_steps, it is yielded and removed from the
+    batch, and the next pending structure takes its place.
+
+    Args:
+        atoms_list (Sequence[Atoms]): Structures to relax (not modified).
+        batch_calculator (BatchCalculator): Callable taking a list of Atoms and
+            returning energies (n,), per-structure forces and Voigt stresses (n, 6)
+            (stresses may be None if relax_cell=False). See
+            batch_calculator_from_ase() to wrap a regular ASE calculator.
+        fmax (float): Force convergence threshold in eV/Å. Defaults to 0.05.
+        max_steps (int): Maximum number of FIRE steps per structure. Defaults to 500.
+        relax_cell (bool): Whether to relax the cell. Defaults to True.
+        batch_size (int | None): Max number of structures evaluated together.
+            Defaults to None, meaning all at once.
+        dt (float): Initial time step (dt in ase.optimize.FIRE). Defaults to 0.1.
+        max_step (float): Max norm of each structure's step (maxstep). Defaults
+            to 0.2.
+        dt_max (float): Max time step (dtmax). Defaults to 1.0.
+        n_min (int): Downhill steps before increasing dt (Nmin). Defaults to 5.
+        f_inc (float): Factor to increase dt by (finc). Defaults to 1.1.
+        f_dec (float): Factor to decrease dt by after uphill steps (fdec).
+            Defaults to 0.5.
+        alpha_start (float): Initial velocity mixing parameter (astart).
+            Defaults to 0.1.
+        f_alpha (float): Factor to decrease alpha by (fa). Defaults to 0.99.
+        callback (Callable[[int, Atoms, float], None] | None): Called with index into
+            atoms_list, current atoms and energy after every force evaluation.
+            Defaults to None.
+        traj_kwargs (dict[str, Any] | None): If not None, record each structure's
+            trajectory with TrajectoryRecorder(n_atoms, **traj_kwargs), returned
+            under key trajectory. Defaults to None.
+        pbar_kwargs (dict[str, Any] | None): Passed to tqdm progress bar.
+            Defaults to None.
+
+    Yields:
+        tuple[int, dict[str, Any]]: Index into atoms_list and result dict with the
+            same keys as relax_atoms(), in order of completion.
+    """
+    batch_size = batch_size or len(atoms_list)
+    pending = deque(range(len(atoms_list)))
+    pbar = tqdm(total=len(atoms_list), desc="Batched FIRE", **pbar_kwargs or {})
+
+    # per-structure state of the active batch
+    idx_arr = np.zeros(0, dtype=int)  # index into atoms_list
+    active: list[Atoms] = []
+    n_atoms = np.zeros(0, dtype=int)
+    n_steps = np.zeros(0, dtype=int)
+    dts, alphas = np.zeros(0), np.zeros(0)
+    n_pos = np.zeros(0, dtype=int)  # consecutive downhill steps (Nsteps in ASE)
+    is_first = np.zeros(0, dtype=bool)
+    orig_cells = np.zeros((0, 3, 3))
+    # stacked degrees of freedom and velocities like ase.filters.UnitCellFilter:
+    # atom positions with the inverse cell deformation applied and deformation
+    # gradients (scaled by n_atoms to get cell DOFs)
+    pos, vel = np.zeros((0, 3)), np.zeros((0, 3))
+    deform, cell_vel = np.zeros((0, 3, 3)), np.zeros((0, 3, 3))
+    recorders: dict[int, TrajectoryRecorder] = {}  # index into atoms_list -> recorder
+
+    while pending or active:
+        # refill batch with pending structures
+        n_new = min(len(pending), batch_size - len(active))
+        new_idx = [pending.popleft() for _ in range(n_new)]
+        if new_idx:
+            new_atoms = [atoms_list[idx].copy() for idx in new_idx]
+            for idx, atoms in zip(new_idx, new_atoms, strict=True):
+                atoms.calc = None
+                if traj_kwargs is not None:
+                    recorders[idx] = TrajectoryRecorder(len(atoms), **traj_kwargs)
+            active += new_atoms
+            idx_arr = np.concatenate([idx_arr, new_idx])
+            n_atoms = np.concatenate([n_atoms, [len(atoms) for atoms in new_atoms]])
+            n_steps = np.concatenate([n_steps, np.zeros(len(new_idx), dtype=int)])
+            dts = np.concatenate([dts, np.full(len(new_idx), dt)])
+            alphas = np.concatenate([alphas, np.full(len(new_idx), alpha_start)])
+            n_pos = np.concatenate([n_pos, np.zeros(len(new_idx), dtype=int)])
+            is_first = np.concatenate([is_first, np.ones(len(new_idx), dtype=bool)])
+            orig_cells = np.concatenate(
+                [orig_cells, [atoms.cell.array for atoms in new_atoms]]
+            )
+            pos = np.concatenate([pos, *(atoms.positions for atoms in new_atoms)])
+            vel = np.concatenate([vel, np.zeros((sum(map(len, new_atoms)), 3))])
+            deform = np.concatenate([deform, np.tile(np.eye(3), (len(new_idx), 1, 1))])
+            cell_vel = np.concatenate([cell_vel, np.zeros((len(new_idx), 3, 3))])
+
+        n_structs = len(active)
+        seg = np.repeat(np.arange(n_structs), n_atoms)  # structure index of each atom
+        energies, forces_list, stresses = batch_calculator(active)
+        energies = np.asarray(energies, dtype=float)
+        forces = np.concatenate(forces_list) if n_structs else np.zeros((0, 3))
+
+        for struct_idx, atoms in enumerate(active):
+            idx, energy = int(idx_arr[struct_idx]), float(energies[struct_idx])
+            if callback is not None:
+                callback(idx, atoms, energy)
+            if idx in recorders:
+                recorders[idx](atoms, energy)
+
+        # generalized forces on positions (F @ deform) and cells (virial @ F^-T / N)
+        forces = np.einsum("ri,rij->rj", forces, deform[seg])
+        if relax_cell:
+            if stresses is None:
+                raise ValueError("batch_calculator must return stresses to relax cell")
+            volumes = np.abs(np.linalg.det([atoms.cell.array for atoms in active]))
+            stress_3x3 = np.array([voigt_6_to_full_3x3_stress(s) for s in stresses])
+            virials = -volumes[:, None, None] * stress_3x3
+            cell_forces = (
+                np.linalg.solve(deform, virials.transpose(0, 2, 1)).transpose(0, 2, 1)
+                / n_atoms[:, None, None]
+            )
+        else:
+            cell_forces = np.zeros((n_structs, 3, 3))
+
+        # per-structure convergence mask like ase.optimize.Optimizer.converged()
+        max_force = np.zeros(n_structs)
+        np.maximum.at(max_force, seg, np.linalg.norm(forces, axis=1))
+        max_force = np.maximum(max_force, np.linalg.norm(cell_forces, axis=2).max(1))
+        is_done = (max_force < fmax) | (n_steps >= max_steps)
+
+        for struct_idx in np.flatnonzero(is_done):
+            idx = int(idx_arr[struct_idx])
+            result = {
+                "atoms": active[struct_idx],
+                "energy": float(energies[struct_idx]),
+                "n_steps": int(n_steps[struct_idx]),
+                "converged": bool(max_force[struct_idx] < fmax),
+            }
+            if idx in recorders:
+                result["trajectory"] = recorders.pop(idx)
+            pbar.update()
+            yield idx, result
+
+        if is_done.any():  # drop finished structures from the batch
+            keep, keep_atoms = ~is_done, ~is_done[seg]
+            active = [atoms for atoms, k in zip(active, keep, strict=True) if k]
+            idx_arr, n_atoms, n_steps = idx_arr[keep], n_atoms[keep], n_steps[keep]
+            dts, alphas, n_pos = dts[keep], alphas[keep], n_pos[keep]
+            is_first, orig_cells = is_first[keep], orig_cells[keep]
+            deform, cell_vel = deform[keep], cell_vel[keep]
+            cell_forces = cell_forces[keep]
+            pos, vel, forces = pos[keep_atoms], vel[keep_atoms], forces[keep_atoms]
+            n_structs = len(active)
+            seg = np.repeat(np.arange(n_structs), n_atoms)
+        if n_structs == 0:
+            continue
+
+        # FIRE update with per-structure dt, alpha and downhill step counter
+        v_dot_f = _dof_dot(vel * forces, cell_vel * cell_forces, seg)
+        f_norm = np.sqrt(_dof_dot(forces**2, cell_forces**2, seg))
+        v_norm = np.sqrt(_dof_dot(vel**2, cell_vel**2, seg))
+
+        downhill = ~is_first & (v_dot_f > 0)
+        uphill = ~is_first & ~downhill
+        mix = np.where(downhill, alphas * v_norm / np.where(f_norm > 0, f_norm, 1), 0)
+        keep_vel = np.where(downhill, 1 - alphas, 1.0)
+        keep_vel[uphill] = 0  # reset velocities when going uphill
+        vel = keep_vel[seg, None] * vel + mix[seg, None] * forces
+        cell_vel = keep_vel[:, None, None] * cell_vel + mix[:, None, None] * cell_forces
+
+        grow = downhill & (n_pos > n_min)
+        dts = np.where(grow, np.minimum(dts * f_inc, dt_max), dts)
+        alphas = np.where(grow, alphas * f_alpha, alphas)
+        n_pos = np.where(downhill, n_pos + 1, n_pos)
+        alphas = np.where(uphill, alpha_start, alphas)
+        dts = np.where(uphill, dts * f_dec, dts)
+        n_pos = np.where(uphill, 0, n_pos)
+        is_first[:] = False
+
+        vel += dts[seg, None] * forces
+        cell_vel += dts[:, None, None] * cell_forces
+        d_pos, d_cell = dts[seg, None] * vel, dts[:, None, None] * cell_vel
+        step_norm = np.sqrt(_dof_dot(d_pos**2, d_cell**2, seg))
+        scale = np.where(step_norm > max_step, max_step / step_norm, 1.0)
+
+        pos += scale[seg, None] * d_pos
+        deform += scale[:, None, None] * d_cell / n_atoms[:, None, None]
+        n_steps += 1
+
+        # apply deformation (cell = orig_cell @ F^T, positions = pos @ F^T) and write
+        # back to atoms for the next force evaluation
+        cells = orig_cells @ deform.transpose(0, 2, 1)
+        positions = np.einsum("ri,rji->rj", pos, deform[seg])
+        starts = np.concatenate([[0], np.cumsum(n_atoms)[:-1]])
+        for struct_idx, atoms in enumerate(active):
+            atoms.set_cell(cells[struct_idx], scale_atoms=False)
+            start = starts[struct_idx]
+            atoms.positions = positions[start : start + n_atoms[struct_idx]]
+
+    pbar.close()
@@ -1,28 +1,165 @@
 """Files download functions."""
 
 import builtins
+import functools
+import hashlib
 import os
 import sys
 import traceback
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import TYPE_CHECKING, Any
 
 import requests
+from requests.adapters import HTTPAdapter
+from tqdm import tqdm
+from urllib3.util.retry import Retry
 
+if TYPE_CHECKING:
+    from matbench_discovery.enums import DataFiles, Model
 
-def download_file(file_path: str, url: str) -> None:
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+@functools.cache
+def get_session(retries: int = 3, backoff_factor: float = 0.5) -> requests.Session:
+    """Shared HTTP session with connection pooling and retries with exponential
+    backoff on connection errors and transient server errors (429, 5xx).
+
+    Only idempotent requests (GET, HEAD, PUT, DELETE, ...) are retried, never POST.
+    """
+    retry = Retry(
+        total=retries,
+        backoff_factor=backoff_factor,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=Retry.DEFAULT_ALLOWED_METHODS,
+    )
+    adapter = HTTPAdapter(max_retries=retry, pool_maxsize=16)
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def download_file(
+    file_path: str,
+    url: str,
+    *,
+    md5: str | None = None,
+    max_attempts: int = 3,
+    chunk_size: int = 1 << 20,
+    timeout: float = 30,
+) -> bool:
     """Download the file from the given URL to the given file path.
     Prints rather than raises if the file cannot be downloaded.
+
+    The response is streamed to a {file_path}.part file which is only moved to
+    file_path once complete (and its MD5 hash matches if md5 is given). Interrupted
+    downloads resume from the partial file with an HTTP Range request, both when the
+    connection drops mid-stream and on the next call after a crash.
+
+    Args:
+        file_path (str): Where to save the downloaded file.
+        url (str): URL to download.
+        md5 (str | None): Expected MD5 hex digest of the file. If the downloaded
+            file doesn't match, it is deleted and an error printed. Defaults to None.
+        max_attempts (int): How often to resume a download after the connection
+            drops mid-stream (with some bytes received). Defaults to 3.
+        chunk_size (int): Bytes to read from the response at a time. Defaults to
+            1 MiB.
+        timeout (float): Seconds to wait for the server to respond. Defaults to 30.
+
+    Returns:
+        bool: Whether the file was downloaded (and matched md5 if given). If False,
+            a pre-existing file at file_path is left untouched.
     """
     file_dir = os.path.dirname(file_path)
     os.makedirs(file_dir, exist_ok=True)
+    part_path = f"{file_path}.part"
     try:
-        response = requests.get(url, timeout=5)
+        for attempt in range(1, max_attempts + 1):
+            n_bytes = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+            try:
+                file_hash = _stream_to_part_file(
+                    part_path, url, chunk_size=chunk_size, timeout=timeout
+                )
+                break
+            except (
+                requests.ConnectionError,
+                requests.Timeout,
+                requests.exceptions.ChunkedEncodingError,  # dropped mid-stream
+            ):
+                # only resume if this attempt made progress, failed connects are
+                # already retried with backoff by the session
+                made_progress = (
+                    os.path.isfile(part_path) and os.path.getsize(part_path) > n_bytes
+                )
+                if attempt == max_attempts or not made_progress:
+                    raise
 
-        response.raise_for_status()
+        if md5 and file_hash != md5:
+            os.remove(part_path)
+            raise ValueError(f"MD5 mismatch: expected {md5}, got {file_hash}")
 
-        with open(file_path, mode="wb") as file:
-            file.write(response.content)
-    except requests.RequestException:
+        os.replace(part_path, file_path)
+    except (requests.RequestException, ValueError):
         print(f"Error downloading {url=}\nto {file_path=}.\n{traceback.format_exc()}")
+        return False
+    return True
+
+
+def file_md5(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """MD5 hex digest of a file's contents, read in chunks of chunk_size bytes."""
+    md5 = hashlib.md5(usedforsecurity=False)
+    with open(file_path, mode="rb") as file:
+        while chunk := file.read(chunk_size):
+            md5.update(chunk)
+    return md5.hexdigest()
+
+
+def _stream_to_part_file(
+    part_path: str, url: str, *, chunk_size: int, timeout: float
+) -> str:
+    """Stream url into part_path, resuming from its current size if it exists.
+
+    Returns:
+        str: MD5 hex digest of the complete part file.
+    """
+    md5 = hashlib.md5(usedforsecurity=False)
+    n_bytes = os.path.getsize(part_path) if os.path.isfile(part_path) else 0
+    headers = {"Range": f"bytes={n_bytes}-"} if n_bytes else {}
+
+    with get_session().get(
+        url, headers=headers, stream=True, timeout=timeout
+    ) as response:
+        if n_bytes and response.status_code == 416:
+            # Range Not Satisfiable: part file is only complete if its size matches
+            # the remote size in "Content-Range: bytes */<size>". Otherwise it's
+            # stale (e.g. larger than the remote file), so restart from byte 0.
+            content_range = response.headers.get("Content-Range", "")
+            if content_range.rpartition("/")[2] != str(n_bytes):
+                os.remove(part_path)
+                return _stream_to_part_file(
+                    part_path, url, chunk_size=chunk_size, timeout=timeout
+                )
+            resume, chunks = True, iter(())
+        else:
+            response.raise_for_status()
+            # server may ignore the Range header and resend the whole file with 200
+            resume = n_bytes > 0 and response.status_code == 206
+            chunks = response.iter_content(chunk_size=chunk_size)
+
+        if resume:  # hash the previously downloaded bytes
+            with open(part_path, mode="rb") as file:
+                while chunk := file.read(chunk_size):
+                    md5.update(chunk)
+
+        with open(part_path, mode="ab" if resume else "wb") as file:
+            for chunk in chunks:
+                md5.update(chunk)
+                file.write(chunk)
+    return md5.hexdigest()
 
 
 def maybe_auto_download_file(url: str, abs_path: str, label: str | None = None) -> None:
@@ -47,3 +184,141 @@ def maybe_auto_download_file(url: str, abs_path: str, label: str | None = None)
     if answer.lower().strip() == "y":
         print(f"Downloading {label!r} from {url!r} to {abs_path!r}")
         download_file(abs_path, url)
+
+
+def _iter_download_targets(
+    files: Iterable["DataFiles | Model"], cache_dir: str | None = None
+) -> Iterator[tuple[str, str, str, str | None]]:
+    """Yield (label, url, abs_path, md5) for every file needed by each DataFiles or
+    Model member. For models, that's every metrics.*.pred_file with a pred_file_url.
+    """
+    from matbench_discovery import ROOT
+    from matbench_discovery.enums import DataFiles, Model
+
+    def walk_metrics(label: str, metrics: Any) -> Iterator[tuple[str, ...]]:
+        if not isinstance(metrics, dict):
+            return
+        pred_file, url = metrics.get("pred_file"), metrics.get("pred_file_url")
+        if isinstance(pred_file, str) and isinstance(url, str):
+            yield label, url, f"{ROOT}/{pred_file}"
+        for key, val in metrics.items():
+            yield from walk_metrics(f"{label}.{key}", val)
+
+    for file in files:
+        if isinstance(file, DataFiles):
+            base_dir = cache_dir or DataFiles.base_dir
+            yield file.name, file.url, f"{base_dir}/{file.rel_path}", file.md5
+        elif isinstance(file, Model):
+            for label, url, abs_path in walk_metrics(file.name, file.metrics):
+                yield label, url, abs_path, None
+        else:
+            raise TypeError(f"Expected DataFiles or Model, got {type(file).__name__}")
+
+
+def _fetch_if_needed(url: str, abs_path: str, md5: str | None) -> str:
+    """Download url to abs_path unless it exists with matching checksum.
+
+    Returns:
+        str: "cached", "downloaded" or "failed".
+    """
+    if os.path.isfile(abs_path) and (md5 is None or file_md5(abs_path) == md5):
+        return "cached"
+    # a stale file that failed the MD5 check is still on disk if the download fails
+    return "downloaded" if download_file(abs_path, url, md5=md5) else "failed"
+
+
+def prefetch(
+    files: Iterable["DataFiles | Model"],
+    *,
+    workers: int = 8,
+    cache_dir: str | None = None,
+    pbar_kwargs: dict[str, Any] | None = None,
+) -> dict[str, str]:
+    """Download many data and model prediction files concurrently.
+
+    DataFiles.path and Model.discovery_path etc. download lazily one file at a time.
+    Call this up front (e.g. on a fresh compute node) to fetch everything a script
+    needs in parallel instead. Existing files are skipped if their MD5 hash matches
+    data-files.yml (or, for files without a recorded hash, if they exist at all).
+
+    Args:
+        files (Iterable[DataFiles | Model]): Data files to download and/or models
+            whose prediction files (any metrics.*.pred_file) to download.
+        workers (int): Max number of concurrent downloads. Defaults to 8.
+        cache_dir (str | None): Where to save DataFiles. Defaults to
+            DataFiles.base_dir, i.e. MBD_CACHE_DIR if set.
+        pbar_kwargs (dict[str, Any] | None): Passed to tqdm progress bar.
+
+    Returns:
+        dict[str, str]: Map of absolute file paths to "cached", "downloaded" or
+            "failed".
+    """
+    targets = {  # dedupe files shared between models by path
+        abs_path: (label, url, md5)
+        for label, url, abs_path, md5 in _iter_download_targets(files, cache_dir)
+    }
+    statuses: dict[str, str] = {}
+    if not targets:
+        return statuses
+
+    pbar_kwargs = {"desc": "Prefetching files", "unit": "file"} | (pbar_kwargs or {})
+    with (
+        ThreadPoolExecutor(max_workers=max(1, min(workers, len(targets)))) as executor,
+        tqdm(total=len(targets), **pbar_kwargs) as pbar,
+    ):
+        futures = {
+            executor.submit(_fetch_if_needed, url, abs_path, md5): abs_path
+            for abs_path, (_label, url, md5) in targets.items()
+        }
+        for future in as_completed(futures):
+            abs_path = futures[future]
+            statuses[abs_path] = future.result()
+            pbar.update(1)
+            pbar.set_postfix(Counter(statuses.values()))
+
+    return statuses
+
+
+def main(argv: list[str] | None = None) -> int:
+    """CLI to prefetch data files and model predictions.
+
+    Example:
+        python -m matbench_discovery.remote.fetch wbm_summary mace_mp_0 --workers 4
+    """
+    from argparse import ArgumentParser
+
+    from matbench_discovery.enums import DataFiles, Model
+
+    parser = ArgumentParser(
+        description="Download data files and model predictions concurrently."
+    )
+    parser.add_argument(
+        "files",
+        nargs="*",
+        help="DataFiles and/or Model names. Defaults to all data files except the "
+        "full MP task dump.",
+    )
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--cache-dir", default=None, help="Overrides MBD_CACHE_DIR.")
+    args = parser.parse_args(argv)
+
+    files: list[DataFiles | Model] = []
+    for name in args.files:
+        if name in DataFiles.__members__:
+            files.append(DataFiles[name])
+        elif name in Model.__members__:
+            files.append(Model[name])
+        else:
+            parser.error(f"{name!r} is neither a DataFiles nor a Model name")
+    if not args.files:
+        files = [file for file in DataFiles if file != DataFiles.all_mp_tasks]
+
+    statuses = prefetch(files, workers=args.workers, cache_dir=args.cache_dir)
+    failed = [path for path, status in statuses.items() if status == "failed"]
+    for path in failed:
+        print(f"Failed to download {path}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
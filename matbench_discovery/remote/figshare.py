@@ -4,14 +4,16 @@ import difflib
 import hashlib
 import json
 import os
-from collections.abc import Mapping, Sequence
+from collections.abc import Iterable, Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from typing import Any, Final, cast
 
 import requests
 from tqdm import tqdm
 
-from matbench_discovery import ROOT
+from matbench_discovery import DEFAULT_CACHE_DIR, ROOT
 from matbench_discovery.cli import CLI_TIMEOUT
+from matbench_discovery.remote.fetch import get_session
 
 ENV_PATH: Final[str] = f"{ROOT}/site/.env"
 BASE_URL: Final[str] = "https://api.figshare.com/v2"
@@ -37,6 +39,9 @@ CATEGORIES: Final[dict[int, str]] = {
 }
 
 
+# local cache of file hashes and Figshare file IDs, see FileManifest
+MANIFEST_PATH: Final[str] = f"{DEFAULT_CACHE_DIR}/figshare-file-manifest.json"
+
 FIGSHARE_TOKEN = os.getenv("FIGSHARE_TOKEN")
 if not FIGSHARE_TOKEN and os.path.isfile(ENV_PATH):
     with open(ENV_PATH) as file:
@@ -54,6 +59,9 @@ def make_request(
 ) -> Any:
     """Make a token-authorized HTTP request to the Figshare API.
 
+    Requests go through a shared keep-alive session that retries idempotent
+    requests (GET, PUT, DELETE) on connection errors and 429/5xx responses.
+
     Args:
         method (str): HTTP method (GET, POST, PUT, DELETE).
         url (str): URL to send the request to.
@@ -70,7 +78,7 @@ def make_request(
     headers = {"Authorization": f"token {FIGSHARE_TOKEN}"}
     if data is not None and not binary:
         data = json.dumps(data)
-    response = requests.request(
+    response = get_session().request(
         method,
         url,
         headers=headers,
@@ -132,25 +140,135 @@ def get_file_hash_and_size(
     return md5.hexdigest(), size
 
 
+class FileManifest:
+    """Persistent local manifest mapping file path, mtime and size to MD5 hash and
+    Figshare file IDs.
+
+    Files whose mtime and size are unchanged since they were last hashed or
+    uploaded are neither re-hashed nor looked up via the Figshare API.
+
+    Example:
+        manifest = FileManifest()
+        manifest.refresh(file_paths)  # hash only new or modified files
+        file_id, was_uploaded = upload_file_if_needed(
+            article_id, file_path, manifest=manifest
+        )
+        manifest.save()
+    """
+
+    def __init__(self, path: str = MANIFEST_PATH) -> None:
+        """Load manifest from path if it exists, else start empty."""
+        self.path = path
+        self.entries: dict[str, dict[str, Any]] = {}
+        if os.path.isfile(path):
+            with open(path, encoding="utf-8") as file:
+                self.entries = json.load(file)
+
+    def _lookup(self, file_path: str) -> dict[str, Any] | None:
+        """Manifest entry for file_path if file is unchanged since recorded."""
+        stat = os.stat(file_path)
+        entry = self.entries.get(os.path.abspath(file_path))
+        if entry and (entry["mtime_ns"], entry["size"]) == (
+            stat.st_mtime_ns,
+            stat.st_size,
+        ):
+            return entry
+        return None
+
+    def changed_files(self, file_paths: Iterable[str]) -> list[str]:
+        """Paths of files that are new or whose mtime or size changed. Only stats
+        files, doesn't read them.
+        """
+        return [path for path in file_paths if self._lookup(path) is None]
+
+    def refresh(self, file_paths: Iterable[str], *, workers: int = 4) -> list[str]:
+        """Re-hash all new or changed files concurrently.
+
+        Returns:
+            list[str]: Paths of files that were (re-)hashed.
+        """
+        changed = self.changed_files(file_paths)
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+            for _ in executor.map(self.get_md5, changed):
+                pass
+        return changed
+
+    def get_md5(self, file_path: str) -> str:
+        """MD5 hash of file_path, only re-computed if the file changed."""
+        if entry := self._lookup(file_path):
+            return entry["md5"]
+        stat = os.stat(file_path)
+        md5, size = get_file_hash_and_size(file_path)
+        # new content invalidates any previously recorded remote file IDs
+        self.entries[os.path.abspath(file_path)] = dict(
+            mtime_ns=stat.st_mtime_ns, size=size, md5=md5, file_ids={}
+        )
+        return md5
+
+    def get_file_id(self, article_id: int, file_path: str) -> int | None:
+        """Figshare file ID of file_path in article_id if the file is unchanged since
+        it was recorded with set_file_id(), else None.
+        """
+        if entry := self._lookup(file_path):
+            return entry["file_ids"].get(str(article_id))
+        return None
+
+    def set_file_id(self, article_id: int, file_path: str, file_id: int) -> None:
+        """Record that the current version of file_path has file_id in article_id."""
+        self.get_md5(file_path)  # make sure entry exists and is up to date
+        self.entries[os.path.abspath(file_path)]["file_ids"][str(article_id)] = file_id
+
+    def save(self) -> None:
+        """Atomically write the manifest to disk."""
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        with open(f"{self.path}.tmp", mode="w", encoding="utf-8") as file:
+            json.dump(self.entries, file, indent=1)
+        os.replace(f"{self.path}.tmp", self.path)
+
+
 def upload_file(
-    article_id: int, file_path: str, file_name: str = "", **kwargs: Any
+    article_id: int,
+    file_path: str,
+    file_name: str = "",
+    *,
+    md5: str | None = None,
+    workers: int = 4,
+    **kwargs: Any,
 ) -> int:
     """Upload a file to Figshare and return the file ID.
 
+    Parts are read from disk once, in order, hashing them on the way, and uploaded
+    concurrently by a pool of threads (at most 2 * workers parts are held in
+    memory). Failed part uploads are retried by the shared session in make_request.
+
     Args:
         article_id (int): ID of the article to upload to.
         file_path (str): Path to the file to upload.
         file_name (str, optional): Name as it will appear in Figshare. Defaults to the
             file path relative to repo's root dir: file_path.removeprefix(ROOT).
+        md5 (str, optional): MD5 hash of the file if already known. Sent to Figshare
+            when initiating the upload and checked against the hash computed while
+            uploading to catch files modified mid-upload. Figshare only accepts an
+            MD5 when initiating the upload (before any part is read), not on
+            completion, so without md5 the upload isn't verified against a
+            client-side hash. Use FileManifest.get_md5() to get it without
+            re-reading unchanged files. Defaults to None.
+        workers (int, optional): Number of parts to upload concurrently. Defaults
+            to 4.
         kwargs: Passed to make_request.
 
     Returns:
         int: The ID of the uploaded file.
+
+    Raises:
+        ValueError: If the file's MD5 hash doesn't match md5.
     """
     # Initiate new upload
-    md5, size = get_file_hash_and_size(file_path)
+    size = os.path.getsize(file_path)
     file_name = file_name or file_path.removeprefix(f"{ROOT}/")
-    data = dict(name=file_name, md5=md5, size=size)
+    data: dict[str, Any] = dict(name=file_name, size=size)
+    if md5:
+        data["md5"] = md5
     endpoint = f"{BASE_URL}/account/articles/{article_id}/files"
     result = make_request("POST", endpoint, data=data, **kwargs)
     file_info = make_request("GET", result["location"])
@@ -158,8 +276,11 @@ def upload_file(
     # Upload parts with nested progress bar showing bytes and percent
     url = file_info["upload_url"]
     parts_info = make_request("GET", url, **kwargs)
+    file_md5 = hashlib.md5()  # noqa: S324
+    pending: set[Future[int]] = set()
     with (
         open(file_path, mode="rb") as file,
+        ThreadPoolExecutor(max_workers=max(1, workers)) as executor,
         tqdm(
             total=size,
             unit="B",
@@ -170,21 +291,41 @@ def upload_file(
             leave=False,
         ) as pbar,
     ):
-        for part in parts_info["parts"]:
-            # Upload part
-            part_url = f"{file_info['upload_url']}/{part['partNo']}"
+
+        def update_pbar(done: set[Future[int]]) -> None:
+            for future in done:
+                pbar.update(future.result())  # re-raises failed part uploads
+            pbar.set_postfix_str(f"{pbar.n / 1024**2:.2f}/{size / 1024**2:.2f} MB")
+
+        for part in sorted(parts_info["parts"], key=lambda part: part["startOffset"]):
             file.seek(part["startOffset"])
             chunk_len = part["endOffset"] - part["startOffset"] + 1
             chunk = file.read(chunk_len)
-            make_request("PUT", part_url, data=chunk, binary=True, **kwargs)
-            pbar.update(len(chunk))
-            pbar.set_postfix_str(f"{pbar.n / 1024**2:.2f}/{size / 1024**2:.2f} MB")
+            file_md5.update(chunk)
+            if len(pending) >= 2 * max(1, workers):  # bound memory of queued parts
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                update_pbar(done)
+            part_url = f"{url}/{part['partNo']}"
+            pending.add(executor.submit(_upload_part, part_url, chunk, **kwargs))
+        update_pbar(wait(pending).done)
+
+    if md5 and file_md5.hexdigest() != md5:
+        raise ValueError(
+            f"{file_path=} changed during upload: expected {md5=}, got "
+            f"{file_md5.hexdigest()}"
+        )
 
     # Complete upload
     make_request("POST", f"{endpoint}/{file_info['id']}", **kwargs)
     return file_info["id"]
 
 
+def _upload_part(part_url: str, chunk: bytes, **kwargs: Any) -> int:
+    """Upload one file part and return its size in bytes."""
+    make_request("PUT", part_url, data=chunk, binary=True, **kwargs)
+    return len(chunk)
+
+
 def article_exists(article_id: int | str) -> bool:
     """Check if a Figshare article exists and is accessible.
 
@@ -358,6 +499,7 @@ def upload_file_if_needed(
     file_name: str = "",
     *,
     force_reupload: bool = False,
+    manifest: FileManifest | None = None,
     **kwargs: Any,
 ) -> tuple[int, bool]:
     """Upload a file to Figshare if it doesn't already exist with the same hash.
@@ -369,6 +511,10 @@ def upload_file_if_needed(
             file path relative to repo's root dir: file_path.removeprefix(ROOT).
         force_reupload (bool, optional): If True, delete and reupload the file even if
             it already exists with the same hash. Defaults to False.
+        manifest (FileManifest, optional): Local manifest of file hashes and IDs.
+            If given, unchanged files previously uploaded to this article are
+            skipped without hashing or API calls and new uploads are recorded.
+            Caller is responsible for calling manifest.save(). Defaults to None.
         kwargs: Passed to make_request.
 
     Returns:
@@ -377,28 +523,36 @@ def upload_file_if_needed(
             - bool: True if the file was uploaded, False if it already existed.
     """
     file_name = file_name or file_path.removeprefix(f"{ROOT}/")
-    file_hash, _ = get_file_hash_and_size(file_path)
+    if manifest is not None:
+        file_id = manifest.get_file_id(article_id, file_path)
+        if file_id is not None and not force_reupload:
+            print(f"File {file_name} unchanged since last upload, skipping")
+            return file_id, False
+        file_hash = manifest.get_md5(file_path)
+    else:
+        file_hash, _ = get_file_hash_and_size(file_path)
 
     # Check if file already exists with same hash
     exists, file_id = file_exists_with_same_hash(article_id, file_name, file_hash)
 
+    was_uploaded = True
     if exists and file_id is not None:
-        if force_reupload:
+        if not force_reupload:
+            print(f"File {file_name} already exists with same hash, skipping upload")
+            was_uploaded = False
+        else:
             print(
                 f"{file_name=} exists but force_reupload=True, deleting and reuploading"
             )
-            if delete_file(article_id, file_id):
-                # Upload the file after successful deletion
-                file_id = upload_file(article_id, file_path, file_name, **kwargs)
-                return file_id, True
-            print(f"Failed to delete existing file {file_name}, skipping upload")
-            return file_id, False
-        print(f"File {file_name} already exists with same hash, skipping upload")
-        return file_id, False
-
-    # Upload the file
-    file_id = upload_file(article_id, file_path, file_name, **kwargs)
-    return file_id, True
+            if not delete_file(article_id, file_id):
+                print(f"Failed to delete existing file {file_name}, skipping upload")
+                return file_id, False
+    if was_uploaded:
+        file_id = upload_file(article_id, file_path, file_name, md5=file_hash, **kwargs)
+
+    if manifest is not None and file_id is not None:
+        manifest.set_file_id(article_id, file_path, file_id)
+    return cast("int", file_id), was_uploaded
 
 
 def publish_article(article_id: int, *, verbose: bool = True) -> bool:
@@ -11,6 +11,7 @@ from tqdm import tqdm
 from matbench_discovery import today
 from matbench_discovery.data import df_wbm
 from matbench_discovery.enums import DataFiles, MbdKey, Task
+from matbench_discovery.hpc import is_intact_file
 
 __author__ = "Janosh Riebesell, Philipp Benner"
 __date__ = "2023-07-11"
@@ -36,7 +37,7 @@ out_path = (
 
 if not (0 <= task_id <= n_splits):
     raise SystemExit(f"Invalid {task_id=}")
-if os.path.isfile(out_path):
+if is_intact_file(out_path):
     raise SystemExit(f"{out_path = } already exists, exiting")
 os.makedirs(out_dir, exist_ok=True)
 
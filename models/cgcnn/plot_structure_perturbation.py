@@ -4,6 +4,7 @@ import pandas as pd
 import pymatviz as pmv
 from pymatgen.core import Lattice, Structure
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery.structure import perturb_structure
 
 rng = np.random.default_rng(seed=0)
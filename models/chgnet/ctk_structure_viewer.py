@@ -2,6 +2,7 @@ import pandas as pd
 from crystal_toolkit.helpers.utils import hook_up_fig_with_struct_viewer
 from pymatviz.enums import Key
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery.enums import Model
 
 __author__ = "Janosh Riebesell"
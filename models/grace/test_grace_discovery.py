@@ -21,6 +21,7 @@ from tqdm import tqdm
 from matbench_discovery import timestamp, today
 from matbench_discovery.data import as_dict_handler, ase_atoms_from_zip
 from matbench_discovery.enums import DataFiles, Model, Task
+from matbench_discovery.hpc import is_intact_file
 
 __author__ = "Yury Lysogorskiy"
 __date__ = "2025-02-06"
@@ -55,7 +56,7 @@ slurm_array_job_id = os.getenv("SLURM_ARRAY_JOB_ID", "debug")
 
 out_path = f"{out_dir}/{slurm_array_job_id}-{slurm_array_task_id:>03}.json.gz"
 
-if os.path.isfile(out_path):
+if is_intact_file(out_path):
     raise SystemExit(f"{out_path=} already exists, exiting early")
 
 print(f"{slurm_array_task_id=}")
@@ -12,6 +12,7 @@ from pymatviz.enums import Key
 from pymatviz.powerups import add_identity_line
 from sklearn.metrics import r2_score
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery import ROOT, SITE_FIGS
 from matbench_discovery.enums import DataFiles
 
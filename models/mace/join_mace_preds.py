@@ -13,9 +13,10 @@ from pymatgen.entries.computed_entries import ComputedStructureEntry
 from pymatviz.enums import Key
 from tqdm import tqdm
 
-from matbench_discovery.data import as_dict_handler, df_wbm
+from matbench_discovery.data import as_dict_handler, df_wbm, glob_to_df
 from matbench_discovery.energy import calc_energy_from_e_refs, mp_elemental_ref_energies
 from matbench_discovery.enums import DataFiles, MbdKey, Model, Task
+from matbench_discovery.relax import read_relax_results
 
 __author__ = "Janosh Riebesell"
 __date__ = "2023-03-01"
@@ -26,25 +27,24 @@ module_dir = os.path.dirname(__file__)
 model_name = Model.mace_mpa_0.key
 task_type = Task.IS2RE
 date = "2025-01-30"
-glob_pattern = f"{model_name}/{date}-wbm-{task_type}*/*.json.gz"
+# shards written by RelaxResultsSink in test_mace_discovery.py
+glob_pattern = f"{model_name}/{date}-wbm-{task_type}*/*.jsonl.gz"
 file_paths = sorted(glob(f"{module_dir}/{glob_pattern}"))
 print(f"Found {len(file_paths):,} files for {glob_pattern = }")
 
 e_form_mace_col = "e_form_per_atom_mace"
 struct_col = "mace_structure"
 
-dfs: dict[str, pd.DataFrame] = {}
-
 
 # %%
-for file_path in tqdm(file_paths):
-    if file_path in dfs:
-        continue
-    df_i = pd.read_json(file_path).set_index(Key.mat_id)
-    # drop trajectory to save memory
-    dfs[file_path] = df_i.drop(columns="mace_trajectory", errors="ignore")
-
-df_mace = pd.concat(dfs.values()).round(4)
+df_mace = (
+    glob_to_df(f"{module_dir}/{glob_pattern}", reader=read_relax_results)
+    .set_index(Key.mat_id)
+    # drop references to trajectory side files, not needed for joining
+    .drop(columns=Key.trajectory, errors="ignore")
+    .add_prefix("mace_")
+    .round(4)
+)
 
 
 # %%
@@ -1,26 +1,28 @@
 # %%
 import os
-from copy import deepcopy
+import tempfile
 from importlib.metadata import version
-from typing import Any, Final
+from typing import Final
 
 import pandas as pd
 import plotly.express as px
 import wandb
-from ase.filters import FrechetCellFilter
-from ase.optimize import FIRE, LBFGS
-from ase.optimize.optimize import Optimizer
 from mace.calculators import mace_mp
 from mace.tools import count_parameters
-from pymatgen.core.trajectory import Trajectory
 from pymatgen.io.ase import AseAtomsAdaptor
 from pymatviz.enums import Key
 from tqdm import tqdm
 
 from matbench_discovery import hpc, timestamp, today
-from matbench_discovery.data import as_dict_handler, ase_atoms_from_zip, df_wbm
+from matbench_discovery.data import ase_atoms_from_zip, df_wbm
 from matbench_discovery.enums import DataFiles, MbdKey, Model, Task
 from matbench_discovery.plots import wandb_scatter
+from matbench_discovery.relax import (
+    RelaxResultsSink,
+    read_relax_results,
+    read_trajectory,
+    relax_atoms,
+)
 
 __author__ = "Janosh Riebesell"
 __date__ = "2024-12-09"
@@ -29,7 +31,7 @@ __date__ = "2024-12-09"
 # %%
 smoke_test = False
 if smoke_test:
-    print(f"Warning: {smoke_test=}, will not write relaxed structures to disk!")
+    print(f"Warning: {smoke_test=}, will write relaxed structures to temp dir!")
 task_type = Task.IS2RE
 module_dir = os.path.dirname(__file__)
 # set large job array size for smaller data splits and faster testing/debugging
@@ -37,8 +39,10 @@ slurm_array_task_count = 200
 ase_optimizer = "FIRE"
 # device = "cuda" if torch.cuda.is_available() else "cpu"
 device = "cpu"
-# whether to record intermediate structures into pymatgen Trajectory
-record_traj = True  # has no effect if relax_cell is False
+# whether to record intermediate structures into a float32 trajectory side file
+record_traj = True
+# keep at most max_frames of every stride-th step (plus first and last step)
+traj_kwargs = dict(max_frames=100, stride=1)
 model_name = os.getenv("MODEL_NAME", Model.mace_mp_0)
 job_name = f"{model_name}/{today}-wbm-{task_type}-{ase_optimizer}"
 out_dir = f"{module_dir}/{job_name}"
@@ -67,10 +71,12 @@ slurm_vars = hpc.slurm_submit(
 # %%
 slurm_array_task_id = int(os.getenv("SLURM_ARRAY_TASK_ID", "0"))
 slurm_array_job_id = os.getenv("SLURM_ARRAY_JOB_ID", "debug")
-out_path = f"{out_dir}/{slurm_array_job_id}-{slurm_array_task_id:>03}.json.gz"
-
-if os.path.isfile(out_path):
-    raise SystemExit(f"{out_path=} already exists, exiting early")
+# results are appended as structures finish so resubmitted tasks resume where the
+# previous attempt stopped (e.g. after hitting the slurm time limit)
+out_path = f"{out_dir}/{slurm_array_job_id}-{slurm_array_task_id:>03}.jsonl.gz"
+if smoke_test:
+    out_path = f"{tempfile.mkdtemp()}/smoke-test.jsonl.gz"
+traj_path = out_path.replace(".jsonl.gz", "-traj.bin")
 
 
 # %%
@@ -98,6 +104,11 @@ elif slurm_array_task_count > 1:
         slurm_array_task_id - 1
     ]
 
+results_sink = RelaxResultsSink(out_path)
+if all(atoms.info[Key.mat_id] in results_sink for atoms in atoms_list):
+    raise SystemExit(f"All structures in {out_path=} already relaxed, exiting early")
+print(f"{len(results_sink.done_ids):,} structures already relaxed in {out_path}")
+
 
 # %%
 run_params = {
@@ -109,6 +120,7 @@ run_params = {
     "slurm_vars": slurm_vars,
     "max_steps": max_steps,
     "record_traj": record_traj,
+    "traj_kwargs": traj_kwargs,
     "force_max": force_max,
     "ase_optimizer": ase_optimizer,
     "device": device,
@@ -124,62 +136,42 @@ wandb.init(project="matbench-discovery", name=run_name, config=run_params)
 
 
 # %% time
-relax_results: dict[str, dict[str, Any]] = {}
-optim_cls: type[Optimizer] = {"FIRE": FIRE, "LBFGS": LBFGS}[ase_optimizer]
-
-for atoms in tqdm(deepcopy(atoms_list), desc="Relaxing"):
-    mat_id = atoms.info[Key.mat_id]
-    if mat_id in relax_results:
-        continue
-    try:
-        atoms.calc = mace_calc
-        if max_steps > 0:
-            filtered_atoms = FrechetCellFilter(atoms)
-            optimizer = optim_cls(filtered_atoms, logfile="/dev/null")
-
-            if record_traj:
-                coords, lattices, energies = [], [], []
-                # attach observer functions to the optimizer
-                optimizer.attach(lambda: coords.append(atoms.get_positions()))  # noqa: B023
-                optimizer.attach(lambda: lattices.append(atoms.get_cell()))  # noqa: B023
-                optimizer.attach(lambda: energies.append(atoms.get_potential_energy()))  # noqa: B023
-
-            optimizer.run(fmax=force_max, steps=max_steps)
-        energy = atoms.get_potential_energy()  # relaxed energy
-        # if max_steps > 0, atoms is wrapped by FrechetCellFilter, so need to getattr
-        relaxed_struct = AseAtomsAdaptor.get_structure(atoms)
-        relax_results[mat_id] = {"structure": relaxed_struct, "energy": energy}
-
-        coords = locals().get("coords", [])
-        lattices = locals().get("lattices", [])
-        energies = locals().get("energies", [])
-        if record_traj and coords and lattices and energies:
-            mace_traj = Trajectory(
-                species=atoms.get_chemical_symbols(),
-                coords=coords,
-                lattice=lattices,
-                constant_lattice=False,
-                frame_properties=[{"energy": energy} for energy in energies],
+with results_sink:  # flushes buffered results on exit, also on errors
+    for atoms in tqdm(atoms_list, desc="Relaxing"):
+        mat_id = atoms.info[Key.mat_id]
+        if mat_id in results_sink:
+            continue
+        try:
+            result = relax_atoms(
+                atoms,
+                mace_calc,
+                optimizer=ase_optimizer,
+                fmax=force_max,
+                max_steps=max_steps,
+                traj_kwargs=traj_kwargs if record_traj else None,
             )
-            relax_results[mat_id]["trajectory"] = mace_traj
-    except Exception as exc:
-        print(f"Failed to relax {mat_id}: {exc!r}")
-        continue
+        except Exception as exc:
+            print(f"Failed to relax {mat_id}: {exc!r}")
+            continue
+
+        relaxed_struct = AseAtomsAdaptor.get_structure(result["atoms"])
+        record = {"structure": relaxed_struct, "energy": result["energy"]}
+
+        if record_traj:
+            # store only a reference to the frames appended to the binary side file
+            record["trajectory"] = result["trajectory"].write(traj_path)
+        results_sink.write(mat_id, record)
 
 
 # %%
-df_out = pd.DataFrame(relax_results).T.add_prefix("mace_")
-df_out.index.name = Key.mat_id
-if not smoke_test:
-    df_out.reset_index().to_json(
-        out_path, default_handler=as_dict_handler, orient="records", lines=True
-    )
+df_out = read_relax_results(out_path).set_index(Key.mat_id).add_prefix("mace_")
 
 
 # %%
-if Key.trajectory in df_out:
-    energy_series = df_out[Key.trajectory].map(
-        lambda x: [d["energy"] / len(x.species) for d in x.frame_properties]
+if (traj_col := f"mace_{Key.trajectory}") in df_out:
+    energy_series = df_out[traj_col].map(
+        lambda ref: read_trajectory(ref, root=os.path.dirname(out_path))["energies"]
+        / ref["n_atoms"]
     )
 
     # Create a DataFrame from the Series
@@ -16,7 +16,7 @@ from tqdm import tqdm
 from matbench_discovery import timestamp, today
 from matbench_discovery.data import as_dict_handler
 from matbench_discovery.enums import DataFiles, Model, Task
-from matbench_discovery.hpc import slurm_submit
+from matbench_discovery.hpc import is_intact_file, slurm_submit
 
 task_type = Task.IS2RE
 module_dir = os.path.dirname(__file__)
@@ -44,7 +44,7 @@ slurm_array_job_id = os.getenv("SLURM_ARRAY_JOB_ID", "debug")
 
 out_path = f"{out_dir}/{slurm_array_job_id}-{slurm_array_task_id:>03}.json.gz"
 
-if os.path.isfile(out_path):
+if is_intact_file(out_path):
     raise SystemExit(f"{out_path=} already exists, exiting early")
 
 
@@ -21,7 +21,7 @@ from tqdm import tqdm
 from matbench_discovery import timestamp, today
 from matbench_discovery.data import df_wbm
 from matbench_discovery.enums import DataFiles, MbdKey, Model, Task
-from matbench_discovery.hpc import slurm_submit
+from matbench_discovery.hpc import is_intact_file, slurm_submit
 from matbench_discovery.plots import wandb_scatter
 
 __author__ = "Janosh Riebesell"
@@ -33,7 +33,7 @@ job_name = f"{today}-{Model.megnet}-wbm-{task_type}"
 out_path = os.getenv("SBATCH_OUTPUT", f"{module_dir}/{job_name}.csv.gz")
 slurm_array_task_count = 1
 
-if os.path.isfile(out_path):
+if is_intact_file(out_path):
     raise SystemExit(f"{out_path=} already exists, exiting early")
 
 slurm_vars = slurm_submit(
@@ -7,7 +7,6 @@ cd matbench-discovery
 pip install -e .
 """
 
-import os
 from pathlib import Path
 from typing import Any
 
@@ -27,6 +26,7 @@ from tqdm import tqdm
 
 from matbench_discovery import today
 from matbench_discovery.enums import DataFiles, MbdKey, Task
+from matbench_discovery.hpc import is_intact_file
 from matbench_discovery.plots import wandb_scatter
 
 torch.set_float32_matmul_precision("high")
@@ -79,7 +79,7 @@ def main(
     if total_shards is not None:
         out_path = f"{out_dir}/{model_name_}-{today}-shard-{shard:>03}.json.gz"
 
-    if os.path.isfile(out_path):
+    if is_intact_file(out_path):
         raise SystemExit(f"{out_path=} already exists, exiting early")
 
     # This is inside the script because accessing the variables causes a download
@@ -17,7 +17,7 @@ from sklearn.pipeline import Pipeline
 from matbench_discovery import ROOT, today
 from matbench_discovery.data import df_wbm, glob_to_df
 from matbench_discovery.enums import DataFiles, MbdKey, Task
-from matbench_discovery.hpc import slurm_submit
+from matbench_discovery.hpc import is_intact_file, slurm_submit
 from matbench_discovery.plots import wandb_scatter
 
 sys.path.append(f"{ROOT}/models")
@@ -37,7 +37,7 @@ out_dir = f"{module_dir}/{today}-train-test"
 os.makedirs(out_dir, exist_ok=True)
 out_path = f"{out_dir}/e-form-preds-{task_type}.csv.gz"
 model_path = f"{out_dir}/voronoi-rf-model.joblib"  # Path to save the model
-if os.path.isfile(out_path):
+if is_intact_file(out_path):
     raise SystemExit(f"{out_path=} already exists, exiting early")
 
 job_name = "train-test-voronoi-rf"
@@ -16,7 +16,7 @@ from tqdm import tqdm
 
 from matbench_discovery import ROOT, today
 from matbench_discovery.enums import DataFiles
-from matbench_discovery.hpc import slurm_submit
+from matbench_discovery.hpc import is_intact_file, slurm_submit
 
 sys.path.append(f"{ROOT}/models")
 
@@ -56,7 +56,7 @@ slurm_array_task_id = int(os.getenv("SLURM_ARRAY_TASK_ID", "0"))
 run_name = f"{job_name}-{slurm_array_task_id}"
 out_path = f"{out_dir}/{run_name}.csv.bz2"
 
-if os.path.isfile(out_path):
+if is_intact_file(out_path):
     raise SystemExit(f"{out_path=} already exists, exiting early")
 
 print(f"{data_path=}")
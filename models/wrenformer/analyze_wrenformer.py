@@ -8,6 +8,7 @@ from aviary.wren.utils import get_prototype_from_protostructure
 from IPython.display import display
 from pymatviz.enums import Key
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery import PDF_FIGS, SITE_FIGS
 from matbench_discovery.data import df_wbm
 from matbench_discovery.enums import DataFiles, MbdKey, Model
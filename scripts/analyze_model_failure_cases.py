@@ -14,6 +14,7 @@ from pymatgen.core import Composition, Structure
 from pymatviz.enums import ElemCountMode, Key
 from tqdm import tqdm
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery import PDF_FIGS, SITE_FIGS, WBM_DIR
 from matbench_discovery.data import df_wbm
 from matbench_discovery.enums import DataFiles, MbdKey
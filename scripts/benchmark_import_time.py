@@ -0,0 +1,109 @@
+"""Benchmark import time of matbench_discovery and its submodules.
+
+Runs `python -X importtime -c "import <module>"` in a fresh interpreter for each
+module (best of --repeats runs), then reports the cumulative import time, which heavy
+third-party packages got pulled in and the slowest transitive imports.
+
+Exits with code 1 if any module listed in LIGHT_MODULES imports one of HEAVY_PKGS so
+the script doubles as a regression check that the plotting stack is only loaded by
+modules that actually plot (e.g. matbench_discovery.plots).
+
+Usage:
+    python scripts/benchmark_import_time.py
+    python scripts/benchmark_import_time.py --modules matbench_discovery.data --top 20
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+from typing import Final
+
+__date__ = "2026-10-19"
+
+MODULES: Final = (
+    "matbench_discovery",
+    "matbench_discovery.hpc",
+    "matbench_discovery.remote.fetch",
+    "matbench_discovery.structure",
+    "matbench_discovery.enums",
+    "matbench_discovery.cli",
+    "matbench_discovery.models",
+    "matbench_discovery.data",
+    "matbench_discovery.energy",
+    "matbench_discovery.metrics.discovery",
+    "matbench_discovery.plots",
+)
+# modules that must stay importable without the plotting stack, e.g. for HPC workers
+LIGHT_MODULES: Final = (
+    "matbench_discovery",
+    "matbench_discovery.hpc",
+    "matbench_discovery.remote.fetch",
+    "matbench_discovery.structure",
+)
+HEAVY_PKGS: Final = ("plotly", "pymatviz", "wandb", "sklearn")
+
+# e.g. "import time:       247 |     841626 |       pymatviz.coordination"
+importtime_re = re.compile(r"^import time:\s*(\d+)\s*\|\s*(\d+)\s*\|(\s*)(\S+)\s*$")
+
+
+def parse_importtime(stderr: str) -> dict[str, tuple[int, int]]:
+    """Parse -X importtime output into {module: (self_us, cumulative_us)}."""
+    timings: dict[str, tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if match := importtime_re.match(line):
+            self_us, cum_us, _indent, module = match.groups()
+            timings[module] = (int(self_us), int(cum_us))
+    return timings
+
+
+def measure_import_time(module: str, repeats: int = 3) -> dict[str, tuple[int, int]]:
+    """Import module in fresh interpreters and return the fastest run's timings."""
+    best: dict[str, tuple[int, int]] = {}
+    for _ in range(repeats):
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+        if result.returncode != 0:
+            raise RuntimeError(f"Failed to import {module}:\n{result.stderr[-2000:]}")
+        timings = parse_importtime(result.stderr)
+        if not best or timings[module][1] < best[module][1]:
+            best = timings
+    return best
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Print import time report and return exit code (1 if a light module is heavy)."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--modules", nargs="+", default=MODULES)
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument(
+        "--top", type=int, default=0, help="Show N slowest imports per module."
+    )
+    args = parser.parse_args(argv)
+
+    failures: list[str] = []
+    print(f"{'module':<40} {'import [ms]':>12}  heavy deps")
+    for module in args.modules:
+        timings = measure_import_time(module, repeats=args.repeats)
+        heavy = [pkg for pkg in HEAVY_PKGS if pkg in timings]
+        print(f"{module:<40} {timings[module][1] / 1e3:>12.1f}  {', '.join(heavy)}")
+
+        if module in LIGHT_MODULES and heavy:
+            failures += [f"{module} imports {heavy}"]
+
+        if args.top:
+            top_self = sorted(timings.items(), key=lambda kv: -kv[1][0])[: args.top]
+            for dep, (self_us, _cum_us) in top_self:
+                print(f"    {dep:<50} {self_us / 1e3:>8.1f} ms self")
+
+    for failure in failures:
+        print(f"✗ {failure}", file=sys.stderr)
+    return int(bool(failures))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
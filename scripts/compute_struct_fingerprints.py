@@ -15,9 +15,9 @@ from pymatgen.core import Structure
 from pymatviz.enums import Key
 from tqdm import tqdm
 
-from matbench_discovery import DATA_DIR, timestamp
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
+from matbench_discovery import DATA_DIR, hpc, timestamp
 from matbench_discovery.enums import DataFiles
-from matbench_discovery.hpc import slurm_submit
 
 __author__ = "Janosh Riebesell"
 __date__ = "2023-03-26"
@@ -37,7 +37,7 @@ slurm_array_task_count = 100
 out_dir = f"{DATA_DIR}/{data_name}"
 os.makedirs(out_dir, exist_ok=True)
 
-slurm_vars = slurm_submit(
+slurm_vars = hpc.slurm_submit(
     job_name=job_name,
     out_dir=out_dir,
     account="matgen",
@@ -49,7 +49,7 @@ slurm_vars = slurm_submit(
 
 # %%
 out_path = f"{out_dir}/site-stats-{slurm_array_task_id:>03}.json.gz"
-if os.path.isfile(out_path):
+if hpc.is_intact_file(out_path):
     raise SystemExit(f"{out_path=} already exists, exiting early")
 
 print(f"\nJob {job_name} started running {timestamp}")
@@ -104,11 +104,12 @@ if running_as_slurm_job:
 # %%
 out_files = glob(f"{out_dir}/site-stats-*.json.gz")
 
-found_idx = [int(name.split("-")[-1].split(".")[0]) for name in out_files]
 print(f"Found {len(out_files)=:,}")
-missing_files = sorted(set(range(1, slurm_array_task_count + 1)) - set(found_idx))
-if missing_files:
-    print(f"{len(missing_files)=}: {missing_files}")
+# resubmit failed tasks with slurm_submit(array=resubmit_array) or hpc.run_local_array
+resubmit_array = hpc.get_resubmit_array(
+    f"{out_dir}/site-stats-{{task_id:>03}}.json.gz",
+    range(1, slurm_array_task_count + 1),
+)
 
 df_out = pd.concat(pd.read_json(out_file) for out_file in tqdm(out_files))
 df_out = df_out.set_index(Key.mat_id)
@@ -1,43 +1,152 @@
-"""Calculate diatomic curve metrics for all models and write them to YAML files."""
+"""Calculate diatomic curve metrics for all models and write them to YAML files.
+
+Models are evaluated in parallel across a process pool. Optional reference curves are
+loaded once and shared with all workers as a memory-mapped .npz file. Per-model
+metrics are cached by hash of the prediction (and reference) file so models whose
+predictions didn't change are skipped on reruns (use --overwrite to recompute all).
+"""
 
 import gzip
 import json
 import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from typing import Any
 
-from matbench_discovery import ROOT
+from matbench_discovery import DEFAULT_CACHE_DIR, ROOT
+from matbench_discovery.cli import cli_args
+from matbench_discovery.data import batch_yaml_updates
 from matbench_discovery.enums import Model
 from matbench_discovery.metrics import diatomics
 from matbench_discovery.metrics.diatomics import DiatomicCurves
+from matbench_discovery.remote.fetch import file_md5
+
+# optional reference curves (e.g. DFT) as .json.gz or .npz (DiatomicCurves.to_npz).
+# If None, only metrics that don't require reference data are calculated.
+ref_file: str | None = os.getenv("MBD_DIATOMICS_REF_FILE")
+cache_path = f"{DEFAULT_CACHE_DIR}/diatomics-metrics-cache.json"
+
+_ref_curves: DiatomicCurves | None = None  # set in each worker by _init_worker
+
+
+def load_curves(file_path: str) -> DiatomicCurves:
+    """Load diatomic curves from .npz or (gzipped) JSON file."""
+    if file_path.endswith(".npz"):
+        return DiatomicCurves.from_npz(file_path)
+    with gzip.open(file_path, mode="rb") as file:
+        return DiatomicCurves.from_dict(json.load(file) or {})
+
+
+def _init_worker(ref_npz_path: str | None) -> None:
+    """Memory-map shared reference curves once per worker process."""
+    global _ref_curves  # noqa: PLW0603
+    if ref_npz_path:
+        _ref_curves = DiatomicCurves.from_npz(ref_npz_path, mmap_mode="r")
+
+
+def calc_model_metrics(pred_path: str) -> dict[str, dict[str, float]]:
+    """Calculate diatomic metrics for one model's prediction file."""
+    pred_curves = load_curves(pred_path)
+    return diatomics.calc_diatomic_metrics_batch(
+        ref_curves=_ref_curves, pred_curves=pred_curves
+    )
+
+
+def save_cache(cache: dict[str, dict[str, Any]]) -> None:
+    """Atomically write the per-model metrics cache to disk."""
+    os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+    with open(f"{cache_path}.tmp", mode="w") as file:
+        json.dump(cache, file)
+    os.replace(f"{cache_path}.tmp", cache_path)
+
+
+def main() -> None:
+    """Evaluate diatomic metrics for all models and update model YAML files."""
+    ref_hash = file_md5(ref_file) if ref_file else None
+    cache: dict[str, dict[str, Any]] = {}
+    if os.path.isfile(cache_path):
+        with open(cache_path) as file:
+            cache = json.load(file)
+
+    pred_paths: dict[Model, str] = {}
+    for model in cli_args.models or list(Model):
+        if not os.path.isfile(model.yaml_path):
+            continue
+
+        diatomics_metrics = model.metrics.get("diatomics")
+        if not isinstance(diatomics_metrics, dict):
+            continue
+
+        pred_file = diatomics_metrics.get("pred_file")
+        if not isinstance(pred_file, str):
+            continue
+
+        abs_path = f"{ROOT}/{pred_file}"
+        if not os.path.isfile(abs_path):
+            print(f"Prediction file {pred_file} not found for {model.name}")
+            continue
+        pred_paths[model] = abs_path
+
+    cache_keys = {
+        model: f"{file_md5(abs_path)}-{ref_hash}"
+        for model, abs_path in pred_paths.items()
+    }
+    todo = [
+        model
+        for model in pred_paths
+        if cli_args.overwrite
+        or cache.get(model.name, {}).get("hash") != cache_keys[model]
+    ]
+    print(f"{len(pred_paths) - len(todo)}/{len(pred_paths)} models unchanged, skipping")
+    if not todo:
+        return
 
-# Loop over all models
-for model in Model:
-    if not os.path.isfile(model.yaml_path):
-        continue
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        # load reference curves once, workers memory-map them from an uncompressed
+        # .npz so all processes share the same pages instead of each parsing JSON
+        ref_npz_path = None
+        if ref_file:
+            ref_npz_path = f"{tmp_dir}/ref-curves.npz"
+            load_curves(ref_file).to_npz(ref_npz_path, compress=False)
 
-    diatomics_metrics = model.metrics.get("diatomics")
-    if not isinstance(diatomics_metrics, dict):
-        continue
+        # with --batch-writes, YAML files (and the cache) are only written once all
+        # models were processed so an interrupted run leaves no partial updates
+        run_batch = batch_yaml_updates() if cli_args.batch_writes else nullcontext()
 
-    pred_file = diatomics_metrics.get("pred_file")
-    if not isinstance(pred_file, str):
-        continue
+        with (
+            run_batch,
+            ProcessPoolExecutor(
+                max_workers=max(1, min(cli_args.workers, len(todo))),
+                initializer=_init_worker,
+                initargs=(ref_npz_path,),
+            ) as executor,
+        ):
+            futures = {
+                executor.submit(calc_model_metrics, pred_paths[model]): model
+                for model in todo
+            }
+            for future in as_completed(futures):
+                model = futures[future]
+                try:
+                    metrics = future.result()
+                except Exception as exc:
+                    print(f"✗ Error processing {model.name}: {exc}")
+                    continue
 
-    abs_path = f"{ROOT}/{pred_file}"
-    if not os.path.isfile(abs_path):
-        print(f"Prediction file {pred_file} not found for {model.name}")
-        continue
+                # Write metrics to YAML
+                mean_metrics = diatomics.write_metrics_to_yaml(model, metrics)
+                print(f"{model.name}:")
+                for metric, val in mean_metrics.items():
+                    print(f"  {metric}: {val:.5}")
 
-    # Load predicted curves
-    with gzip.open(abs_path, mode="rb") as file:
-        pred_data = json.load(file) or {}
+                cache[model.name] = {"hash": cache_keys[model], "metrics": metrics}
+                if not cli_args.batch_writes:
+                    save_cache(cache)
 
-    pred_curves = DiatomicCurves.from_dict(pred_data)
+        if cli_args.batch_writes:
+            save_cache(cache)
 
-    # Calculate metrics (without reference data)
-    metrics = diatomics.calc_diatomic_metrics(ref_curves=None, pred_curves=pred_curves)
 
-    # Write metrics to YAML
-    mean_metrics = diatomics.write_metrics_to_yaml(model, metrics)
-    print(f"{model.name}:")
-    for metric, val in mean_metrics.items():
-        print(f"  {metric}: {val:.5}")
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ the site.
 
 # %%
 import itertools
+from contextlib import nullcontext
 from datetime import date
 
 import numpy as np
@@ -20,7 +21,7 @@ from sklearn.dummy import DummyClassifier
 
 from matbench_discovery import PKG_DIR
 from matbench_discovery.cli import cli_args
-from matbench_discovery.data import DATASETS, df_wbm
+from matbench_discovery.data import DATASETS, batch_yaml_updates, df_wbm
 from matbench_discovery.enums import DataFiles, MbdKey, Model, Open, Targets, TestSubset
 from matbench_discovery.metrics import discovery
 
@@ -36,31 +37,39 @@ if __name__ == "__main__":
 
     models_to_write = cli_args.models or list(Model)
 
-    for model in models_to_write:
-        try:
-            print(f"\nProcessing {model.label}...")
-            model_preds = preds.df_preds[model.label]
-            for test_subset, (metrics, subset_idx) in {
-                TestSubset.full_test_set: (
-                    preds.df_metrics[model.label].to_dict(),
-                    slice(None),
-                ),
-                TestSubset.uniq_protos: (
-                    preds.df_metrics_uniq_protos[model.label].to_dict(),
-                    uniq_protos_idx,
-                ),
-                TestSubset.most_stable_10k: (
-                    preds.df_metrics_10k[model.label].to_dict(),
-                    model_preds.loc[uniq_protos_idx].nsmallest(10_000).index,
-                ),
-            }.items():
-                discovery.write_metrics_to_yaml(
-                    model, metrics, model_preds.loc[subset_idx], test_subset
-                )
-            print(f"\t✓ Updated discovery metrics for {test_subset}")
-        except Exception as exc:
-            print(f"\t✗ Error processing {model.label}: {exc}")
-            continue
+    # with --batch-writes, YAML files are only written once all models were processed
+    # (models that raise are skipped, their nested batch discards partial updates)
+    run_batch = batch_yaml_updates() if cli_args.batch_writes else nullcontext()
+
+    with run_batch:
+        for model in models_to_write:
+            try:
+                print(f"\nProcessing {model.label}...")
+                model_preds = preds.df_preds[model.label]
+                # write all test subsets to the model YAML in one load/dump. If any
+                # subset fails, none of this model's updates are written.
+                with batch_yaml_updates():
+                    for test_subset, (metrics, subset_idx) in {
+                        TestSubset.full_test_set: (
+                            preds.df_metrics[model.label].to_dict(),
+                            slice(None),
+                        ),
+                        TestSubset.uniq_protos: (
+                            preds.df_metrics_uniq_protos[model.label].to_dict(),
+                            uniq_protos_idx,
+                        ),
+                        TestSubset.most_stable_10k: (
+                            preds.df_metrics_10k[model.label].to_dict(),
+                            model_preds.loc[uniq_protos_idx].nsmallest(10_000).index,
+                        ),
+                    }.items():
+                        discovery.write_metrics_to_yaml(
+                            model, metrics, model_preds.loc[subset_idx], test_subset
+                        )
+                print(f"\t✓ Updated discovery metrics for {model.label}")
+            except Exception as exc:
+                print(f"\t✗ Error processing {model.label}: {exc}")
+                continue
 
     if not pmv.IS_IPYTHON:
         raise SystemExit(0)
@@ -25,6 +25,7 @@ from plotly.subplots import make_subplots
 from pymatviz.enums import Key
 from pymatviz.utils import si_fmt
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery import PDF_FIGS, ROOT, SITE_FIGS, today
 from matbench_discovery.data import df_wbm
 from matbench_discovery.enums import MbdKey, Model
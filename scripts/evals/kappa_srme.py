@@ -4,11 +4,12 @@ non-analytical correction term (NAC).
 
 # %%
 import os
+from contextlib import nullcontext
 
-import pandas as pd
 from pymatviz.enums import Key
 
 from matbench_discovery.cli import cli_args
+from matbench_discovery.data import batch_yaml_updates
 from matbench_discovery.enums import DataFiles, Model
 from matbench_discovery.metrics import phonons
 
@@ -18,35 +19,58 @@ def main() -> None:
     models_to_evaluate = cli_args.models or list(Model)
     print(f"Evaluating kappa metrics for {len(models_to_evaluate)} models...")
 
-    for model in models_to_evaluate:
-        if not os.path.isfile(model.kappa_103_path or ""):
-            print(f"Skipping {model.label}: no kappa_103_path found")
-            continue
-
+    # load DFT reference once (from compact .npz cache after first run) and share it
+    # and its precomputed mode-resolved kappa averages across all models
+    dft_kappa_path = DataFiles.phonondb_pbe_103_kappa_no_nac.path
+    # caches store size and mtime of the JSON file and are rebuilt when it changes
+    source_key = phonons.get_file_source_key(dft_kappa_path)
+    dft_npz_path = dft_kappa_path.replace(".json.gz", ".npz")
+    if phonons.read_kappa_npz_source_key(dft_npz_path) == source_key:
+        df_dft = phonons.read_kappa_npz(dft_npz_path)
+    else:
+        df_dft = phonons.read_kappa_file(dft_kappa_path)
         try:
-            print(f"\nProcessing {model.label}...")
-
-            # Load and process data
-            df_ml = pd.read_json(model.kappa_103_path).set_index(Key.mat_id)
-            df_dft = pd.read_json(
-                DataFiles.phonondb_pbe_103_kappa_no_nac.path
-            ).set_index(Key.mat_id)
-            df_ml_metrics = phonons.calc_kappa_metrics_from_dfs(df_ml, df_dft)
-
-            # Calculate metrics
-            kappa_sre = df_ml_metrics[Key.sre].mean()
-            kappa_srme = df_ml_metrics[Key.srme].mean()
-            print(f"\t{kappa_srme=:.4f}")
-            print(f"\t{kappa_sre=:.4f}")
-
-            # Update YAML file
-            metrics_dict = {"srme": kappa_srme, "sre": kappa_sre}
-            phonons.write_metrics_to_yaml(model, metrics_dict, model.kappa_103_path)
-            print(f"\t✓ Updated {model.yaml_path}")
-
-        except Exception as exc:
-            print(f"\t✗ Error processing {model.label}: {exc}")
-            continue
+            phonons.write_kappa_npz(df_dft, dft_npz_path, source_key=source_key)
+        except ValueError as exc:
+            print(f"Not caching DFT reference as npz: {exc}")
+    dft_mode_kappa_avgs = phonons.calc_mode_kappa_tot_avgs(
+        df_dft,
+        cache_path=dft_kappa_path.replace(".json.gz", "-mode-kappa-avgs.npz"),
+        source_key=source_key,
+    )
+
+    # with --batch-writes, YAML files are only written once all models were processed
+    run_batch = batch_yaml_updates() if cli_args.batch_writes else nullcontext()
+
+    with run_batch:
+        for model in models_to_evaluate:
+            if not os.path.isfile(model.kappa_103_path or ""):
+                print(f"Skipping {model.label}: no kappa_103_path found")
+                continue
+
+            try:
+                print(f"\nProcessing {model.label}...")
+
+                # Load and process data
+                df_ml = phonons.read_kappa_file(model.kappa_103_path)
+                df_ml_metrics = phonons.calc_kappa_metrics_from_dfs(
+                    df_ml, df_dft, true_mode_kappa_avgs=dft_mode_kappa_avgs
+                )
+
+                # Calculate metrics
+                kappa_sre = df_ml_metrics[Key.sre].mean()
+                kappa_srme = df_ml_metrics[Key.srme].mean()
+                print(f"\t{kappa_srme=:.4f}")
+                print(f"\t{kappa_sre=:.4f}")
+
+                # Update YAML file
+                metrics_dict = {"srme": kappa_srme, "sre": kappa_sre}
+                phonons.write_metrics_to_yaml(model, metrics_dict, model.kappa_103_path)
+                print(f"\t✓ Updated {model.yaml_path}")
+
+            except Exception as exc:
+                print(f"\t✗ Error processing {model.label}: {exc}")
+                continue
 
 
 if __name__ == "__main__":
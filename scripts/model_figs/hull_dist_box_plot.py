@@ -3,6 +3,7 @@ import plotly.express as px
 import plotly.graph_objects as go
 import pymatviz as pmv
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery import PDF_FIGS, SITE_FIGS
 from matbench_discovery.cli import cli_args
 from matbench_discovery.enums import MbdKey, TestSubset
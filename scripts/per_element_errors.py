@@ -13,6 +13,7 @@ from pymatviz.process_data import bin_df_cols
 from pymatviz.utils import df_ptable, si_fmt
 from tqdm import tqdm
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery import PDF_FIGS, ROOT, SITE_DIR, SITE_FIGS
 from matbench_discovery.cli import cli_args
 from matbench_discovery.data import load_df_wbm_with_preds
@@ -8,6 +8,7 @@ import plotly.express as px
 import pymatviz as pmv
 from pymatviz.enums import Key
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery import SITE_FIGS
 from matbench_discovery.cli import cli_args
 from matbench_discovery.data import load_df_wbm_with_preds
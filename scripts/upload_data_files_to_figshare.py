@@ -87,6 +87,9 @@ def main(
             with open(yaml_path) as file:
                 existing_yaml = round_trip_yaml.load(file)
 
+        # local cache of MD5 hashes keyed by file path, mtime and size
+        manifest = figshare.FileManifest()
+
         # Get existing files from Figshare to avoid re-uploading unchanged files
         existing_files = figshare.list_article_files(article_id)
         print(f"Found {len(existing_files)} existing files on Figshare")
@@ -116,10 +119,7 @@ def main(
 
             # Check if file needs to be uploaded
             file_name = os.path.basename(file_path)
-            # Use stored MD5 if available, else use newly computed
-            file_hash, file_size = figshare.get_file_hash_and_size(file_path)
-            file_hash = file_data.setdefault("md5", file_hash)
-
+            file_size = os.path.getsize(file_path)
             if file_size > max_file_size:
                 print(
                     f"\n⚠️  Skipping {file_name} ({file_size / 1024**2:.1f} MB)"
@@ -129,6 +129,12 @@ def main(
                 )
                 continue
 
+            # only read files to hash them if they changed since the last run, the
+            # upload itself doesn't need a separate hashing pass
+            local_hash = manifest.get_md5(file_path)
+            # Use stored MD5 if available, else use newly computed
+            file_hash = file_data.setdefault("md5", local_hash)
+
             if (
                 existing_file := files_by_name.get(file_name)
             ) and file_hash == existing_file["computed_md5"]:
@@ -139,7 +145,7 @@ def main(
 
             # Upload new or modified file
             file_id = figshare.upload_file(
-                article_id, file_path, file_name=data_file.rel_path
+                article_id, file_path, file_name=data_file.rel_path, md5=local_hash
             )
             file_url = f"{figshare.DOWNLOAD_URL_PREFIX}/{file_id}"
 
@@ -180,6 +186,7 @@ def main(
         # Write updated YAML file
         with open(yaml_path, mode="w") as file:
             round_trip_yaml.dump(files_in_article, file)
+        manifest.save()
 
     except Exception as exc:  # add context to exception for better debugging
         state = {
@@ -77,6 +77,26 @@ def should_process_file(
     return file_type == "all" or key.endswith(f"{file_type}_file")
 
 
+def find_file_keys(
+    data: dict[str, Any],
+    file_type: Literal["all", "analysis", "pred"] = "all",
+    prefix: str = "",
+) -> dict[str, str]:
+    """Find all keys ending in _file and their values in a nested dictionary."""
+    result: dict[str, str] = {}
+    for key, value in data.items():
+        full_key = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            result |= find_file_keys(value, file_type, full_key)
+        elif (
+            isinstance(value, str)
+            and key.endswith("_file")
+            and should_process_file(key, file_type)
+        ):
+            result[full_key] = value
+    return result
+
+
 def update_one_modeling_task_article(
     task: str,
     models: list[Model],
@@ -86,8 +106,13 @@ def update_one_modeling_task_article(
     file_type: Literal["all", "analysis", "pred"] = "all",
     force_reupload: bool = False,
     interactive: bool = True,
+    manifest: figshare.FileManifest | None = None,
 ) -> None:
-    """Update or create a Figshare article for a modeling task."""
+    """Update or create a Figshare article for a modeling task.
+
+    Files whose path, mtime and size match the local manifest aren't re-hashed.
+    """
+    manifest = manifest or figshare.FileManifest()
     if (task_info := modeling_tasks.get(task)) is None:
         raise KeyError(
             f"Missing task metadata for {task!r}. "
@@ -128,6 +153,23 @@ def update_one_modeling_task_article(
     for idx, (file_name, file_data) in enumerate(existing_files.items(), start=1):
         print(f"{idx}. {file_name}: {file_data.get('id')}")
 
+    # stat all candidate files up front and hash only new or modified ones
+    all_file_paths: list[str] = []
+    for model in models:
+        metric_data = model.metrics.get(task) if os.path.isfile(model.yaml_path) else {}
+        if isinstance(metric_data, dict):
+            file_paths = [
+                f"{ROOT}/{rel_path}"
+                for rel_path in find_file_keys(metric_data, file_type).values()
+            ]
+            all_file_paths.extend(filter(os.path.isfile, file_paths))
+    if not dry_run:
+        changed_files = manifest.refresh(all_file_paths)
+        print(
+            f"{len(changed_files)}/{len(all_file_paths)} files new or modified since "
+            "last run"
+        )
+
     # files that were skipped because they already exist
     skipped_files: dict[str, tuple[str, Model]] = {}  # filename -> (url, model)
     updated_files: dict[str, tuple[str, Model]] = {}  # files that were re-uploaded
@@ -149,23 +191,7 @@ def update_one_modeling_task_article(
         if not isinstance(metric_data, dict):
             continue
 
-        # Recursively find all keys ending in _file in the metric_data dictionary
-        def find_file_keys(data: dict[str, Any], prefix: str = "") -> dict[str, str]:
-            """Find all keys ending in _file and their values in a nested dictionary."""
-            result: dict[str, str] = {}
-            for key, value in data.items():
-                full_key = f"{prefix}.{key}" if prefix else key
-                if isinstance(value, dict):
-                    result |= find_file_keys(value, full_key)
-                elif (
-                    isinstance(value, str)
-                    and key.endswith("_file")
-                    and should_process_file(key, file_type)
-                ):
-                    result[full_key] = value
-            return result
-
-        for key_path, rel_file_path in find_file_keys(metric_data).items():
+        for key_path, rel_file_path in find_file_keys(metric_data, file_type).items():
             file_path = f"{ROOT}/{rel_file_path}"
             if not os.path.isfile(file_path):
                 print(
@@ -178,12 +204,14 @@ def update_one_modeling_task_article(
 
             # First check if the exact same file already exists
             if not force_reupload and not dry_run:
-                file_hash, _ = figshare.get_file_hash_and_size(file_path)
-                exists, file_id = figshare.file_exists_with_same_hash(
-                    article_id, filename, file_hash
-                )
+                file_hash = manifest.get_md5(file_path)
+                existing_file = existing_files.get(filename, {})
+                file_id = existing_file.get("id")
 
-                if exists and file_id is not None:
+                if file_id is not None and existing_file.get("computed_md5") == (
+                    file_hash
+                ):
+                    manifest.set_file_id(article_id, file_path, file_id)
                     file_url = f"{figshare.DOWNLOAD_URL_PREFIX}/{file_id}"
                     skipped_files[filename] = (file_url, model)
 
@@ -229,6 +257,7 @@ def update_one_modeling_task_article(
                     file_path,
                     file_name=filename,
                     force_reupload=force_reupload,
+                    manifest=manifest,
                 )
                 file_url = f"{figshare.DOWNLOAD_URL_PREFIX}/{file_id}"
 
@@ -248,6 +277,7 @@ def update_one_modeling_task_article(
         if not dry_run:
             with open(model.yaml_path, mode="w") as file:
                 round_trip_yaml.dump(model_data, file)
+            manifest.save()
 
     # Extract unique models from the file dictionaries
     new_models = {model.name for _, model in new_files.values()}
@@ -371,6 +401,7 @@ def main(raw_args: Sequence[str] | None = None) -> int:
     if args.force_reupload:
         print("Force reupload: True - will reupload files even if they already exist")
 
+    manifest = figshare.FileManifest()
     for task in tasks_to_update:
         try:
             update_one_modeling_task_article(
@@ -381,6 +412,7 @@ def main(raw_args: Sequence[str] | None = None) -> int:
                 file_type=args.file_type,
                 force_reupload=args.force_reupload,
                 interactive=not args.no_interactive,
+                manifest=manifest,
             )
         except Exception as exc:  # prompt to delete article if something went wrong
             state = {
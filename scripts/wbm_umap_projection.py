@@ -19,6 +19,7 @@ from pymatgen.core import Structure
 from pymatviz.enums import Key
 from tqdm import tqdm
 
+import matbench_discovery.plots  # noqa: F401 (applies global plot settings)
 from matbench_discovery import MP_DIR, PDF_FIGS, WBM_DIR
 from matbench_discovery.enums import DataFiles
 
@@ -7,6 +7,7 @@ import pytest
 
 from matbench_discovery.metrics import diatomics
 from matbench_discovery.metrics.diatomics import DiatomicCurves
+from matbench_discovery.metrics.diatomics.energy import interpolate_curves
 
 PredRefForces = tuple[
     dict[str, tuple[np.ndarray, np.ndarray]], dict[str, tuple[np.ndarray, np.ndarray]]
@@ -153,6 +154,57 @@ def test_force_mae_interpolation(pred_ref_forces: PredRefForces) -> None:
     assert abs(mae_interp - mae_custom_interp) < 0.5  # Should be reasonably close
 
 
+def test_force_mae_interpolation_matches_np_interp(
+    pred_ref_forces: PredRefForces,
+) -> None:
+    """Test vectorized force interpolation gives same MAE as per-component np.interp."""
+    ref_forces, pred_forces = pred_ref_forces
+    x_ref, f_ref = ref_forces["H"]
+    x_pred, f_pred = pred_forces["H"]
+    x_pred = x_pred * 1.05
+
+    seps_interp = np.logspace(1, -1, 100)
+
+    def interp_loop(xs: np.ndarray, forces: np.ndarray) -> np.ndarray:
+        sort_idx = np.argsort(xs)
+        xs, forces = xs[sort_idx], forces[sort_idx]
+        return np.stack(
+            [
+                [np.interp(seps_interp, xs, forces[:, atom, dim]) for dim in range(3)]
+                for atom in range(forces.shape[1])
+            ]
+        ).transpose(2, 0, 1)
+
+    expected = np.mean(np.abs(interp_loop(x_ref, f_ref) - interp_loop(x_pred, f_pred)))
+    actual = diatomics.calc_force_mae(x_ref, f_ref, x_pred, f_pred, interpolate=True)
+    assert actual == pytest.approx(expected, rel=1e-12)
+
+
+@pytest.mark.parametrize("axis", [0, 1])
+def test_interpolate_curves(axis: int) -> None:
+    """Test batched interpolation against np.interp incl. out-of-range clamping."""
+    rng = np.random.default_rng(seed=0)
+    xp = np.sort(rng.uniform(0.5, 5, 20))
+    x_new = np.linspace(0, 6, 33)  # extends beyond xp on both sides
+    fp = rng.normal(size=(20, 2, 3))
+    if axis == 1:
+        fp = fp.transpose(1, 0, 2)  # (n_atoms, n_dist, 3)
+
+    out = interpolate_curves(x_new, xp, fp, axis=axis)
+
+    expected_shape = list(fp.shape)
+    expected_shape[axis] = len(x_new)
+    assert out.shape == tuple(expected_shape)
+    fp_first = np.moveaxis(fp, axis, 0)
+    out_first = np.moveaxis(out, axis, 0)
+    for idx in np.ndindex(fp_first.shape[1:]):
+        expected = np.interp(x_new, xp, fp_first[(slice(None), *idx)])
+        np.testing.assert_allclose(out_first[(slice(None), *idx)], expected)
+
+    with pytest.raises(ValueError, match=r"len\(xp\)=3 != len\(fp\)=20"):
+        interpolate_curves(x_new, xp[:3], fp, axis=axis)
+
+
 def test_invalid_inputs() -> None:
     """Test that invalid inputs raise appropriate errors."""
     seps = np.array([1, 2])
@@ -9,7 +9,11 @@ import pytest
 
 from matbench_discovery.enums import MbdKey, Model
 from matbench_discovery.metrics import diatomics
-from matbench_discovery.metrics.diatomics import DiatomicCurve, DiatomicCurves
+from matbench_discovery.metrics.diatomics import (
+    DiatomicCurve,
+    DiatomicCurveArrays,
+    DiatomicCurves,
+)
 
 np_rng = np.random.default_rng(seed=0)
 
@@ -46,6 +50,85 @@ def test_diatomic_classes() -> None:
     np.testing.assert_array_equal(h_he_curve.energies, energies)
 
 
+@pytest.mark.parametrize(
+    "compress, mmap_mode", [(False, None), (True, None), (False, "r")]
+)
+def test_diatomic_curves_npz_round_trip(
+    tmp_path: Path, compress: bool, mmap_mode: str | None
+) -> None:
+    """Test dense array layout and npz round trip of DiatomicCurves."""
+    dists = np.logspace(1, -1, 10)
+    n_pairs, n_dist = 3, len(dists)
+    energies = np_rng.random((n_pairs, n_dist))
+    forces = np_rng.random((n_pairs, n_dist, 2, 3))
+    formulas = ["H-H", "He-He", "Li-Li"]
+    homo_arrays = DiatomicCurveArrays(formulas, energies, forces)
+    hetero_arrays = DiatomicCurveArrays(["H-He"], energies[:1], forces[:1])
+    assert homo_arrays.pair_index == {"H-H": 0, "He-He": 1, "Li-Li": 2}
+
+    curves = DiatomicCurves.from_arrays(dists, homo_arrays, hetero_arrays)
+    # dict API entries are views into the dense arrays
+    assert np.shares_memory(curves.homo_nuclear["He-He"].energies, energies)
+    np.testing.assert_array_equal(curves.homo_nuclear["Li-Li"].forces, forces[2])
+
+    stacked = curves.to_arrays()
+    assert stacked.formulas == formulas
+    np.testing.assert_array_equal(stacked.energies, energies)
+    np.testing.assert_array_equal(stacked.forces, forces)
+
+    npz_path = f"{tmp_path}/curves.npz"
+    curves.to_npz(npz_path, compress=compress)
+    loaded = DiatomicCurves.from_npz(npz_path, mmap_mode=mmap_mode)  # type: ignore[arg-type]
+    np.testing.assert_array_equal(loaded.distances, dists)
+    assert list(loaded.homo_nuclear) == formulas
+    assert list(loaded.hetero_nuclear) == ["H-He"]
+    for formula, idx in homo_arrays.pair_index.items():
+        np.testing.assert_array_equal(
+            loaded.homo_nuclear[formula].energies, energies[idx]
+        )
+        np.testing.assert_array_equal(loaded.homo_nuclear[formula].forces, forces[idx])
+    np.testing.assert_array_equal(loaded.hetero_nuclear["H-He"].forces, forces[0])
+    if mmap_mode:
+        assert isinstance(loaded.to_arrays().energies, np.ndarray)
+        assert isinstance(loaded.homo_nuclear["H-H"].energies.base, np.memmap)
+
+    # dict-based curves without hetero-nuclear pairs also round trip
+    dict_curves = DiatomicCurves.from_dict(
+        {
+            "distances": dists,
+            "homo-nuclear": {
+                "H-H": {"energies": energies[0], "forces": forces[0]},
+                "He-He": {"energies": [], "forces": []},  # dropped by from_dict
+            },
+        }
+    )
+    dict_curves.to_npz(npz_path, compress=compress)
+    loaded = DiatomicCurves.from_npz(npz_path, mmap_mode=mmap_mode)  # type: ignore[arg-type]
+    assert list(loaded.homo_nuclear) == ["H-H"]
+    assert loaded.hetero_nuclear == {}
+
+
+def test_diatomic_curve_arrays_validation(tmp_path: Path) -> None:
+    """Test shape validation of DiatomicCurveArrays and mmap of compressed files."""
+    with pytest.raises(ValueError, match=r"energies must have shape \(n_pairs=2"):
+        DiatomicCurveArrays(["H-H", "He-He"], np.zeros((1, 4)), np.zeros((1, 4, 2, 3)))
+    with pytest.raises(ValueError, match=r"forces must have shape \(1, 4, 2, 3\)"):
+        DiatomicCurveArrays(["H-H"], np.zeros((1, 4)), np.zeros((1, 3, 2, 3)))
+
+    dists = np.arange(4.0)
+    ragged = {
+        "H-H": DiatomicCurve(dists, np.zeros(4), np.zeros((4, 2, 3))),
+        "He-He": DiatomicCurve(dists[:3], np.zeros(3), np.zeros((3, 2, 3))),
+    }
+    with pytest.raises(ValueError, match="All curves must have the same length"):
+        DiatomicCurveArrays.from_curves(ragged)
+
+    npz_path = f"{tmp_path}/curves.npz"
+    DiatomicCurves(dists, {"H-H": ragged["H-H"]}).to_npz(npz_path, compress=True)
+    with pytest.raises(ValueError, match="Cannot memory-map compressed array"):
+        DiatomicCurves.from_npz(npz_path, mmap_mode="r")
+
+
 def base_curve(xs: np.ndarray) -> np.ndarray:
     """Simple Morse potential."""
     return 5 * (1 - np.exp(-2 * (xs - 1.5))) ** 2 - 5
@@ -250,3 +333,63 @@ def test_write_metrics_to_yaml(tmp_path: Path, monkeypatch: pytest.MonkeyPatch)
     # Check the returned dictionary
     assert isinstance(result, dict)
     assert result == {"conservation": 4.5, "smoothness": 2.5, "tortuosity": 3.5}
+
+
+@pytest.mark.parametrize("interpolate", [False, True, 50])
+@pytest.mark.parametrize("with_ref", [True, False])
+def test_calc_diatomic_metrics_batch_matches_scalar(
+    pred_ref_diatomic_curves: tuple[DiatomicCurves, DiatomicCurves],
+    interpolate: bool | int,
+    with_ref: bool,
+) -> None:
+    """Test vectorized metrics match the per-pair calc_diatomic_metrics."""
+    ref_curves, pred_curves = pred_ref_diatomic_curves
+    # add a noisy curve with many energy and force sign flips
+    dists = pred_curves.distances
+    noisy = DiatomicCurve(
+        distances=dists,
+        energies=np.sin(5 * dists) + 0.01 * np_rng.normal(size=len(dists)),
+        forces=np_rng.normal(size=(len(dists), 2, 3)),
+    )
+    pred_curves = DiatomicCurves(dists, pred_curves.homo_nuclear | {"Li": noisy})
+    metrics: dict[str, dict[str, Any]] = {
+        MbdKey.force_flips: {"threshold": 0.1},
+        MbdKey.norm_auc: {"seps_range": (0.5, 5)},
+    }
+    kwargs = dict(metrics=metrics, interpolate=interpolate)
+    ref = ref_curves if with_ref else None
+
+    expected = diatomics.calc_diatomic_metrics(ref, pred_curves, **kwargs)  # type: ignore[arg-type]
+    actual = diatomics.calc_diatomic_metrics_batch(ref, pred_curves, **kwargs)  # type: ignore[arg-type]
+
+    assert list(actual) == list(expected) == ["H", "He", "Li"]
+    for formula, elem_metrics in expected.items():
+        assert list(actual[formula]) == list(elem_metrics), formula
+        for key, val in elem_metrics.items():
+            assert actual[formula][key] == pytest.approx(val, rel=1e-9), (formula, key)
+    if with_ref:  # Li has no reference curve
+        assert MbdKey.energy_mae in actual["He"]
+        assert MbdKey.energy_mae not in actual["Li"]
+
+
+def test_calc_diatomic_metrics_batch_validation() -> None:
+    """Test grid and curve validation of the vectorized metrics."""
+    dists = np.linspace(0.5, 5, 10)
+    bad_energies = np.linspace(1, 0, 10)
+    bad_energies[3] = np.nan
+    curves = DiatomicCurves(
+        dists,
+        {
+            "H": DiatomicCurve(dists, np.linspace(1, 0, 10), np.zeros((10, 2, 3))),
+            "He": DiatomicCurve(dists, bad_energies, np.zeros((10, 2, 3))),
+        },
+    )
+    with pytest.raises(ValueError, match=r"1 curves contain NaN .* \['He'\]"):
+        diatomics.calc_diatomic_metrics_batch(None, curves)
+
+    dup_dists = np.r_[dists[:-1], dists[0]]
+    curves.distances = dup_dists
+    with pytest.raises(ValueError, match="Distances contain 1 dupes"):
+        diatomics.calc_diatomic_metrics_batch(None, curves)
+
+    assert diatomics.calc_diatomic_metrics_batch(None, DiatomicCurves(dists, {})) == {}
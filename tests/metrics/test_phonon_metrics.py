@@ -1,5 +1,8 @@
 """Tests for thermal conductivity metrics."""
 
+import os
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 import pytest
@@ -428,6 +431,214 @@ def test_calc_kappa_srme_dataframes_error_handling(df_minimal: pd.DataFrame) ->
     assert 0 <= result[1] <= 2  # Second entry should be valid SRME value
 
 
+def make_multi_temp_kappa_dfs(
+    n_materials: int = 5, n_temps: int = 3
+) -> tuple[pd.DataFrame, pd.DataFrame]:
+    """Random pred and true kappa dataframes with different numbers of modes per
+    material and multiple temperatures.
+    """
+    rng = np.random.default_rng(seed=0)
+    dfs = []
+    for _ in range(2):
+        rows = []
+        for mat_idx in range(n_materials):
+            n_q, n_bands = 2 + mat_idx, 3 * (1 + mat_idx % 2)
+            mode_kappa = rng.random((n_temps, n_q, n_bands, 6))
+            kappa_tot = mode_kappa.sum(axis=(1, 2)) / n_q
+            rows += [
+                {
+                    MbdKey.kappa_tot_rta: kappa_tot,
+                    MbdKey.kappa_tot_avg: kappa_tot[:, :3].mean(axis=-1),
+                    MbdKey.mode_kappa_tot_rta: mode_kappa,
+                    Key.mode_weights: np.ones(n_q),
+                }
+            ]
+        dfs += [pd.DataFrame(rows, index=[f"mp-{idx}" for idx in range(n_materials)])]
+    return dfs[0], dfs[1]
+
+
+def test_calc_kappa_srme_per_temp_matches_calc_kappa_srme() -> None:
+    """Test vectorized SRME agrees with per-material SRME at all temperatures."""
+    df_pred, df_true = make_multi_temp_kappa_dfs()
+    df_pred[Key.has_imag_ph_modes] = [False, True, False, False, False]
+    df_pred[Key.final_spg_num] = [225, 225, 186, 216, 216]
+    df_pred[Key.init_spg_num] = [225, 225, 225, 216, 216]
+
+    srme_per_temp = phonon_metrics.calc_kappa_srme_per_temp(df_pred, df_true)
+
+    assert len(srme_per_temp) == len(df_pred)
+    for mat_id, srmes in zip(df_pred.index, srme_per_temp, strict=True):
+        assert srmes.shape == (3,)
+        if mat_id in ("mp-1", "mp-2"):  # imaginary modes and broken symmetry
+            assert list(srmes) == [2, 2, 2]
+        else:
+            expected = phonon_metrics.calc_kappa_srme(
+                df_pred.loc[mat_id], df_true.loc[mat_id]
+            )
+            assert_allclose(srmes, expected, rtol=1e-12)
+            assert np.all((srmes > 0) & (srmes < 2))
+
+    # first temperature is what calc_kappa_srme_dataframes returns
+    srme_first_temp = phonon_metrics.calc_kappa_srme_dataframes(df_pred, df_true)
+    assert srme_first_temp == [srmes[0] for srmes in srme_per_temp]
+
+
+def test_calc_kappa_metrics_from_dfs_all_temps() -> None:
+    """Test temp_idx=None keeps SRD, SRE and SRME for all temperatures."""
+    df_pred, df_true = make_multi_temp_kappa_dfs(n_materials=3, n_temps=2)
+    df_first = phonon_metrics.calc_kappa_metrics_from_dfs(df_pred.copy(), df_true)
+    df_all = phonon_metrics.calc_kappa_metrics_from_dfs(
+        df_pred.copy(), df_true, temp_idx=None
+    )
+    df_second = phonon_metrics.calc_kappa_metrics_from_dfs(
+        df_pred.copy(), df_true, temp_idx=1
+    )
+
+    for key in (Key.srd, Key.sre, Key.srme):
+        assert all(np.shape(val) == (2,) for val in df_all[key])
+        assert_allclose(df_all[key].map(lambda x: x[0]), df_first[key])
+        assert_allclose(df_all[key].map(lambda x: x[1]), df_second[key])
+    assert_allclose(np.stack(df_all[Key.sre]), np.abs(np.stack(df_all[Key.srd])))
+
+
+def test_calc_mode_kappa_tot_avgs_cache(tmp_path: Path) -> None:
+    """Test precomputed reference mode kappa averages are cached to disk and give the
+    same SRME as computing them on the fly.
+    """
+    df_pred, df_true = make_multi_temp_kappa_dfs(n_materials=3)
+    cache_path = f"{tmp_path}/mode-kappa-avgs.npz"
+
+    mode_kappa_avgs = phonon_metrics.calc_mode_kappa_tot_avgs(
+        df_true, cache_path=cache_path
+    )
+    assert os.path.isfile(cache_path)
+    assert list(mode_kappa_avgs.index) == list(df_true.index)
+    for mat_id, mode_kappa_avg in mode_kappa_avgs.items():
+        expected = df_true.loc[mat_id, MbdKey.mode_kappa_tot_rta][..., :3].mean(-1)
+        assert_allclose(mode_kappa_avg, expected)
+
+    # second call loads from cache without touching df_true
+    cached = phonon_metrics.calc_mode_kappa_tot_avgs(
+        df_true.iloc[:0], cache_path=cache_path
+    )
+    assert list(cached.index) == list(df_true.index)
+
+    srme_cached = phonon_metrics.calc_kappa_srme_dataframes(
+        df_pred, df_true, true_mode_kappa_avgs=cached
+    )
+    srme_on_the_fly = phonon_metrics.calc_kappa_srme_dataframes(df_pred, df_true)
+    assert srme_cached == pytest.approx(srme_on_the_fly)
+
+
+def test_kappa_npz_source_key_invalidates_cache(tmp_path: Path) -> None:
+    """Test caches written for an older version of the source data are overwritten
+    in place instead of being read or piling up next to new ones.
+    """
+    _, df_true = make_multi_temp_kappa_dfs(n_materials=3)
+    src_path, cache_path = f"{tmp_path}/kappa.json", f"{tmp_path}/avgs.npz"
+    assert phonon_metrics.read_kappa_npz_source_key(cache_path) is None
+
+    with open(src_path, mode="w") as file:
+        file.write("v1")
+    key_v1 = phonon_metrics.get_file_source_key(src_path)
+    phonon_metrics.calc_mode_kappa_tot_avgs(
+        df_true, cache_path=cache_path, source_key=key_v1
+    )
+    assert phonon_metrics.read_kappa_npz_source_key(cache_path) == key_v1
+
+    # same source: cached values are used, df_kappa isn't touched
+    cached = phonon_metrics.calc_mode_kappa_tot_avgs(
+        df_true.iloc[:0], cache_path=cache_path, source_key=key_v1
+    )
+    assert len(cached) == len(df_true)
+
+    # changed source: cache is recomputed and overwritten at the same path
+    with open(src_path, mode="w") as file:
+        file.write("v2 with different size")
+    key_v2 = phonon_metrics.get_file_source_key(src_path)
+    assert key_v2 != key_v1
+    recomputed = phonon_metrics.calc_mode_kappa_tot_avgs(
+        df_true.iloc[:1], cache_path=cache_path, source_key=key_v2
+    )
+    assert len(recomputed) == 1
+    assert phonon_metrics.read_kappa_npz_source_key(cache_path) == key_v2
+    # no leftover temp files or caches named after old source versions
+    assert sorted(os.listdir(tmp_path)) == ["avgs.npz", "kappa.json"]
+
+
+@pytest.mark.parametrize("compress", [True, False])
+def test_write_read_kappa_npz(tmp_path: Path, compress: bool) -> None:
+    """Test round-tripping ragged mode-resolved kappa arrays through .npz files."""
+    df_kappa, _ = make_multi_temp_kappa_dfs(n_materials=4)
+    df_kappa.index.name = Key.mat_id
+    df_kappa[Key.has_imag_ph_modes] = [False, True, False, False]
+    df_kappa[Key.final_spg_num] = [225, 186, 216, 225]
+    # failed materials have NaN instead of arrays
+    df_kappa.loc["mp-1", MbdKey.mode_kappa_tot_rta] = np.nan
+
+    npz_path = f"{tmp_path}/kappa.npz"
+    phonon_metrics.write_kappa_npz(df_kappa, npz_path, compress=compress)
+    df_read = phonon_metrics.read_kappa_npz(npz_path)
+
+    pd.testing.assert_index_equal(df_read.index, df_kappa.index)
+    assert list(df_read) == list(df_kappa)
+    for col in df_kappa:
+        for val_read, val_orig in zip(df_read[col], df_kappa[col], strict=True):
+            assert np.shape(val_read) == np.shape(val_orig)
+            assert_allclose(val_read, val_orig)
+    assert np.isnan(df_read.loc["mp-1", MbdKey.mode_kappa_tot_rta])
+    assert df_read[Key.has_imag_ph_modes].dtype == bool
+
+    # read_kappa_file dispatches on file extension
+    pd.testing.assert_frame_equal(phonon_metrics.read_kappa_file(npz_path), df_read)
+
+    # load subset of columns
+    df_subset = phonon_metrics.read_kappa_npz(npz_path, columns=[Key.mode_weights])
+    assert list(df_subset) == [Key.mode_weights]
+    with pytest.raises(ValueError, match="missing_cols={'foo'} not in"):
+        phonon_metrics.read_kappa_npz(npz_path, columns=["foo"])
+
+    # SRME is unchanged when reading from npz
+    df_true = df_kappa.copy()
+    srme_orig = phonon_metrics.calc_kappa_srme_dataframes(df_kappa, df_true)
+    srme_npz = phonon_metrics.calc_kappa_srme_dataframes(df_read, df_true)
+    assert srme_npz == pytest.approx(srme_orig)
+
+
+def test_write_kappa_npz_rejects_mixed_scalars(tmp_path: Path) -> None:
+    """Test scalar columns with mixed types can't be written to npz."""
+    df_kappa = pd.DataFrame({"mixed": [1, "a", None]})
+    with pytest.raises(ValueError, match="Can't store col='mixed' with mixed-type"):
+        phonon_metrics.write_kappa_npz(df_kappa, f"{tmp_path}/kappa.npz")
+
+    # None cells in array columns would be pickled object arrays
+    df_kappa = pd.DataFrame({"arrays": [np.ones(3), None]})
+    with pytest.raises(ValueError, match="Can't store col='arrays' with object dtype"):
+        phonon_metrics.write_kappa_npz(df_kappa, f"{tmp_path}/kappa.npz")
+
+
+def test_kappa_npz_nullable_bools_match_json(tmp_path: Path) -> None:
+    """Test booleans with missing values (e.g. has_imag_ph_modes of failed
+    materials) read back from npz the same as from JSON so both give the same SRME.
+    """
+    df_pred, df_true = make_multi_temp_kappa_dfs(n_materials=3)
+    df_pred.index.name = Key.mat_id
+    df_pred[Key.has_imag_ph_modes] = [True, False, None]
+
+    json_path, npz_path = f"{tmp_path}/kappa.json.gz", f"{tmp_path}/kappa.npz"
+    df_pred.reset_index().to_json(json_path)
+    phonon_metrics.write_kappa_npz(df_pred, npz_path)
+    df_json = phonon_metrics.read_kappa_file(json_path)
+    df_npz = phonon_metrics.read_kappa_file(npz_path)
+
+    assert_allclose(df_npz[Key.has_imag_ph_modes], [1.0, 0.0, np.nan])
+    assert_allclose(df_npz[Key.has_imag_ph_modes], df_json[Key.has_imag_ph_modes])
+
+    srme_json = phonon_metrics.calc_kappa_metrics_from_dfs(df_json, df_true)[Key.srme]
+    srme_npz = phonon_metrics.calc_kappa_metrics_from_dfs(df_npz, df_true)[Key.srme]
+    assert_allclose(srme_npz, srme_json)
+
+
 @pytest.mark.parametrize(
     ("metrics_data", "existing_data", "expected_metrics", "expected_preserved"),
     [
@@ -493,36 +704,37 @@ def test_write_metrics_to_yaml(
     existing_data: dict[str, dict[str, dict[str, dict[str, str | float]]]],
     expected_metrics: dict[str, float | str],
     expected_preserved: dict[str, str | float],
+    tmp_path: Path,
 ) -> None:
     """Test writing kappa metrics to YAML files with various scenarios."""
-    from unittest.mock import MagicMock, mock_open, patch
+    from unittest.mock import MagicMock
 
-    mock_model = MagicMock(spec=Model)
-    mock_model.yaml_path = "mock_path/test_model.yml"
+    from matbench_discovery.data import round_trip_yaml
 
-    with patch("ruamel.yaml.YAML") as mock_yaml_class:
-        mock_yaml = mock_yaml_class.return_value
-        mock_yaml.load.return_value = existing_data
+    yaml_path = tmp_path / "test_model.yml"
+    with open(yaml_path, mode="w") as file:
+        round_trip_yaml.dump(existing_data, file)
+    mock_model = MagicMock(spec=Model)
+    mock_model.yaml_path = str(yaml_path)
 
-        with patch("builtins.open", mock_open()):
-            phonon_metrics.write_metrics_to_yaml(
-                mock_model,  # type: ignore[arg-type]
-                metrics_data,
-                "models/test/kappa-103.json.gz",
-            )
+    phonon_metrics.write_metrics_to_yaml(
+        mock_model,  # type: ignore[arg-type]
+        metrics_data,
+        "models/test/kappa-103.json.gz",
+    )
 
-            actual_yaml = mock_yaml.dump.call_args[0][0]
-            actual_kappa_103 = actual_yaml["metrics"]["phonons"]["kappa_103"]
-
-            # Check new metrics were added
-            for key, expected_val in expected_metrics.items():
-                if isinstance(expected_val, float):
-                    assert actual_kappa_103[key] == pytest.approx(
-                        expected_val, rel=1e-4
-                    )
-                else:
-                    assert actual_kappa_103[key] == expected_val
-
-            # Check existing fields were preserved
-            for key, expected_val in expected_preserved.items():
-                assert actual_kappa_103[key] == expected_val
+    with open(yaml_path) as file:
+        actual_yaml = round_trip_yaml.load(file)
+    actual_kappa_103 = actual_yaml["metrics"]["phonons"]["kappa_103"]
+
+    # Check new metrics were added
+    for key, expected_val in expected_metrics.items():
+        if isinstance(expected_val, float):
+            assert actual_kappa_103[key] == pytest.approx(expected_val, rel=1e-4)
+        else:
+            assert actual_kappa_103[key] == expected_val
+
+    # Check existing fields were preserved
+    for key, expected_val in expected_preserved.items():
+        assert actual_kappa_103[key] == expected_val
+    assert os.listdir(tmp_path) == ["test_model.yml"]  # no leftover temp files
@@ -1,7 +1,10 @@
 import numpy as np
+import pandas as pd
 import pytest
+from pymatviz.enums import Key
 
 from matbench_discovery import phonons
+from matbench_discovery.enums import MbdKey
 
 
 @pytest.mark.parametrize(
@@ -17,3 +20,44 @@ from matbench_discovery import phonons
 def test_check_imaginary_freqs(freqs: np.ndarray, expected: bool) -> None:
     """Test checking for imaginary frequencies."""
     assert phonons.check_imaginary_freqs(freqs) == expected
+
+
+def test_check_imaginary_freqs_batch() -> None:
+    """Test batched imaginary frequency check agrees with single-material check."""
+    rng = np.random.default_rng(seed=0)
+    freqs_list = [
+        np.array([[0.1, 0.2, 0.3, 0.4]]),  # all positive
+        np.array([[0.1, 0.2, -0.3, 0.4]]),  # negative acoustic below threshold
+        np.array([[0.1, 0.2, 0.3], [-0.1, 0.2, 0.3]]),  # negative in non-gamma
+        np.array([[-1e-3, 0.1, 0.2, -0.5], [0.1, 0.2, 0.3, 0.4]]),  # optical at gamma
+        np.array([[-1e-3, -5e-3, 0.2, 0.3]]),  # acoustic noise above threshold
+        np.full((2, 4), np.nan),  # all NaN
+        rng.normal(size=(5, 6)),  # many imaginary modes
+    ]
+    mat_ids = [f"mp-{idx}" for idx in range(len(freqs_list))]
+
+    df_imag = phonons.check_imaginary_freqs_batch(pd.Series(freqs_list, index=mat_ids))
+
+    assert list(df_imag.index) == mat_ids
+    assert df_imag[Key.has_imag_ph_modes].tolist() == [
+        phonons.check_imaginary_freqs(freqs) for freqs in freqs_list
+    ]
+    assert df_imag[MbdKey.n_imag_ph_modes].tolist()[:6] == [0, 1, 1, 1, 0, 0]
+    assert df_imag[MbdKey.max_imag_ph_freq].tolist()[:5] == [0, 0.3, 0.1, 0.5, 0]
+    assert np.isnan(df_imag.loc["mp-5", MbdKey.max_imag_ph_freq])
+
+    random_freqs = freqs_list[-1]
+    n_imag = (random_freqs[1:] < 0).sum() + (random_freqs[0, :3] < -0.01).sum()
+    n_imag += (random_freqs[0, 3:] < 0).sum()
+    assert df_imag.loc["mp-6", MbdKey.n_imag_ph_modes] == n_imag
+    assert df_imag.loc["mp-6", MbdKey.max_imag_ph_freq] == -random_freqs.min()
+
+    # plain sequences get a RangeIndex
+    df_seq = phonons.check_imaginary_freqs_batch(freqs_list, threshold=-1e-4)
+    assert list(df_seq.index) == list(range(len(freqs_list)))
+    assert df_seq[Key.has_imag_ph_modes].iloc[4]  # acoustic noise now below threshold
+
+    assert len(phonons.check_imaginary_freqs_batch([])) == 0
+
+    with pytest.raises(ValueError, match="frequencies must be 2D"):
+        phonons.check_imaginary_freqs_batch([np.zeros(3)])
@@ -7,6 +7,7 @@ from ase.build import bulk
 from ase.calculators.calculator import Calculator
 from ase.calculators.emt import EMT
 from phono3py.api_phono3py import Phono3py
+from phonopy import Phonopy
 from phonopy.structure.atoms import PhonopyAtoms
 from pymatviz.enums import Key
 
@@ -133,6 +134,88 @@ def test_get_fc2_and_freqs(test_ph3: Phono3py, test_calculator: EMT) -> None:
     assert freqs.shape == (n_bz_grid, n_bands)
 
 
+def test_get_harmonic_freqs(
+    test_atoms: Atoms, test_ph3: Phono3py, test_calculator: EMT
+) -> None:
+    """Test harmonic-only pipeline matches frequencies from get_fc2_and_freqs."""
+    phonon = ltc.init_phonopy(test_atoms, fc2_supercell=2 * np.eye(3))
+    assert isinstance(phonon, Phonopy)
+    assert len(phonon.supercell) == len(test_atoms) * 8
+
+    fc2_set, freqs = ltc.get_harmonic_freqs(
+        phonon, test_calculator, q_point_mesh=(2, 2, 2), pbar_kwargs={}
+    )
+    _, ph3_fc2_set, ph3_freqs = ltc.get_fc2_and_freqs(
+        test_ph3, test_calculator, pbar_kwargs={}
+    )
+    np.testing.assert_allclose(fc2_set, ph3_fc2_set)
+    assert freqs.ndim == 2
+    assert freqs.shape[1] == 3  # n_bands
+    # Gamma point first, acoustic modes ~0
+    np.testing.assert_allclose(freqs[0], ph3_freqs[0], atol=1e-6)
+    np.testing.assert_allclose(freqs[0], 0, atol=1e-3)
+    # irreducible q-points are a subset of the full BZ grid frequencies
+    np.testing.assert_allclose(
+        np.unique(freqs.round(6)), np.unique(ph3_freqs.round(6)), atol=1e-5
+    )
+
+
+def test_screen_imaginary_freqs(test_atoms: Atoms, test_calculator: EMT) -> None:
+    """Test screening many structures for imaginary modes."""
+    stable = test_atoms.copy()
+    stable.info[Key.mat_id] = "stable"
+    # strongly expanded fcc Al is dynamically unstable under EMT
+    stretched = bulk("Al", "fcc", a=5.0)
+    stretched.info = test_atoms.info | {Key.mat_id: "stretched"}
+
+    df_screen = ltc.screen_imaginary_freqs(
+        (atoms for atoms in (stable, stretched)), test_calculator, pbar_kwargs={}
+    )
+    assert list(df_screen.index) == ["stable", "stretched"]
+    assert list(df_screen) == [
+        Key.has_imag_ph_modes,
+        MbdKey.n_imag_ph_modes,
+        MbdKey.max_imag_ph_freq,
+    ]
+    assert not df_screen.loc["stable", Key.has_imag_ph_modes]
+    assert df_screen.loc["stable", MbdKey.n_imag_ph_modes] == 0
+    assert df_screen.loc["stretched", Key.has_imag_ph_modes]
+    assert df_screen.loc["stretched", MbdKey.n_imag_ph_modes] > 0
+    assert df_screen.loc["stretched", MbdKey.max_imag_ph_freq] > 1
+
+    # explicit args override atoms.info and index falls back to position
+    df_no_ids = ltc.screen_imaginary_freqs(
+        [bulk("Al", "fcc", a=4.05)],
+        test_calculator,
+        fc2_supercell=2 * np.eye(3),
+        q_point_mesh=(2, 2, 2),
+        pbar_kwargs={},
+    )
+    assert list(df_no_ids.index) == [0]
+    assert ltc.screen_imaginary_freqs([], test_calculator).empty
+
+
+def test_screen_imaginary_freqs_failures(
+    test_atoms: Atoms, test_calculator: EMT, capsys: pytest.CaptureFixture
+) -> None:
+    """Test structures that fail are reported and don't abort the screen."""
+    # EMT has no parameters for Si
+    silicon = bulk("Si", "diamond", a=5.43)
+    silicon.info = test_atoms.info | {Key.mat_id: "silicon"}
+    stable = test_atoms.copy()
+    stable.info[Key.mat_id] = "stable"
+
+    df_screen = ltc.screen_imaginary_freqs(
+        [silicon, stable], test_calculator, pbar_kwargs={}
+    )
+
+    assert list(df_screen.index) == ["silicon", "stable"]
+    assert df_screen.loc["silicon"].isna().all()
+    assert df_screen.loc["stable", Key.has_imag_ph_modes] is False
+    assert df_screen.loc["stable", MbdKey.n_imag_ph_modes] == 0
+    assert "Failed to screen silicon" in capsys.readouterr().out
+
+
 def test_load_force_sets(test_ph3: Phono3py) -> None:
     """Test loading pre-computed force sets.
 
@@ -219,6 +302,42 @@ def test_calculate_mode_kappa_tot() -> None:
     assert result.shape == mode_kappa_p_rta.shape
 
 
+@pytest.mark.parametrize("chunk_size", [None, 1, 2, 3, 5, 100])
+def test_calc_mode_kappa_tot_chunked(chunk_size: int | None) -> None:
+    """Test q-point-chunked mode kappa matches the unchunked broadcast formula."""
+    n_temps, n_q, n_bands = 2, 7, 4
+    mode_kappa_p_rta = NP_RNG.random((n_temps, n_q, n_bands, 6))
+    mode_kappa_coherence = NP_RNG.random((n_temps, n_q, n_bands, n_bands, 6))
+    heat_capacity = NP_RNG.random((n_temps, n_q, n_bands))
+    heat_capacity[:, 0, :3] = 0  # acoustic modes at Gamma yield 0/0 = NaN
+
+    # reference: full (T, q, bands, bands, xyz) broadcast
+    with np.errstate(divide="ignore", invalid="ignore"):
+        expected = 2 * (
+            (mode_kappa_coherence * heat_capacity[:, :, :, None, None])
+            / (heat_capacity[:, :, :, None, None] + heat_capacity[:, :, None, :, None])
+        ).sum(axis=2)
+    expected[np.isnan(expected)] = 0
+    expected += mode_kappa_p_rta
+
+    result = ltc.calc_mode_kappa_tot(
+        mode_kappa_p_rta, mode_kappa_coherence, heat_capacity, chunk_size=chunk_size
+    )
+    assert result.shape == mode_kappa_p_rta.shape
+    np.testing.assert_array_equal(result, expected)
+
+
+def test_calc_mode_kappa_tot_invalid_chunk_size() -> None:
+    """Test non-positive chunk sizes are rejected."""
+    with pytest.raises(ValueError, match="chunk_size=0 must be a positive integer"):
+        ltc.calc_mode_kappa_tot(
+            np.zeros((1, 2, 3, 3)),
+            np.zeros((1, 2, 3, 3, 3)),
+            np.zeros((1, 2, 3)),
+            chunk_size=0,
+        )
+
+
 class MockCalculator(Calculator):
     """Mock calculator that returns predefined forces."""
 
@@ -1,11 +1,21 @@
+import hashlib
 import os
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 import requests
 
-from matbench_discovery.remote.fetch import maybe_auto_download_file
+from matbench_discovery.enums import DataFiles, Model
+from matbench_discovery.remote.fetch import (
+    download_file,
+    get_session,
+    maybe_auto_download_file,
+    prefetch,
+)
 
 
 def test_download_file(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
@@ -21,18 +31,22 @@ def test_download_file(tmp_path: Path, capsys: pytest.CaptureFixture) -> None:
     mock_response = requests.Response()
     mock_response.status_code = 200
     mock_response._content = test_content  # noqa: SLF001
+    mock_response._content_consumed = True  # noqa: SLF001
 
-    with patch("requests.get", return_value=mock_response):
-        download_file(str(dest_path), url)
+    with patch.object(requests.Session, "get", return_value=mock_response):
+        assert download_file(str(dest_path), url) is True
         assert dest_path.read_bytes() == test_content
 
     # Mock failed request
     mock_response = requests.Response()
     mock_response.status_code = 404
     mock_response._content = b"Not found"  # noqa: SLF001
+    mock_response._content_consumed = True  # noqa: SLF001
 
-    with patch("requests.get", return_value=mock_response):
-        download_file(str(dest_path), url)  # Should print error but not raise
+    with patch.object(requests.Session, "get", return_value=mock_response):
+        # Should print error but not raise, existing file is left in place
+        assert download_file(str(dest_path), url) is False
+        assert dest_path.read_bytes() == test_content
 
     stdout, stderr = capsys.readouterr()
     assert f"Error downloading {url=}" in stdout
@@ -51,10 +65,11 @@ def test_maybe_auto_download_file(
     mock_response = requests.Response()
     mock_response.status_code = 200
     mock_response._content = b"test content"  # noqa: SLF001
+    mock_response._content_consumed = True  # noqa: SLF001
 
     # Test 1: Auto-download enabled (default)
     monkeypatch.setenv("MBD_AUTO_DOWNLOAD_FILES", "true")
-    with patch("requests.get", return_value=mock_response):
+    with patch.object(requests.Session, "get", return_value=mock_response):
         maybe_auto_download_file(url, abs_path, label="test")
         stdout, _ = capsys.readouterr()
         assert f"Downloading 'test' from {url!r}" in stdout
@@ -67,7 +82,7 @@ def test_maybe_auto_download_file(
 
     # Mock user input 'n' to skip download
     with (
-        patch("requests.get", return_value=mock_response),
+        patch.object(requests.Session, "get", return_value=mock_response),
         patch("builtins.input", return_value="n"),
         patch("sys.stdin.isatty", return_value=True),  # force interactive mode
     ):
@@ -76,7 +91,7 @@ def test_maybe_auto_download_file(
 
     # Test 3: Auto-download disabled but user confirms
     with (
-        patch("requests.get", return_value=mock_response),
+        patch.object(requests.Session, "get", return_value=mock_response),
         patch("builtins.input", return_value="y"),
         patch("sys.stdin.isatty", return_value=True),  # force interactive mode
     ):
@@ -86,14 +101,14 @@ def test_maybe_auto_download_file(
         assert os.path.isfile(abs_path)
 
     # Test 4: File already exists (no download attempt)
-    with patch("requests.get") as mock_get:
+    with patch.object(requests.Session, "get") as mock_get:
         maybe_auto_download_file(url, abs_path, label="test")
         mock_get.assert_not_called()
 
     # Test 5: Non-interactive session (auto-download)
     os.remove(abs_path)
     with (
-        patch("requests.get", return_value=mock_response),
+        patch.object(requests.Session, "get", return_value=mock_response),
         patch("sys.stdin.isatty", return_value=False),
         patch("builtins.input", return_value="y"),  # Fallback input mock
     ):
@@ -105,9 +120,201 @@ def test_maybe_auto_download_file(
     # Test 6: IPython session with auto-download disabled
     os.remove(abs_path)
     with (
-        patch("requests.get", return_value=mock_response),
+        patch.object(requests.Session, "get", return_value=mock_response),
         patch("builtins.input", return_value="n"),
         patch("sys.stdin.isatty", return_value=True),  # force interactive mode
     ):
         maybe_auto_download_file(url, abs_path, label="test")
         assert not os.path.isfile(abs_path)
+
+
+@pytest.fixture
+def file_server() -> Iterator[tuple[str, dict[str, bytes], list[str | None]]]:
+    """Local HTTP server serving in-memory files with HTTP Range support.
+
+    Yields the base URL, a dict of URL paths to file contents to serve (mutate to add
+    files) and a list of Range headers received with each request.
+    """
+    files: dict[str, bytes] = {}
+    range_headers: list[str | None] = []
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            range_header = self.headers.get("Range")
+            range_headers.append(range_header)
+            if self.path not in files:
+                self.send_error(404)
+                return
+            content, status = files[self.path], 200
+            if range_header and self.path.startswith("/ranged/"):
+                start = int(range_header.removeprefix("bytes=").removesuffix("-"))
+                if start >= len(content):
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{len(content)}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                content, status = content[start:], 206
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(content)))
+            self.end_headers()
+            self.wfile.write(content)
+
+        def log_message(self, *_args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}", files, range_headers
+    server.shutdown()
+    server.server_close()
+
+
+def test_download_file_local_server(
+    tmp_path: Path,
+    file_server: tuple[str, dict[str, bytes], list[str | None]],
+    capsys: pytest.CaptureFixture,
+) -> None:
+    """Test streaming download, MD5 check and resuming from a partial file."""
+    base_url, files, range_headers = file_server
+    content = os.urandom(100_000)
+    md5 = hashlib.md5(content).hexdigest()  # noqa: S324
+    files["/ranged/data.bin"] = files["/plain/data.bin"] = content
+    dest_path = f"{tmp_path}/sub/data.bin"
+
+    # fresh download with small chunks, verified against MD5
+    download_file(dest_path, f"{base_url}/ranged/data.bin", md5=md5, chunk_size=4096)
+    assert Path(dest_path).read_bytes() == content
+    assert not os.path.isfile(f"{dest_path}.part")
+    assert range_headers == [None]
+
+    # resume from a partial download with a Range request
+    os.remove(dest_path)
+    Path(f"{dest_path}.part").write_bytes(content[:30_000])
+    download_file(dest_path, f"{base_url}/ranged/data.bin", md5=md5)
+    assert Path(dest_path).read_bytes() == content
+    assert range_headers[-1] == "bytes=30000-"
+
+    # part file already complete, server responds 416 Range Not Satisfiable
+    os.remove(dest_path)
+    Path(f"{dest_path}.part").write_bytes(content)
+    download_file(dest_path, f"{base_url}/ranged/data.bin", md5=md5)
+    assert Path(dest_path).read_bytes() == content
+    assert range_headers[-1] == "bytes=100000-"
+
+    # stale part file larger than the remote file also gets a 416 but its size
+    # doesn't match Content-Range so the download restarts from byte 0 (no md5)
+    os.remove(dest_path)
+    Path(f"{dest_path}.part").write_bytes(content + b"stale extra bytes")
+    assert download_file(dest_path, f"{base_url}/ranged/data.bin") is True
+    assert Path(dest_path).read_bytes() == content
+    assert range_headers[-2:] == ["bytes=100017-", None]
+
+    # server ignoring Range header sends whole file which replaces the partial one
+    os.remove(dest_path)
+    Path(f"{dest_path}.part").write_bytes(b"stale bytes")
+    download_file(dest_path, f"{base_url}/plain/data.bin", md5=md5)
+    assert Path(dest_path).read_bytes() == content
+    assert capsys.readouterr().out == ""
+
+    # MD5 mismatch deletes the partial file and leaves no file in place
+    os.remove(dest_path)
+    download_file(dest_path, f"{base_url}/plain/data.bin", md5="0" * 32)
+    assert not os.path.isfile(dest_path)
+    assert not os.path.isfile(f"{dest_path}.part")
+    stdout, _ = capsys.readouterr()
+    assert f"Error downloading url='{base_url}/plain/data.bin'" in stdout
+    assert "MD5 mismatch" in stdout
+
+    # missing file on server
+    download_file(dest_path, f"{base_url}/missing.bin")
+    assert not os.path.isfile(dest_path)
+    assert "404 Client Error" in capsys.readouterr().out
+
+
+def test_get_session() -> None:
+    """Test the shared session is reused and retries transient errors."""
+    session = get_session()
+    assert session is get_session()
+    retry = session.get_adapter("https://figshare.com").max_retries
+    assert retry.total == 3
+    assert 503 in retry.status_forcelist
+
+
+def test_prefetch(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    file_server: tuple[str, dict[str, bytes], list[str | None]],
+) -> None:
+    """Test concurrent prefetching of data files and model prediction files."""
+    import matbench_discovery
+
+    base_url, files, range_headers = file_server
+    data_files = (
+        DataFiles.wbm_summary,
+        DataFiles.mp_energies,
+        DataFiles.mp_trj_json_gz,
+    )
+    for data_file in data_files:
+        files[f"/{data_file.name}"] = f"{data_file.name} content".encode()
+    files["/preds"] = b"model preds"
+    wbm_md5 = hashlib.md5(b"wbm_summary content").hexdigest()  # noqa: S324
+    # wrong hash for mp_energies should fail, mp_trj_json_gz has no hash
+    md5s = {DataFiles.wbm_summary.name: wbm_md5, DataFiles.mp_energies.name: "0" * 32}
+    monkeypatch.setattr(
+        DataFiles, "url", property(lambda self: f"{base_url}/{self.name}")
+    )
+    monkeypatch.setattr(DataFiles, "md5", property(lambda self: md5s.get(self.name)))
+    monkeypatch.setattr(matbench_discovery, "ROOT", str(tmp_path))
+    metrics = {
+        "discovery": {"pred_file": "preds.csv", "pred_file_url": f"{base_url}/preds"}
+    }
+    monkeypatch.setattr(Model, "metrics", property(lambda _self: metrics))
+
+    cache_dir = f"{tmp_path}/cache"
+    statuses = prefetch(
+        [*data_files, Model.mace_mp_0, Model.chgnet_030],
+        workers=3,
+        cache_dir=cache_dir,
+        pbar_kwargs={"disable": True},
+    )
+    wbm_path = f"{cache_dir}/{DataFiles.wbm_summary.rel_path}"
+    assert statuses == {
+        wbm_path: "downloaded",
+        f"{cache_dir}/{DataFiles.mp_energies.rel_path}": "failed",
+        f"{cache_dir}/{DataFiles.mp_trj_json_gz.rel_path}": "downloaded",
+        f"{tmp_path}/preds.csv": "downloaded",  # shared by both models, fetched once
+    }
+    assert Path(f"{tmp_path}/preds.csv").read_bytes() == b"model preds"
+    assert len(range_headers) == 4
+
+    # files with matching checksum (or no recorded checksum) are skipped, corrupted
+    # ones re-downloaded
+    Path(f"{cache_dir}/{DataFiles.mp_trj_json_gz.rel_path}").write_bytes(b"x")
+    statuses = prefetch(
+        [DataFiles.wbm_summary, DataFiles.mp_trj_json_gz],
+        cache_dir=cache_dir,
+        pbar_kwargs={"disable": True},
+    )
+    assert set(statuses.values()) == {"cached"}
+    Path(wbm_path).write_bytes(b"corrupted")
+    statuses = prefetch(
+        [DataFiles.wbm_summary], cache_dir=cache_dir, pbar_kwargs={"disable": True}
+    )
+    assert statuses == {wbm_path: "downloaded"}
+    assert Path(wbm_path).read_bytes() == b"wbm_summary content"
+    assert len(range_headers) == 5
+
+    # corrupted file whose re-download fails the MD5 check is reported as failed
+    # although the stale file is still on disk
+    mp_energies_path = f"{cache_dir}/{DataFiles.mp_energies.rel_path}"
+    Path(mp_energies_path).write_bytes(b"corrupted")
+    statuses = prefetch(
+        [DataFiles.mp_energies], cache_dir=cache_dir, pbar_kwargs={"disable": True}
+    )
+    assert statuses == {mp_energies_path: "failed"}
+    assert len(range_headers) == 6
+
+    with pytest.raises(TypeError, match="Expected DataFiles or Model, got str"):
+        prefetch(["wbm_summary"])  # type: ignore[list-item]
@@ -1,5 +1,10 @@
 """Unit tests for Figshare API helper functions."""
 
+import hashlib
+import json
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
@@ -24,7 +29,7 @@ def test_make_request(content: bytes, expected: Any, binary: bool) -> None:
     """Test make_request with various response types."""
     mock_response = MagicMock(content=content)
 
-    with patch("requests.request", return_value=mock_response):
+    with patch.object(requests.Session, "request", return_value=mock_response):
         assert figshare.make_request("GET", "test_url", binary=binary) == expected
 
 
@@ -46,7 +51,7 @@ def test_make_request_errors(error_content: bytes, status_code: int) -> None:
 
     err_msg = f"body={error_content.decode()}"
     with (
-        patch("requests.request", return_value=mock_response),
+        patch.object(requests.Session, "request", return_value=mock_response),
         pytest.raises(requests.HTTPError, match=err_msg),
     ):
         figshare.make_request("GET", "test_url")
@@ -61,7 +66,7 @@ def test_article_exists(status_code: int, expected: bool) -> None:
             response=MagicMock(status_code=status_code)
         )
 
-    with patch("requests.request", return_value=mock_response):
+    with patch.object(requests.Session, "request", return_value=mock_response):
         assert figshare.article_exists(12345) == expected
 
 
@@ -76,7 +81,7 @@ def test_article_exists_errors(status_code: int) -> None:
 
     err_msg = "article_url='https://api.figshare.com/v2/account/articles/12345'"
     with (
-        patch("requests.request", return_value=mock_response),
+        patch.object(requests.Session, "request", return_value=mock_response),
         pytest.raises(requests.HTTPError, match=err_msg),
     ):
         figshare.article_exists(12345)
@@ -223,7 +228,7 @@ def test_list_article_files_errors(capsys: pytest.CaptureFixture) -> None:
         response=MagicMock(status_code=404)
     )
 
-    with patch("requests.request", return_value=mock_response):
+    with patch.object(requests.Session, "request", return_value=mock_response):
         # should return empty list for 404 errors
         assert figshare.list_article_files(12345) == []
 
@@ -237,7 +242,7 @@ def test_list_article_files_errors(capsys: pytest.CaptureFixture) -> None:
         )
 
         with (
-            patch("requests.request", return_value=mock_response),
+            patch.object(requests.Session, "request", return_value=mock_response),
             pytest.raises(requests.HTTPError, match="\nbody="),
         ):
             figshare.list_article_files(12345)
@@ -285,7 +290,7 @@ def test_get_existing_files_404() -> None:
         response=MagicMock(status_code=404)
     )
 
-    with patch("requests.request", return_value=mock_response):
+    with patch.object(requests.Session, "request", return_value=mock_response):
         assert figshare.get_existing_files(12345) == {}
 
 
@@ -528,3 +533,163 @@ def test_find_similar_files(
             key=lambda x: x[0],
         )
         assert result == sorted(expected_similar, key=lambda x: x[0])
+
+
+def test_upload_file_mock_server(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test parallel part uploads against a local mock Figshare server, including
+    retrying a failed part and reusing keep-alive connections.
+    """
+    content = os.urandom(4500)
+    test_file = tmp_path / "upload_test_file"
+    test_file.write_bytes(content)
+    part_size = 1000
+    parts = [
+        {"partNo": idx + 1, "startOffset": start, "endOffset": start + part_size - 1}
+        for idx, start in enumerate(range(0, len(content), part_size))
+    ]
+    parts[-1]["endOffset"] = len(content) - 1
+    requests_log: list[tuple[str, str]] = []
+    client_ports: set[int] = set()
+    received: dict[str, Any] = {"init": [], "parts": {}}
+
+    class FigshareHandler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive
+
+        def respond(self, status: int, body: Any = None) -> None:
+            payload = json.dumps(body).encode() if body is not None else b""
+            self.send_response(status)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def handle_request(self) -> None:
+            requests_log.append((self.command, self.path))
+            client_ports.add(self.client_address[1])
+            body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+            base_url = f"http://127.0.0.1:{self.server.server_port}"
+            match self.command, self.path:
+                case "POST", "/account/articles/123/files":
+                    received["init"].append(json.loads(body))
+                    location = f"{base_url}/account/articles/123/files/42"
+                    self.respond(201, {"location": location})
+                case "GET", "/account/articles/123/files/42":
+                    self.respond(200, {"id": 42, "upload_url": f"{base_url}/upload"})
+                case "GET", "/upload":
+                    self.respond(200, {"parts": parts})
+                case "PUT", path if path.startswith("/upload/"):
+                    part_no = int(path.split("/")[-1])
+                    # fail first attempt at uploading part 3
+                    if part_no == 3 and requests_log.count(("PUT", path)) == 1:
+                        self.respond(503)
+                        return
+                    received["parts"][part_no] = body
+                    self.respond(200)
+                case "POST", "/account/articles/123/files/42":
+                    received["completed"] = True
+                    self.respond(202)
+                case _:
+                    self.respond(404)
+
+        def do_GET(self) -> None:
+            self.handle_request()
+
+        def do_POST(self) -> None:
+            self.handle_request()
+
+        def do_PUT(self) -> None:
+            self.handle_request()
+
+        def log_message(self, *_args: object) -> None:
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), FigshareHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    monkeypatch.setattr(figshare, "BASE_URL", f"http://127.0.0.1:{server.server_port}")
+    md5 = hashlib.md5(content).hexdigest()  # noqa: S324
+    try:
+        file_id = figshare.upload_file(
+            123, str(test_file), file_name="data/file.bin", md5=md5, workers=3
+        )
+        with pytest.raises(ValueError, match="changed during upload"):
+            figshare.upload_file(123, str(test_file), md5="0" * 32)
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert file_id == 42
+    assert received["init"][0] == {"name": "data/file.bin", "size": 4500, "md5": md5}
+    assert b"".join(received["parts"][idx] for idx in range(1, 6)) == content
+    assert received["completed"]
+    assert requests_log.count(("PUT", "/upload/3")) == 3  # 1 retry + 2nd upload
+    # parts are uploaded over a few pooled keep-alive connections
+    assert len(client_ports) < len(requests_log) / 2
+
+
+def test_file_manifest(tmp_path: Path) -> None:
+    """Test FileManifest only re-hashes changed files and persists file IDs."""
+    manifest_path = f"{tmp_path}/cache/manifest.json"
+    file_a, file_b = tmp_path / "a.txt", tmp_path / "b.txt"
+    file_a.write_text("foo")
+    file_b.write_text("bar")
+    paths = [str(file_a), str(file_b)]
+
+    manifest = figshare.FileManifest(manifest_path)
+    assert manifest.changed_files(paths) == paths
+    assert manifest.refresh(paths) == paths
+    assert manifest.get_md5(str(file_a)) == hashlib.md5(b"foo").hexdigest()  # noqa: S324
+    assert manifest.get_file_id(1, str(file_a)) is None
+    manifest.set_file_id(1, str(file_a), 42)
+    manifest.save()
+
+    manifest = figshare.FileManifest(manifest_path)
+    with patch.object(figshare, "get_file_hash_and_size") as mock_hash:
+        assert manifest.refresh(paths) == []
+        assert manifest.get_file_id(1, str(file_a)) == 42
+        assert manifest.get_file_id(2, str(file_a)) is None
+        mock_hash.assert_not_called()
+
+    # modified file is re-hashed and its stale file ID dropped
+    file_a.write_text("foo and more")
+    assert manifest.changed_files(paths) == [str(file_a)]
+    assert manifest.get_file_id(1, str(file_a)) is None
+    assert manifest.refresh(paths) == [str(file_a)]
+    assert manifest.get_md5(str(file_a)) == hashlib.md5(b"foo and more").hexdigest()  # noqa: S324
+    assert manifest.get_file_id(1, str(file_a)) is None
+
+
+def test_upload_file_if_needed_manifest(tmp_path: Path) -> None:
+    """Test upload_file_if_needed skips hashing and API calls for unchanged files
+    recorded in the manifest.
+    """
+    test_file = tmp_path / "test_file.txt"
+    test_file.write_text("test content")
+    manifest = figshare.FileManifest(f"{tmp_path}/manifest.json")
+    mock_upload = MagicMock(return_value=12345)
+
+    with patch.multiple(
+        "matbench_discovery.remote.figshare",
+        file_exists_with_same_hash=MagicMock(return_value=(False, None)),
+        upload_file=mock_upload,
+    ):
+        assert figshare.upload_file_if_needed(
+            54321, str(test_file), manifest=manifest
+        ) == (12345, True)
+        md5 = hashlib.md5(b"test content").hexdigest()  # noqa: S324
+        assert mock_upload.call_args.kwargs["md5"] == md5
+        assert manifest.get_file_id(54321, str(test_file)) == 12345
+
+    mock_hash, mock_exists = MagicMock(), MagicMock()
+    with patch.multiple(
+        "matbench_discovery.remote.figshare",
+        get_file_hash_and_size=mock_hash,
+        file_exists_with_same_hash=mock_exists,
+        upload_file=mock_upload,
+    ):
+        assert figshare.upload_file_if_needed(
+            54321, str(test_file), manifest=manifest
+        ) == (12345, False)
+    mock_hash.assert_not_called()
+    mock_exists.assert_not_called()
+    assert mock_upload.call_count == 1
@@ -32,6 +32,8 @@ from matbench_discovery.enums import Model, TestSubset
             ["--energy-type", "e_form", "--show-non-compliant"],
             {"energy_type": Key.e_form, "show_non_compliant": True},
         ),
+        ([], {"batch_writes": False}),
+        (["--batch-writes"], {"batch_writes": True}),
     ],
 )
 def test_cli_parser(
@@ -17,6 +17,7 @@ from matbench_discovery.data import (
     as_dict_handler,
     ase_atoms_from_zip,
     ase_atoms_to_zip,
+    batch_yaml_updates,
     df_wbm,
     glob_to_df,
     load_df_wbm_with_preds,
@@ -386,3 +387,77 @@ metrics:
     for path in ("metrics..discovery", "metrics..", "metrics.discovery..", "."):
         with pytest.raises(ValueError, match="Invalid dotted_path="):
             update_yaml_file(test_file, path, {"data": 1})
+
+
+def test_batch_yaml_updates(tmp_path: Path) -> None:
+    """Test batched YAML updates load and write each file once, atomically."""
+    file_a, file_b = f"{tmp_path}/a.yml", f"{tmp_path}/b.yml"
+    for path in (file_a, file_b):
+        with open(path, mode="w") as file:
+            file.write("metrics:  # all metrics\n  discovery:\n    mae: 0.1\n")
+
+    with (
+        patch.object(round_trip_yaml, "load", wraps=round_trip_yaml.load) as load,
+        patch.object(round_trip_yaml, "dump", wraps=round_trip_yaml.dump) as dump,
+    ):
+        with batch_yaml_updates() as batch:
+            for subset in ("full_test_set", "uniq_protos", "most_stable_10k"):
+                update_yaml_file(file_a, f"metrics.discovery.{subset}", {"f1": 0.5})
+            with batch_yaml_updates() as inner_batch:  # nested contexts join batch
+                assert inner_batch is batch
+                update_yaml_file(file_b, "metrics.phonons", {"κ_SRME": 0.3})
+            assert dump.call_count == 0  # nothing written before batch exits
+
+        assert load.call_count == 2
+        assert dump.call_count == 2
+
+    with open(file_a) as file:
+        content = file.read()
+    assert content.startswith("metrics:  # all metrics\n  discovery:\n    mae: 0.1\n")
+    data_a = round_trip_yaml.load(content)
+    assert set(data_a["metrics"]["discovery"]) == {
+        "mae",
+        "full_test_set",
+        "uniq_protos",
+        "most_stable_10k",
+    }
+    with open(file_b) as file:
+        assert round_trip_yaml.load(file)["metrics"]["phonons"] == {"κ_SRME": 0.3}
+    assert sorted(os.listdir(tmp_path)) == ["a.yml", "b.yml"]  # no temp files left
+
+    # exceptions inside the batch discard all queued updates
+    with (  # noqa: PT012
+        pytest.raises(ValueError, match="Invalid dotted_path="),
+        batch_yaml_updates(),
+    ):
+        update_yaml_file(file_a, "metrics.geo_opt", {"rmsd": 0.01})
+        update_yaml_file(file_b, "metrics..bad", {"rmsd": 0.01})
+    with open(file_a) as file:
+        assert file.read() == content
+
+
+def test_batch_yaml_updates_nested_rollback(tmp_path: Path) -> None:
+    """Test a nested batch context that raises discards only its own updates."""
+    file_a, file_b = f"{tmp_path}/a.yml", f"{tmp_path}/b.yml"
+    for path in (file_a, file_b):
+        with open(path, mode="w") as file:
+            file.write("metrics:\n  discovery:\n    mae: 0.1\n")
+
+    with batch_yaml_updates():
+        update_yaml_file(file_a, "metrics.discovery", {"f1": 0.5})
+        for model_file in (file_a, file_b):  # like one nested batch per model
+            try:
+                with batch_yaml_updates():
+                    update_yaml_file(model_file, "metrics.phonons", {"κ_SRME": 0.3})
+                    update_yaml_file(model_file, "metrics.discovery", {"r2": 0.9})
+                    if model_file == file_b:
+                        raise RuntimeError("model failed between updates")
+            except RuntimeError:
+                continue
+
+    with open(file_a) as file:
+        data_a = round_trip_yaml.load(file)
+    assert data_a["metrics"]["discovery"] == {"mae": 0.1, "f1": 0.5, "r2": 0.9}
+    assert data_a["metrics"]["phonons"] == {"κ_SRME": 0.3}
+    with open(file_b) as file:  # partial updates of failed nested batch not written
+        assert file.read() == "metrics:\n  discovery:\n    mae: 0.1\n"
@@ -1,14 +1,24 @@
 """Tests for diatomic molecule generation and energy/force calculations."""
 
+import json
+from pathlib import Path
+
 import numpy as np
 import pytest
 from ase import Atoms
+from ase.calculators.calculator import all_changes
 from ase.calculators.emt import EMT
 
 from matbench_discovery.diatomics import (
     atom_num_symbol_map,
     calc_diatomic_curve,
+    calc_diatomic_curves_batch,
+    calc_diatomic_curves_parallel,
+    calc_pair_curve,
     generate_diatomics,
+    get_pair_formula,
+    is_curve_complete,
+    read_diatomic_curves_jsonl,
 )
 
 
@@ -153,3 +163,125 @@ def test_calc_diatomic_curve_prior_results() -> None:
     assert isinstance(results["Cu-Cu"]["forces"][0], list)
     assert len(results["Cu-Cu"]["forces"][0]) == 2  # two atoms
     assert len(results["Cu-Cu"]["forces"][0][0]) == 3  # three components
+
+
+def test_calc_diatomic_curves_batch() -> None:
+    """Test batched diatomic curves match calc_diatomic_curve and reuse out arrays."""
+    calculator = EMT()
+    distances = np.linspace(1.5, 5, 6)
+    pairs = [("Cu", "Cu"), (29, 8), ("Xx", "Cu")]  # last pair fails in EMT
+
+    formulas, energies, forces = calc_diatomic_curves_batch(
+        pairs, calculator, distances, pbar_kwargs={"disable": True}
+    )
+    assert formulas == ["Cu-Cu", "Cu-O", "Xx-Cu"]
+    assert energies.shape == (3, len(distances))
+    assert forces.shape == (3, len(distances), 2, 3)
+    assert np.isnan(energies[2]).all()
+    assert np.isnan(forces[2]).all()
+
+    results = calc_diatomic_curve(pairs[:2], calculator, "test", distances, {})
+    for pair_idx, formula in enumerate(formulas[:2]):
+        np.testing.assert_allclose(energies[pair_idx], results[formula]["energies"])
+        np.testing.assert_allclose(forces[pair_idx], results[formula]["forces"])
+
+    # results are written into preallocated arrays
+    out_energies, out_forces = np.zeros((1, 6)), np.zeros((1, 6, 2, 3))
+    _, ret_energies, ret_forces = calc_diatomic_curves_batch(
+        pairs[:1], calculator, distances, energies=out_energies, forces=out_forces
+    )
+    assert ret_energies is out_energies
+    assert ret_forces is out_forces
+    np.testing.assert_allclose(out_energies[0], energies[0])
+
+    with pytest.raises(ValueError, match="energies.shape=.* must be"):
+        calc_diatomic_curves_batch(pairs, calculator, distances, energies=out_energies)
+
+
+class CountingEMT(EMT):
+    """EMT calculator that records how often and for what calculate() is called."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.requested: list[tuple[str, ...]] = []
+
+    def calculate(
+        self,
+        atoms: Atoms | None = None,
+        properties: tuple[str, ...] = ("energy",),
+        system_changes: list[str] = all_changes,
+    ) -> None:
+        self.requested += [tuple(properties)]
+        super().calculate(atoms, properties, system_changes)
+
+
+def test_calc_pair_curve_one_calculation_per_geometry() -> None:
+    """Test each distance costs exactly one calculator call for energy and forces."""
+    calculator = CountingEMT()
+    distances = np.linspace(1.5, 5, 7)
+    energies, forces = np.empty(len(distances)), np.empty((len(distances), 2, 3))
+
+    calc_pair_curve("Cu-O", calculator, distances, energies, forces)
+
+    assert len(calculator.requested) == len(distances)
+    assert all({"energy", "forces"} <= set(props) for props in calculator.requested)
+    for dist_idx, dist in enumerate(distances):  # same results as separate calls
+        atoms = Atoms("CuO", positions=[[0, 0, 0], [dist, 0, 0]])
+        atoms.calc = EMT()
+        assert energies[dist_idx] == pytest.approx(atoms.get_potential_energy())
+        np.testing.assert_allclose(forces[dist_idx], atoms.get_forces(), atol=1e-12)
+
+    calculator.requested.clear()
+    calc_diatomic_curves_batch(
+        [("Cu", "Cu"), ("Cu", "O")],
+        calculator,
+        distances,
+        pbar_kwargs={"disable": True},
+    )
+    assert len(calculator.requested) == 2 * len(distances)
+
+
+def test_get_pair_formula() -> None:
+    """Test pair formula from symbols and atomic numbers."""
+    assert get_pair_formula(1, "O") == "H-O"
+    assert get_pair_formula("Cu", 29) == "Cu-Cu"
+
+
+def test_is_curve_complete() -> None:
+    """Test curve completeness check used to skip finished pairs."""
+    assert is_curve_complete({"energies": [1, 2], "forces": [[], []]}, 2)
+    assert not is_curve_complete({"energies": [1, 2], "forces": [[]]}, 2)
+    assert not is_curve_complete({}, 2)
+
+
+def test_calc_diatomic_curves_parallel(tmp_path: Path) -> None:
+    """Test process-pool driver streams results and resumes from out file."""
+    distances = [1.5, 2.5, 4.0]
+    out_path = f"{tmp_path}/diatomics.jsonl"
+    # pre-existing complete Cu-Cu record, stale Cu-O record with too few distances
+    # and a truncated last line as left behind by a killed run
+    with open(out_path, mode="w") as file:
+        cu_cu = {"formula": "Cu-Cu", "energies": [1, 2, 3], "forces": [[0]] * 3}
+        cu_o = {"formula": "Cu-O", "energies": [1], "forces": [[0]]}
+        file.write(f"{json.dumps(cu_cu)}\n{json.dumps(cu_o)}\n" + '{"formula": "Ni')
+
+    pairs = [("Cu", "Cu"), (29, 8), ("Ni", "Ni"), ("Xx", "Cu")]
+    results = calc_diatomic_curves_parallel(
+        pairs, EMT, distances, out_path, n_workers=2, pbar_kwargs={"disable": True}
+    )
+
+    # Cu-Cu was skipped, Xx-Cu failed and is not recorded
+    assert results["Cu-Cu"] == {"energies": [1, 2, 3], "forces": [[0]] * 3}
+    assert set(results) == {"Cu-Cu", "Cu-O", "Ni-Ni"}
+    expected = calc_diatomic_curve([("Ni", "Ni")], EMT(), "test", distances, {})
+    np.testing.assert_allclose(
+        results["Ni-Ni"]["energies"], expected["Ni-Ni"]["energies"]
+    )
+    assert results == read_diatomic_curves_jsonl(out_path)
+
+    # rerun only appends nothing since all computable pairs are done
+    n_lines = len(Path(out_path).read_text().splitlines())
+    calc_diatomic_curves_parallel(pairs[:3], EMT, distances, out_path, n_workers=1)
+    assert len(Path(out_path).read_text().splitlines()) == n_lines
+
+    assert read_diatomic_curves_jsonl(f"{tmp_path}/missing.jsonl") == {}
@@ -232,6 +232,16 @@ def test_files_enum_auto_download(
         status_code = 200
         content = b"test content"
 
+        def __enter__(self) -> "MockResponse":
+            return self
+
+        def __exit__(self, *_args: object) -> None:
+            pass
+
+        def iter_content(self, chunk_size: int) -> list[bytes]:  # noqa: ARG002
+            """Mock streaming the response body."""
+            return [self.content]
+
         def raise_for_status(self) -> None:
             """Mock the raise_for_status method."""
             if self.status_code >= 400:
@@ -247,7 +257,9 @@ def test_files_enum_auto_download(
             """Mock readline method."""
             return "y\n"  # Default to yes for testing
 
-    monkeypatch.setattr(requests, "get", lambda *_args, **_kwargs: MockResponse())
+    monkeypatch.setattr(
+        requests.Session, "get", lambda *_args, **_kwargs: MockResponse()
+    )
     monkeypatch.setattr(sys, "stdin", MockStdin())
 
     # Test 1: Auto-download enabled (default)
@@ -258,7 +270,7 @@ def test_files_enum_auto_download(
     assert os.path.isfile(abs_path)
 
     # Test 2: File already exists (no download attempt)
-    with patch("requests.get") as mock_get:
+    with patch.object(requests.Session, "get") as mock_get:
         maybe_auto_download_file(test_file.url, abs_path, label=test_file.label)
         mock_get.assert_not_called()
 
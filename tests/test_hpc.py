@@ -1,7 +1,16 @@
 """Tests for high-performance computing utilities."""
 
+import bz2
+import gzip
+import lzma
 import os
+import shlex
+import sys
+import time
 from collections.abc import Callable, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any
 from unittest.mock import mock_open, patch
 
 import numpy as np
@@ -350,3 +359,327 @@ def test_get_calling_file_path() -> None:
         return hpc._get_calling_file_path(frame)  # noqa: SLF001
 
     assert wrapper(frame=2) == __file__
+
+
+@pytest.mark.parametrize(
+    "array, expected",
+    [
+        ("7", ([7], None)),
+        ("0-3", ([0, 1, 2, 3], None)),
+        ("0-15:4", ([0, 4, 8, 12], None)),
+        ("1,3,5-7%2", ([1, 3, 5, 6, 7], 2)),
+        (" 0-2 , 2 ", ([0, 1, 2], None)),
+    ],
+)
+def test_parse_array_spec(array: str, expected: tuple[list[int], int | None]) -> None:
+    """Test parsing Slurm --array specs."""
+    assert hpc.parse_array_spec(array) == expected
+
+
+@pytest.mark.parametrize("array", ["", "a-b", "3-1", "0-3%0", "-1", "0-3%x"])
+def test_parse_array_spec_invalid(array: str) -> None:
+    """Test invalid Slurm --array specs raise ValueError."""
+    with pytest.raises(ValueError, match="Invalid Slurm array spec"):
+        hpc.parse_array_spec(array)
+
+
+def test_run_local_array(tmp_path: Path) -> None:
+    """Test local job array sets SLURM_ARRAY_* env vars, logs and reruns failures."""
+    marker = tmp_path / "fixed"
+    # task 2 fails until marker file exists
+    script = (
+        "import os, sys; task_id = int(os.environ['SLURM_ARRAY_TASK_ID']); "
+        "print(task_id, os.environ['SLURM_ARRAY_TASK_COUNT'], "
+        "os.environ['SLURM_ARRAY_JOB_ID'], os.environ['FOO']); "
+        f"sys.exit(task_id == 2 and not os.path.exists({str(marker)!r}))"
+    )
+    cmd = [sys.executable, "-c", script]
+    out_dir = str(tmp_path / "logs")
+
+    return_codes = hpc.run_local_array(
+        cmd, array="0-3%2", out_dir=out_dir, job_id="42", env={"FOO": "bar"}
+    )
+    assert return_codes == {0: 0, 1: 0, 2: 1, 3: 0}
+    for task_id in range(4):
+        log = Path(f"{out_dir}/slurm-42-{task_id}.log").read_text()
+        assert log.strip() == f"{task_id} 4 42 bar"
+
+    # rerunning the same job only reruns the failed task
+    os.remove(f"{out_dir}/slurm-42-0.log")
+    marker.touch()
+    return_codes = hpc.run_local_array(
+        cmd, array="0-3", out_dir=out_dir, job_id="42", env={"FOO": "baz"}
+    )
+    assert return_codes == {0: 0, 1: 0, 2: 0, 3: 0}
+    assert not os.path.isfile(f"{out_dir}/slurm-42-0.log")
+    assert Path(f"{out_dir}/slurm-42-2.log").read_text().strip() == "2 4 42 baz"
+
+    # shell string commands and new job IDs
+    return_codes = hpc.run_local_array(
+        "echo $SLURM_ARRAY_TASK_ID", array="5", out_dir=out_dir
+    )
+    assert return_codes == {5: 0}
+
+
+@pytest.mark.parametrize(
+    ("argv", "return_codes", "job_id", "exit_code", "cmd_suffix"),
+    [
+        ([f"{hpc.LOCAL_SUBMIT_KEY}=7"], {0: 0, 1: 3}, "7", 3, " script.py"),
+        # args other than local-submit are passed on, not taken as job ID
+        ([hpc.LOCAL_SUBMIT_KEY, "--debug"], {0: 0}, None, 0, " script.py --debug"),
+        # tasks killed by a signal have negative return codes
+        (
+            ["--n 2", hpc.LOCAL_SUBMIT_KEY],
+            {0: -9, 1: 0},
+            None,
+            -9,
+            " script.py '--n 2'",
+        ),
+    ],
+)
+def test_slurm_submit_local(
+    tmp_path: Path,
+    argv: list[str],
+    return_codes: dict[int, int],
+    job_id: str | None,
+    exit_code: int,
+    cmd_suffix: str,
+) -> None:
+    """Test slurm_submit runs tasks locally when called with local-submit."""
+    with (
+        pytest.raises(SystemExit) as exc_info,
+        patch("sys.argv", ["script.py", *argv]),
+        patch.object(hpc, "run_local_array", return_value=return_codes) as mock_run,
+    ):
+        hpc.slurm_submit(
+            "test_job", str(tmp_path), array="0-1", py_file_path="script.py"
+        )
+    assert exc_info.value.code == exit_code
+    cmd = mock_run.call_args.args[0]
+    assert cmd.endswith(cmd_suffix)
+    assert mock_run.call_args.kwargs == dict(
+        array="0-1", out_dir=str(tmp_path), job_id=job_id, job_name="test_job"
+    )
+
+
+def test_slurm_submit_local_quotes_script_path(tmp_path: Path) -> None:
+    """Test script paths with spaces or shell metacharacters stay one argument."""
+    py_file_path = f"{tmp_path}/my scripts/relax; rm -rf.py"
+    with (
+        pytest.raises(SystemExit),
+        patch("sys.argv", ["script.py", hpc.LOCAL_SUBMIT_KEY, "--n=2"]),
+        patch.object(hpc, "run_local_array", return_value={0: 0}) as mock_run,
+    ):
+        hpc.slurm_submit("test_job", str(tmp_path), py_file_path=py_file_path)
+    cmd = mock_run.call_args.args[0]
+    assert shlex.split(cmd) == [sys.executable, py_file_path, "--n=2"]
+
+
+def test_chunk_by_lens_weights() -> None:
+    """Test balancing chunks by custom per-item costs."""
+    structures = [make_ase_atoms(n_atoms) for n_atoms in (1, 2, 3, 4, 5, 6)]
+
+    # balance sums of squared atom counts: 36 + 9 + 1 vs. 25 + 16 + 4
+    chunks = hpc.chunk_by_lens(structures, n_chunks=2, weights="n_atoms_sq")
+    assert [[len(atoms) for atoms in chunk] for chunk in chunks] == [
+        [6, 3, 1],
+        [5, 4, 2],
+    ]
+    same_chunks = hpc.chunk_by_lens(
+        structures, n_chunks=2, weights=lambda atoms: len(atoms) ** 2
+    )
+    assert same_chunks == chunks
+
+    # precomputed costs, e.g. n_atoms times number of optimizer steps
+    costs = [100, 1, 1, 1, 1, 1]
+    chunks = hpc.chunk_by_lens(structures, n_chunks=2, weights=costs)
+    assert [[len(atoms) for atoms in chunk] for chunk in chunks] == [
+        [1],
+        [6, 5, 4, 3, 2],
+    ]
+    # chunk_size is in units of cost
+    assert len(hpc.chunk_by_lens(structures, chunk_size=10, weights=costs)) == 11
+
+    # n_atoms matches default len() behavior
+    assert hpc.chunk_by_lens(
+        structures, n_chunks=3, weights="n_atoms"
+    ) == hpc.chunk_by_lens(structures, n_chunks=3)
+
+    with pytest.raises(ValueError, match=r"len\(lens\)=2 must match len\(inputs\)=6"):
+        hpc.chunk_by_lens(structures, n_chunks=2, weights=[1, 2])
+    with pytest.raises(ValueError, match="Unknown weights='foo'"):
+        hpc.chunk_by_lens(structures, n_chunks=2, weights="foo")
+
+
+def test_chunk_by_lens_heap_matches_argmin() -> None:
+    """Test heap-based greedy assignment matches the argmin loop incl. ties."""
+    rng = np.random.default_rng(seed=0)
+    costs = rng.integers(1, 50, size=500).tolist()
+    inputs = [[0] * cost for cost in costs]  # anything with len()
+
+    chunks = hpc.chunk_by_lens(inputs, n_chunks=37, report=False)
+
+    sort_idx = np.argsort(costs)[::-1]
+    expected: list[list[list[int]]] = [[] for _ in range(37)]
+    totals = np.zeros(37)
+    for idx in sort_idx:
+        smallest = np.argmin(totals)
+        expected[smallest].append(inputs[idx])
+        totals[smallest] += costs[idx]
+    assert chunks == expected
+
+
+@pytest.mark.parametrize("make_obj", [make_ase_atoms, make_pmg_structure])
+def test_n_neighbors_cost(make_obj: Callable[[int], Atoms | Structure]) -> None:
+    """Test neighbor-count cost model for ASE Atoms and pymatgen Structures."""
+    cost_func = hpc.n_neighbors_cost(cutoff=4)
+    small, large = make_obj(1), make_obj(3)
+    assert cost_func(large) > cost_func(small) > 0
+    assert hpc.n_neighbors_cost(cutoff=6)(small) > cost_func(small)
+
+
+def _drain_queue(db_path: str, worker_id: int) -> list[str]:
+    """Claim and complete batches until queue is empty (runs in subprocess)."""
+    queue = hpc.WorkQueue(db_path)
+    processed = []
+    for item_ids in queue.iter_batches(worker_id, batch_size=3):
+        processed += item_ids
+        queue.complete(item_ids)
+    return processed
+
+
+def test_work_queue(tmp_path: Path) -> None:
+    """Test claiming, completing, releasing and lease expiry in WorkQueue."""
+    queue = hpc.WorkQueue(f"{tmp_path}/sub/queue.db", lease_seconds=0.2)
+    assert queue.add([f"wbm-{idx}" for idx in range(10)]) == 10
+    assert queue.add(["wbm-0", "wbm-10"]) == 1  # duplicates are ignored
+    assert queue.counts() == {"pending": 11, "claimed": 0, "done": 0}
+
+    batch_a = queue.claim("worker-a", batch_size=4)
+    batch_b = queue.claim("worker-b", batch_size=4)
+    assert batch_a == [f"wbm-{idx}" for idx in range(4)]
+    assert batch_b == [f"wbm-{idx}" for idx in range(4, 8)]
+    queue.complete(batch_a)
+    queue.release(batch_b[:1])
+    assert queue.counts() == {"pending": 4, "claimed": 3, "done": 4}
+
+    # worker-b "crashes": after its lease expires, its items get reclaimed
+    assert queue.claim("worker-c", batch_size=10) == [
+        "wbm-4",
+        *(f"wbm-{idx}" for idx in range(8, 11)),
+    ]
+    time.sleep(0.3)
+    reclaimed = queue.claim("worker-c", batch_size=10)
+    assert sorted(reclaimed) == sorted(
+        [*batch_b[1:], "wbm-4", "wbm-8", "wbm-9", "wbm-10"]
+    )
+    queue.complete(reclaimed)
+    assert queue.counts() == {"pending": 0, "claimed": 0, "done": 11}
+    assert queue.claim("worker-c") == []
+
+
+def test_work_queue_max_attempts(tmp_path: Path) -> None:
+    """Test items that keep failing are no longer handed out."""
+    queue = hpc.WorkQueue(f"{tmp_path}/queue.db", lease_seconds=0, max_attempts=2)
+    queue.add(["bad"])
+    assert queue.claim("worker") == ["bad"]
+    time.sleep(0.01)
+    assert queue.claim("worker") == ["bad"]
+    time.sleep(0.01)
+    assert queue.claim("worker") == []
+
+
+def test_work_queue_concurrent_workers(tmp_path: Path) -> None:
+    """Test concurrent worker processes drain the queue without duplicate claims."""
+    db_path = f"{tmp_path}/queue.db"
+    item_ids = [f"wbm-{idx}" for idx in range(200)]
+    hpc.WorkQueue(db_path).add(item_ids)
+
+    with ProcessPoolExecutor(max_workers=4) as executor:
+        per_worker = list(
+            executor.map(_drain_queue, [db_path] * 4, range(4), chunksize=1)
+        )
+
+    processed = [item_id for items in per_worker for item_id in items]
+    assert sorted(processed) == sorted(item_ids)  # each item exactly once
+    assert hpc.WorkQueue(db_path).counts()["done"] == 200
+
+
+@pytest.mark.parametrize(
+    "task_ids, max_concurrent, expected",
+    [
+        ([7], None, "7"),
+        ([3, 1, 2, 7, 9, 10, 2], None, "1-3,7,9-10"),
+        (range(5), 2, "0-4%2"),
+    ],
+)
+def test_format_array_spec(
+    task_ids: Sequence[int], max_concurrent: int | None, expected: str
+) -> None:
+    """Test formatting task IDs as compact Slurm --array spec."""
+    spec = hpc.format_array_spec(task_ids, max_concurrent)
+    assert spec == expected
+    assert hpc.parse_array_spec(spec) == (sorted(set(task_ids)), max_concurrent)
+
+
+def test_format_array_spec_empty() -> None:
+    """Test formatting empty task IDs raises."""
+    with pytest.raises(ValueError, match="Need at least one task ID"):
+        hpc.format_array_spec([])
+
+
+def test_find_missing_shards(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    """Test detecting missing, empty and truncated gzip shards."""
+    payload = b'{"material_id": "wbm-1-1"}' * 1000
+    for task_id in (1, 2, 3, 5):
+        with gzip.open(f"{tmp_path}/1234-{task_id:>03}.json.gz", mode="wb") as file:
+            file.write(payload)
+    # truncate shard 2 as if its job was killed mid-write, empty shard 3
+    shard_2 = tmp_path / "1234-002.json.gz"
+    shard_2.write_bytes(shard_2.read_bytes()[:40])
+    (tmp_path / "1234-003.json.gz").write_bytes(b"")
+    # shard 5 has an intact copy from a later job
+    (tmp_path / "1234-005.json.gz").write_bytes(b"not gzip")
+    with gzip.open(f"{tmp_path}/5678-005.json.gz", mode="wb") as file:
+        file.write(payload)
+
+    template = f"{tmp_path}/*-{{task_id:>03}}.json.gz"
+    assert hpc.find_missing_shards(template, "1-6") == ([4, 6], [2, 3])
+    assert hpc.is_intact_file(f"{tmp_path}/1234-001.json.gz")
+    assert not hpc.is_intact_file(f"{tmp_path}/1234-005.json.gz")
+
+    assert hpc.get_resubmit_array(template, range(1, 7), max_concurrent=2) == (
+        "2-4,6%2"
+    )
+    stdout, _ = capsys.readouterr()
+    assert "2/6 shards intact" in stdout
+    assert "2 missing: 4,6" in stdout
+    assert "2 corrupt: 2-3" in stdout
+    assert hpc.get_resubmit_array(template, [1, 5]) is None
+
+
+@pytest.mark.parametrize(
+    ("ext", "opener"), [(".gz", gzip.open), (".bz2", bz2.open), (".xz", lzma.open)]
+)
+def test_is_intact_file_compressed(
+    tmp_path: Path, ext: str, opener: Callable[..., Any]
+) -> None:
+    """Test truncated shards are detected for all compression formats scripts write,
+    e.g. .csv.bz2 in voronoi_featurize_dataset.py.
+    """
+    file_path = f"{tmp_path}/shard-001.csv{ext}"
+    with opener(file_path, mode="wb") as file:
+        file.write(b"material_id,feature\n" + b"wbm-1-1,0.123\n" * 10_000)
+    assert hpc.is_intact_file(file_path)
+
+    data = Path(file_path).read_bytes()
+    Path(file_path).write_bytes(data[: len(data) // 2])
+    assert not hpc.is_intact_file(file_path)
+
+    # uncompressed files only need to be non-empty
+    (tmp_path / "shard-002.csv").write_text("material_id\n")
+    assert hpc.is_intact_file(f"{tmp_path}/shard-002.csv")
+    (tmp_path / "shard-003.csv").write_text("")
+    assert not hpc.is_intact_file(f"{tmp_path}/shard-003.csv")
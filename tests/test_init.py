@@ -1,6 +1,13 @@
 import os
+import re
+import subprocess
+import sys
+from glob import glob
+
+import pytest
 
 from matbench_discovery import ROOT, WANDB_PATH, timestamp, today
+from matbench_discovery.enums import Model
 
 
 def test_has_globals() -> None:
@@ -8,3 +15,69 @@ def test_has_globals() -> None:
     assert today == timestamp.split("@")[0]
     assert len(timestamp) == 19
     assert WANDB_PATH.count("/") == 1
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "matbench_discovery",
+        "matbench_discovery.hpc",
+        "matbench_discovery.remote.fetch",
+        "matbench_discovery.structure",
+    ],
+)
+def test_import_without_plotting_stack(module: str) -> None:
+    """Plot settings are only applied when importing matbench_discovery.plots, so
+    non-plotting modules (e.g. used in HPC workers) must not pull in plotly etc.
+    """
+    code = (
+        f"import sys, {module}; "
+        "print(sorted({'plotly', 'pymatviz', 'wandb'} & {*sys.modules}))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]", f"{module} imports {result.stdout}"
+
+
+def test_plots_import_applies_plot_settings() -> None:
+    """Importing matbench_discovery.plots registers templates and axis labels."""
+    import plotly.express as px
+    import plotly.io as pio
+
+    import matbench_discovery.plots  # noqa: F401
+
+    assert "mbd_global" in pio.templates
+    assert pio.templates.default == "pymatviz_dark+mbd_global"
+    assert px.defaults.template == "pymatviz_dark+mbd_global"
+    model = Model.chgnet_030
+    assert px.defaults.labels[model.name] == model.label
+
+
+def test_figure_scripts_import_plots() -> None:
+    """Scripts that build plotly figures must import matbench_discovery.plots, else
+    they silently fall back to plotly's default template and raw enum labels.
+    """
+    fig_pattern = re.compile(
+        r"pmv\.save_fig\(|\bpx\.\w+\(|go\.Figure\(|pmv\.\w+_plotly\("
+        r"|backend=\"plotly\""
+    )
+    plots_import = re.compile(
+        r"^(import matbench_discovery\.plots|from matbench_discovery\.plots import"
+        r"|from matbench_discovery import plots\b)",
+        re.MULTILINE,
+    )
+    scripts = [
+        path
+        for dir_name in ("data", "models", "scripts")
+        for path in glob(f"{ROOT}/{dir_name}/**/*.py", recursive=True)
+    ]
+    assert len(scripts) > 0, f"no scripts found in {ROOT}"
+
+    missing = []
+    for path in scripts:
+        with open(path) as file:
+            code = file.read()
+        if fig_pattern.search(code) and not plots_import.search(code):
+            missing += [os.path.relpath(path, ROOT)]
+    assert missing == [], f"figure scripts not importing plots: {sorted(missing)}"
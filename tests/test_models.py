@@ -1,12 +1,18 @@
 import os
 from glob import glob
+from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import yaml
 
 from matbench_discovery import DATA_DIR, ROOT
 from matbench_discovery.enums import Model
-from matbench_discovery.models import model_is_compliant
+from matbench_discovery.models import (
+    ModelRegistry,
+    get_model_registry,
+    model_is_compliant,
+)
 
 with open(f"{DATA_DIR}/datasets.yml", encoding="utf-8") as file:
     DATASETS = yaml.safe_load(file)
@@ -165,3 +171,61 @@ def test_model_is_compliant(model: Model, is_compliant: bool) -> None:
     assert model.is_compliant is is_compliant
     # Also test the function directly for consistency
     assert model_is_compliant(model.metadata) is is_compliant
+
+
+def test_model_registry_lookups() -> None:
+    """Test ModelRegistry indexes all model YAML files by label, key and pred_col."""
+    registry = get_model_registry()
+    assert len(registry) == len(glob(f"{ROOT}/models/**/*.yml", recursive=True))
+    assert set(registry.model_index.values()) == set(Model)
+
+    model = Model.mace_mp_0
+    pred_col = registry.get_metric(model, "metrics.discovery.pred_col")
+    for query in (model, model.name, model.rel_path, model.label, model.key):
+        assert registry[query] is registry[model]
+        assert registry.model(query) == model
+        assert query in registry
+    assert registry[model] == model.metadata
+    assert registry.pred_col_index[pred_col] == [
+        model.rel_path,
+        Model.mace_mpa_0.rel_path,
+    ]
+    assert "foo-bar" not in registry
+    with pytest.raises(KeyError, match="No model metadata matching 'foo-bar'"):
+        registry["foo-bar"]
+
+    assert registry.get_metric(model, "metrics.discovery.foo", "default") == "default"
+    assert registry.get_metric(model, "model_name.foo") is None  # non-dict on path
+    pred_cols = registry.metric_values("metrics.discovery.pred_col")
+    assert pred_cols[model.rel_path] == pred_col
+    assert set(pred_cols.values()) == set(registry.pred_col_index)
+    assert sum(map(len, registry.pred_col_index.values())) == len(pred_cols)
+
+
+def test_model_registry_cache(tmp_path: Path) -> None:
+    """Test ModelRegistry pickles parsed metadata and only re-parses changed files."""
+    models_dir, cache_path = f"{tmp_path}/models", f"{tmp_path}/registry.pkl"
+    os.makedirs(f"{models_dir}/foo")
+    for name in ("foo/foo", "bar"):
+        with open(f"{models_dir}/{name}.yml", mode="w") as file:
+            yaml.dump({"model_name": name.title(), "model_key": name}, file)
+
+    registry = ModelRegistry(models_dir, cache_path=cache_path, workers=2)
+    assert sorted(registry) == ["bar.yml", "foo/foo.yml"]
+    assert registry["Foo/Foo"]["model_key"] == "foo/foo"
+    assert os.path.isfile(cache_path)
+
+    with patch("matbench_discovery.models._load_yaml") as mock_load:
+        registry = ModelRegistry(models_dir, cache_path=cache_path)
+        mock_load.assert_not_called()
+    assert registry.key_index == {"foo/foo": "foo/foo.yml", "bar": "bar.yml"}
+
+    with open(f"{models_dir}/bar.yml", mode="w") as file:
+        yaml.dump({"model_name": "Baz", "model_key": "baz"}, file)
+    os.remove(f"{models_dir}/foo/foo.yml")
+    assert registry.refresh() == ["bar.yml"]
+    assert registry.label_index == {"Baz": "bar.yml"}
+    assert registry.refresh() == []
+    assert ModelRegistry(models_dir, cache_path=cache_path).metadata == {
+        "bar.yml": {"model_name": "Baz", "model_key": "baz"}
+    }
@@ -0,0 +1,326 @@
+"""Tests for relaxing many structures with ASE calculators."""
+
+import gzip
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+from ase import Atoms
+from ase.build import bulk
+from ase.calculators.emt import EMT
+from ase.filters import UnitCellFilter
+from pymatgen.core import Lattice, Structure
+from pymatviz.enums import Key
+
+from matbench_discovery.data import glob_to_df
+from matbench_discovery.relax import (
+    GZIP_CHUNK_SIZE,
+    RelaxResultsSink,
+    TrajectoryRecorder,
+    batch_calculator_from_ase,
+    read_relax_results,
+    read_trajectory,
+    relax_atoms,
+    relax_batch_fire,
+    relax_structures,
+)
+
+no_pbar = dict(disable=True)
+
+
+def make_structs(n_structs: int = 4) -> list[Atoms]:
+    """Rattled fcc supercells of elements supported by EMT."""
+    structs = []
+    for idx in range(n_structs):
+        elem = ("Cu", "Al", "Ni")[idx % 3]
+        atoms = bulk(elem, "fcc", a=3.7 + 0.1 * idx, cubic=True).repeat((1, 1, 2))
+        atoms.rattle(0.05, seed=idx)
+        atoms.info[Key.mat_id] = f"struct-{idx}"
+        structs.append(atoms)
+    return structs
+
+
+def test_relax_atoms() -> None:
+    """Test single-structure relaxation leaves input untouched and calls callback."""
+    atoms = make_structs(1)[0]
+    orig_positions, orig_cell = atoms.positions.copy(), atoms.cell.array.copy()
+    frames: list[float] = []
+
+    result = relax_atoms(
+        atoms, EMT(), fmax=0.02, callback=lambda _atoms, energy: frames.append(energy)
+    )
+
+    assert result["converged"]
+    assert result["n_steps"] > 0
+    assert len(frames) == result["n_steps"] + 1  # initial frame + one per step
+    assert result["energy"] == pytest.approx(frames[-1])
+    assert result["energy"] < frames[0]
+    assert result["atoms"].calc is None
+    assert result["atoms"].info[Key.mat_id] == "struct-0"
+    assert not np.allclose(result["atoms"].cell, orig_cell)  # cell was relaxed
+    np.testing.assert_array_equal(atoms.positions, orig_positions)
+    np.testing.assert_array_equal(atoms.cell, orig_cell)
+
+    # max_steps=0 is a single-point calculation
+    single_point = relax_atoms(atoms, EMT(), max_steps=0)
+    assert single_point["n_steps"] == 0
+    assert single_point["energy"] == pytest.approx(frames[0])
+
+
+@pytest.mark.parametrize("n_workers", [1, 2])
+def test_relax_structures(n_workers: int, capsys: pytest.CaptureFixture) -> None:
+    """Test concurrent relaxation yields all structures and skips failures."""
+    structs = make_structs(3)
+    # EMT has no parameters for Si so this structure fails to relax
+    structs.insert(1, bulk("Si", "diamond", a=5.43))
+
+    results = dict(
+        relax_structures(
+            structs, EMT, n_workers=n_workers, max_steps=5, pbar_kwargs=no_pbar
+        )
+    )
+
+    assert sorted(results) == [0, 2, 3]
+    assert "Failed to relax structure 1" in capsys.readouterr().out
+    for idx, result in results.items():
+        expected = relax_atoms(structs[idx], EMT(), max_steps=5)
+        assert result["energy"] == pytest.approx(expected["energy"])
+        assert result["n_steps"] == expected["n_steps"]
+
+    with pytest.raises(ValueError, match="callback is not supported"):
+        next(relax_structures(structs, EMT, n_workers=2, callback=print))
+
+
+@pytest.mark.parametrize("relax_cell", [True, False])
+@pytest.mark.parametrize("batch_size", [None, 3])
+def test_relax_batch_fire_matches_ase(relax_cell: bool, batch_size: int | None) -> None:
+    """Batched FIRE should follow ase.optimize.FIRE step for step."""
+    structs = make_structs(4)
+    frames: dict[int, int] = dict.fromkeys(range(len(structs)), 0)
+
+    def count_frames(idx: int, _atoms: Atoms, _energy: float) -> None:
+        frames[idx] += 1
+
+    results = dict(
+        relax_batch_fire(
+            structs,
+            batch_calculator_from_ase(EMT(), compute_stress=relax_cell),
+            fmax=0.02,
+            relax_cell=relax_cell,
+            batch_size=batch_size,
+            callback=count_frames,
+            pbar_kwargs=no_pbar,
+        )
+    )
+
+    assert sorted(results) == list(range(len(structs)))
+    for idx, atoms in enumerate(structs):
+        expected = relax_atoms(
+            atoms,
+            EMT(),
+            fmax=0.02,
+            cell_filter=UnitCellFilter if relax_cell else None,
+        )
+        result = results[idx]
+        assert result["converged"] == expected["converged"] is True
+        assert result["n_steps"] == expected["n_steps"]
+        assert frames[idx] == result["n_steps"] + 1
+        assert result["energy"] == pytest.approx(expected["energy"], abs=1e-8)
+        np.testing.assert_allclose(
+            result["atoms"].positions, expected["atoms"].positions, atol=1e-8
+        )
+        np.testing.assert_allclose(
+            result["atoms"].cell, expected["atoms"].cell, atol=1e-8
+        )
+        assert result["atoms"].info[Key.mat_id] == f"struct-{idx}"
+        # input structures are not modified
+        assert not np.allclose(atoms.positions, result["atoms"].positions)
+
+
+def test_relax_batch_fire_max_steps_and_errors() -> None:
+    """Structures hitting max_steps drop out unconverged."""
+    structs = make_structs(2)
+    results = dict(
+        relax_batch_fire(
+            structs,
+            batch_calculator_from_ase(EMT()),
+            fmax=1e-6,
+            max_steps=3,
+            pbar_kwargs=no_pbar,
+        )
+    )
+    assert [res["n_steps"] for res in results.values()] == [3, 3]
+    assert not any(res["converged"] for res in results.values())
+
+    with pytest.raises(ValueError, match="must return stresses to relax cell"):
+        next(
+            relax_batch_fire(
+                structs,
+                batch_calculator_from_ase(EMT(), compute_stress=False),
+                pbar_kwargs=no_pbar,
+            )
+        )
+
+    assert list(relax_batch_fire([], batch_calculator_from_ase(EMT()))) == []
+
+
+@pytest.mark.parametrize(
+    "n_frames_offered, max_frames, stride, keep_first, keep_last, expected_steps",
+    [
+        (5, 10, 1, True, True, [0, 1, 2, 3, 4]),  # buffer not full
+        (10, 5, 1, True, True, [0, 7, 8, 9]),  # ring overwrote oldest frames
+        (10, 4, 3, True, True, [0, 6, 9]),  # strided, last frame on stride
+        (11, 4, 3, True, True, [0, 6, 9, 10]),  # last frame off stride
+        (11, 4, 3, False, False, [0, 3, 6, 9]),  # plain strided ring buffer
+        (11, 3, 3, False, True, [6, 9, 10]),
+        (1, 3, 1, True, True, [0]),  # first == last frame
+    ],
+)
+def test_trajectory_recorder(
+    n_frames_offered: int,
+    max_frames: int,
+    stride: int,
+    keep_first: bool,
+    keep_last: bool,
+    expected_steps: list[int],
+) -> None:
+    """Test ring buffer, striding and keep-first/last logic."""
+    n_atoms = 2
+    recorder = TrajectoryRecorder(
+        n_atoms, max_frames, stride=stride, keep_first=keep_first, keep_last=keep_last
+    )
+    for step in range(n_frames_offered):
+        recorder.record(np.full((n_atoms, 3), step), np.eye(3) * step, -float(step))
+
+    frames = recorder.frames()
+    assert recorder.n_frames == len(expected_steps) <= max_frames
+    assert frames["steps"].tolist() == expected_steps
+    assert frames["energies"].dtype == frames["positions"].dtype == np.float32
+    np.testing.assert_array_equal(frames["energies"], -np.array(expected_steps))
+    np.testing.assert_array_equal(frames["positions"][:, 1, 2], expected_steps)
+    np.testing.assert_array_equal(frames["cells"][:, 2, 2], expected_steps)
+
+
+def test_trajectory_recorder_invalid_args() -> None:
+    """Test recorder rejects buffers without room for strided frames."""
+    with pytest.raises(ValueError, match="max_frames=2 must be > 2"):
+        TrajectoryRecorder(1, max_frames=2)
+    with pytest.raises(ValueError, match="stride=0 must be >= 1"):
+        TrajectoryRecorder(1, stride=0)
+
+
+def test_trajectory_side_file(tmp_path: Path) -> None:
+    """Test relaxations record trajectories that round-trip through a side file."""
+    structs = make_structs(2)
+    traj_kwargs = dict(max_frames=8, stride=2)
+    traj_path = f"{tmp_path}/trajectories.bin"
+
+    results = dict(
+        relax_batch_fire(
+            structs,
+            batch_calculator_from_ase(EMT()),
+            fmax=0.02,
+            traj_kwargs=traj_kwargs,
+            pbar_kwargs=no_pbar,
+        )
+    )
+    # same trajectories from relax_atoms() with ASE's optimizer
+    single = relax_atoms(
+        structs[1],
+        EMT(),
+        fmax=0.02,
+        cell_filter=UnitCellFilter,
+        traj_kwargs=traj_kwargs,
+    )
+
+    refs = {idx: results[idx]["trajectory"].write(traj_path) for idx in (0, 1)}
+    assert refs[1]["offset"] > refs[0]["offset"] == 0
+    for idx, ref in refs.items():
+        recorder, result = results[idx]["trajectory"], results[idx]
+        assert ref == {
+            "traj_file": "trajectories.bin",
+            "offset": ref["offset"],
+            "n_frames": recorder.n_frames,
+            "n_atoms": len(structs[idx]),
+        }
+        frames = read_trajectory(ref, root=str(tmp_path))
+        assert frames["steps"][0] == 0
+        assert frames["steps"][-1] == result["n_steps"]
+        assert frames["energies"][-1] == pytest.approx(result["energy"], rel=1e-6)
+        np.testing.assert_allclose(
+            frames["positions"][-1], result["atoms"].positions, atol=1e-5
+        )
+        for key, arr in recorder.frames().items():
+            np.testing.assert_array_equal(frames[key], arr)
+
+    single_frames = single["trajectory"].frames()
+    for key, arr in read_trajectory(refs[1], root=str(tmp_path)).items():
+        np.testing.assert_allclose(arr, single_frames[key], atol=1e-5)
+
+    # 4 bytes per step, energy, 9 cell and 3 * n_atoms position values per frame
+    n_bytes = sum(
+        ref["n_frames"] * 4 * (11 + 3 * ref["n_atoms"]) for ref in refs.values()
+    )
+    assert os.path.getsize(traj_path) == n_bytes
+
+    with open(traj_path, mode="r+b") as file:
+        file.truncate(n_bytes - 4)
+    with pytest.raises(ValueError, match="Truncated trajectory record"):
+        read_trajectory(refs[1], root=str(tmp_path))
+
+    # single-point calculations record one frame
+    single_point = relax_atoms(structs[0], EMT(), max_steps=0, traj_kwargs={})
+    assert single_point["trajectory"].frames()["steps"].tolist() == [0]
+
+
+def test_relax_results_sink(tmp_path: Path) -> None:
+    """Test results are appended in flushed gzip members and survive restarts."""
+    out_path = f"{tmp_path}/task-001.jsonl.gz"
+    struct = Structure(Lattice.cubic(3), ["Cu"], [[0, 0, 0]])
+
+    with RelaxResultsSink(out_path, flush_every=2) as sink:
+        for idx in range(3):
+            sink.write(f"wbm-{idx}", {"energy": np.float64(-idx), "structure": struct})
+            assert f"wbm-{idx}" in sink
+            # flushed after every 2nd record, 3rd record only buffered
+            assert os.path.isfile(out_path) == (idx > 0)
+        assert len(read_relax_results(out_path)) == 2
+    df_out = read_relax_results(out_path)
+    done_ids = ["wbm-0", "wbm-1", "wbm-2"]
+    assert df_out[Key.mat_id].tolist() == done_ids
+    assert df_out["energy"].tolist() == [0, -1, -2]
+    assert Structure.from_dict(df_out["structure"][0]) == struct
+
+    # simulate a job killed while appending a gzip member
+    good_size = os.path.getsize(out_path)
+    with open(out_path, mode="ab") as file:
+        file.write(gzip.compress(b'{"material_id": "wbm-3"}\n')[:-5])
+    assert read_relax_results(out_path)[Key.mat_id].tolist() == done_ids
+
+    # restarting reports done ids and drops the partial member before appending
+    sink = RelaxResultsSink(out_path, flush_secs=0)
+    assert sink.done_ids == set(done_ids)
+    assert os.path.getsize(out_path) == good_size
+    sink.write("wbm-3", {"energy": -3.0})  # flush_secs=0 flushes right away
+    with gzip.open(out_path, mode="rt") as file:
+        assert len(file.readlines()) == 4
+
+    # combine shards from a job array
+    with RelaxResultsSink(f"{tmp_path}/task-002.jsonl.gz") as sink:
+        sink.write("wbm-4", {"energy": -4.0})
+    df_all = glob_to_df(f"{tmp_path}/*.jsonl.gz", reader=read_relax_results)
+    assert sorted(df_all[Key.mat_id]) == [f"wbm-{idx}" for idx in range(5)]
+
+
+def test_read_relax_results_large_members(tmp_path: Path) -> None:
+    """Test gzip members larger than the read chunk size are read back intact."""
+    out_path = f"{tmp_path}/task-001.jsonl.gz"
+    payloads = [os.urandom(100_000).hex() for _ in range(3)]
+    with RelaxResultsSink(out_path, flush_every=1) as sink:
+        for idx, payload in enumerate(payloads):
+            sink.write(f"wbm-{idx}", {"payload": payload})
+    assert os.path.getsize(out_path) > 3 * GZIP_CHUNK_SIZE
+
+    assert read_relax_results(out_path)["payload"].tolist() == payloads
+    assert RelaxResultsSink(out_path).done_ids == {"wbm-0", "wbm-1", "wbm-2"}